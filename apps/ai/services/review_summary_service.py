@@ -10,6 +10,7 @@ from apps.ai.models.game_review_summary import GameReviewSummary
 from apps.ai.pydantics.review_summary import GameSummary
 
 from apps.ai.utils import SAFETY_SETTINGS, is_valid_review_for_ai
+from apps.core.single_flight import MISSING, single_flight
 from apps.game.models.game import Game
 
 from apps.ai.exceptions.ai_exceptions import (
@@ -41,6 +42,9 @@ class ReviewSummaryService:
         self.min_review_length = getattr(settings, "AI_REVIEW_MIN_LENGTH", 10)
         self.min_valid_reviews = getattr(settings, "AI_SUMMARY_MIN_VALID_REVIEWS", 3)
         self.summary_review_count = getattr(settings, "AI_SUMMARY_REVIEW_COUNT", 5)
+        # 요약 생성 락 임대 시간/대기 시간 (초), 생성은 한 요청만 하고 나머지는 기다리거나 기존 요약을 받음
+        self.generation_lease = getattr(settings, "AI_SUMMARY_LOCK_LEASE", 60)
+        self.generation_wait = getattr(settings, "AI_SUMMARY_LOCK_WAIT", 10)
 
         # AI의 페르소나(역할)를 정의
         self.system_instruction = (
@@ -67,7 +71,9 @@ class ReviewSummaryService:
         외부에서 호출하는 요약 조회 메서드
         """
         try:
-            game = Game.objects.select_related("summary").get(id=game_id)
+            game = Game.objects.select_related("summary", "rating_stats").get(
+                id=game_id
+            )
         except Game.DoesNotExist:
             raise GameNotFound()
 
@@ -79,12 +85,29 @@ class ReviewSummaryService:
             return json.loads(summary_obj.text)  # type: ignore
 
         # 3. 요약본이 없거나 갱신이 필요할 때만 리뷰 개수 체크
-        review_count = game.reviews.filter(is_deleted=False).count()
+        stats = getattr(game, "rating_stats", None)
+        review_count = stats.review_count if stats else 0
         if review_count < self.min_review_count:
             raise NotEnoughReviews()
 
-        # 4. 생성 및 저장
-        return self._generate_and_save(game, summary_obj)
+        # 4. 생성 및 저장 (동시에 들어온 요청은 기존 요약을 받거나 생성이 끝나길 기다림)
+        return single_flight(
+            f"ai:review-summary:{game.id}",
+            lambda: self._generate_and_save(game, summary_obj),
+            lookup=lambda: self._get_fresh_summary(game.id),
+            stale=json.loads(summary_obj.text) if summary_obj else MISSING,
+            lease=self.generation_lease,
+            wait=self.generation_wait,
+        )
+
+    def _get_fresh_summary(self, game_id: int) -> dict | None:
+        """
+        다른 요청이 새로 저장한 요약이 있으면 반환 (없거나 갱신이 필요하면 None)
+        """
+        summary_obj = GameReviewSummary.objects.filter(game_id=game_id).first()
+        if summary_obj is None or self._update_and_parse(summary_obj):
+            return None
+        return json.loads(summary_obj.text)
 
     def _update_and_parse(self, summary_obj) -> bool:
         """
@@ -5,6 +5,7 @@ from django.utils import timezone
 from datetime import timedelta
 
 from apps.community.models.reviews import Review
+from apps.game.models.game_rating_stats import GameRatingStats
 from apps.ai.tasks.review_summary import run_ai_summary
 
 
@@ -27,8 +28,13 @@ def trigger_ai_summary(sender, instance, created, **kwargs):
     MIN_COUNT = getattr(settings, "AI_SUMMARY_MIN_REVIEW_COUNT", 10)
     UPDATE_DAYS = getattr(settings, "AI_SUMMARY_UPDATE_INTERVAL_DAYS", 30)
 
-    # 2. 현재 유효 리뷰 개수 확인
-    current_count = game.reviews.filter(is_deleted=False).count()
+    # 2. 현재 유효 리뷰 개수 확인 (리뷰를 세지 않고 게임 리뷰 집계를 읽음)
+    current_count = (
+        GameRatingStats.objects.filter(game_id=game.id)
+        .values_list("review_count", flat=True)
+        .first()
+        or 0
+    )
 
     # 조건1: 리뷰 개수가 기준(10개) 이상인가?
     if current_count >= MIN_COUNT:
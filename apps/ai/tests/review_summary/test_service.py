@@ -1,4 +1,6 @@
+from datetime import timedelta
 from unittest.mock import patch, MagicMock
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils import timezone
 
@@ -157,3 +159,29 @@ class ReviewSummaryServiceTest(TestCase):
         # 2. 정상 리뷰 내용은 있어야 함
         self.assertIn("정말 재미있는 게임입니다.", prompt_text)
         self.assertIn("그래픽이 엄청 훌륭해요.", prompt_text)
+
+    @patch("apps.ai.services.review_summary_service.genai.Client")
+    def test_return_stale_summary_while_generating(self, mock_client_class):
+        """
+        다른 요청이 요약을 생성 중이면 AI를 다시 호출하지 않고 기존(만료된) 요약을 반환
+        """
+        # Given: 30일이 지난 요약과 다른 요청이 잡고 있는 생성 락
+        self.create_reviews(10)
+        summary = GameReviewSummary.objects.create(
+            game=self.game,
+            text='{"good_points": ["Old"], "bad_points": [], "total_review": "Old"}',
+        )
+        GameReviewSummary.objects.filter(id=summary.id).update(
+            updated_at=timezone.now() - timedelta(days=31)
+        )
+        cache.delete(f"single-flight:ai:review-summary:{self.game.id}")
+        cache.add(f"single-flight:ai:review-summary:{self.game.id}", "other")
+        self.addCleanup(cache.clear)
+        mock_instance = mock_client_class.return_value
+
+        # When: 서비스 메서드 호출
+        result = ReviewSummaryService().get_summary(self.game.id)
+
+        # Then: 기존 요약 반환, AI 호출 없음
+        self.assertEqual(result["total_review"], "Old")
+        mock_instance.models.generate_content.assert_not_called()
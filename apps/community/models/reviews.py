@@ -37,3 +37,18 @@ class Review(TimeStampedModel):
         indexes = [
             models.Index(fields=["game", "like_count"], name="idx_reviews_game_best"),
         ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 게임 리뷰 집계(GameRatingStats) 증감 계산용, DB에 저장되어 있던 상태
+        if "rating" in instance.__dict__ and "is_deleted" in instance.__dict__:
+            instance._counted_rating = instance.counted_rating
+        return instance
+
+    @property
+    def counted_rating(self) -> int | None:
+        """
+        집계에 포함되는 별점 (삭제된 리뷰는 None)
+        """
+        return None if self.is_deleted else self.rating
@@ -1,16 +1,24 @@
 from typing import Any
 
+from django.db import transaction
+
 from apps.community.exceptions.review_exceptions import GameNotFound
 from apps.community.models.reviews import Review
+from apps.community.services.review.review_list_service import (
+    bump_review_list_version,
+)
 from apps.game.models.game import Game
+from apps.game.services.detail_cache import bump_game_detail_version
 from apps.user.models.user import User
 
 
+@transaction.atomic
 def create_review(
     *, author: User, game_id: int, validated_data: dict[str, Any]
 ) -> Review:
     """
     리뷰 생성 비즈니스 로직
+    게임 리뷰 집계는 저장 시그널이 같은 트랜잭션 안에서 함께 갱신함
     """
     try:
         game = Game.objects.get(pk=game_id)
@@ -23,5 +31,8 @@ def create_review(
         content=validated_data["content"],
         rating=validated_data["rating"],
     )
+    # 게임 상세의 평균 별점과 리뷰 목록이 바뀌므로 캐시 무효화
+    bump_game_detail_version([game.id])
+    bump_review_list_version(game.id)
 
     return review
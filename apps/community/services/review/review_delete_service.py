@@ -1,11 +1,18 @@
 from django.db import transaction
 from apps.community.models.reviews import Review
+from apps.community.services.review.review_list_service import (
+    bump_review_list_version,
+)
+from apps.game.services.detail_cache import bump_game_detail_version
 
 
 @transaction.atomic
 def delete_review(review: Review) -> None:
     """
     이미 조회/검증된 review 객체를 받아 소프트 삭제(Soft Delete)를 수행
+    게임 리뷰 집계에서도 함께 빠짐 (저장 시그널)
     """
     review.is_deleted = True
     review.save(update_fields=["is_deleted"])
+    bump_game_detail_version([review.game_id])
+    bump_review_list_version(review.game_id)
@@ -1,5 +1,14 @@
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import QuerySet
 from apps.community.models.reviews import Review
+from apps.core.conditional import bump_versions, get_versions
+from apps.core.single_flight import MISSING, single_flight
+
+# 게임별 리뷰 목록 응답 캐시 유지 시간 (좋아요 수는 이 시간만큼 늦게 반영될 수 있음)
+REVIEW_LIST_CACHE_TIMEOUT = getattr(settings, "REVIEW_LIST_CACHE_TIMEOUT", 30)
 
 
 def get_review_list(game_id: int) -> QuerySet[Review]:
@@ -23,3 +32,52 @@ def get_my_review_list(user) -> QuerySet[Review]:
         .select_related("game")
         .order_by("-created_at")
     )
+
+
+def review_list_version_key(game_id: int) -> str:
+    return f"review:list:version:{game_id}"
+
+
+def get_cached_review_list(
+    game_id: int, page_key: str, load: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    게임 리뷰 목록의 한 페이지 응답을 캐시에서 읽고, 없거나 버전이 다르면 load()로 만들어 저장
+    인기 게임의 캐시가 만료된 순간에도 한 요청만 다시 조회함 (single flight)
+    """
+    version_key = review_list_version_key(game_id)
+    cache_key = f"review:list:{game_id}:{page_key}"
+
+    def read() -> tuple[int, dict | None]:
+        return get_versions([version_key])[version_key], cache.get(cache_key)
+
+    version, entry = read()
+    if entry is not None and entry["version"] == version:
+        return entry["data"]
+
+    def compute() -> dict[str, Any]:
+        data = load()
+        cache.set(
+            cache_key, {"version": version, "data": data}, REVIEW_LIST_CACHE_TIMEOUT
+        )
+        return data
+
+    def lookup() -> dict[str, Any] | None:
+        current_version, current = read()
+        if current is not None and current["version"] == current_version:
+            return current["data"]
+        return None
+
+    return single_flight(
+        cache_key,
+        compute,
+        lookup=lookup,
+        stale=entry["data"] if entry is not None else MISSING,
+    )
+
+
+def bump_review_list_version(game_id: int) -> None:
+    """
+    리뷰가 생성/수정/삭제되면 커밋 후 해당 게임의 리뷰 목록 캐시 무효화
+    """
+    bump_versions([review_list_version_key(game_id)])
@@ -1,12 +1,20 @@
 from typing import Any
 
+from django.db import transaction
+
 from apps.community.models.reviews import Review
+from apps.community.services.review.review_list_service import (
+    bump_review_list_version,
+)
+from apps.game.services.detail_cache import bump_game_detail_version
 
 
+@transaction.atomic
 def update_review(*, review: Review, validated_data: dict[str, Any]) -> Review:
     """
     Selector를 통해 검증된 리뷰 객체를 가져와서
     실제 필드 업데이트와 저장을 수행합니다.
+    별점이 바뀌면 게임 리뷰 집계도 같은 트랜잭션 안에서 함께 갱신됩니다.
     """
 
     # 1. 데이터 업데이트
@@ -17,4 +25,9 @@ def update_review(*, review: Review, validated_data: dict[str, Any]) -> Review:
     # 2. 저장
     review.save()
 
+    # 3. 리뷰 목록/게임 상세(평균 별점) 캐시 무효화
+    bump_review_list_version(review.game_id)
+    if "rating" in validated_data:
+        bump_game_detail_version([review.game_id])
+
     return review
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -147,3 +148,46 @@ class GameReviewListAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 0)
         self.assertEqual(len(response.data["results"]), 0)
+
+    def test_get_reviews_cached_until_review_created(self):
+        """
+        같은 페이지 재조회는 캐시에서 응답하고, 리뷰가 등록되면 새 목록을 응답
+        """
+        # Given: 한 번 조회하여 캐시에 저장
+        cache.clear()
+        self.client.get(self.url)
+
+        # When & Then: 재조회 시 DB 조회 없음
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 15)
+
+        # When: 리뷰 등록 API 요청 (커밋 후 캐시 무효화)
+        self.client.force_authenticate(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, {"content": "새 리뷰입니다", "rating": 4})
+
+        # Then: 새 리뷰가 포함된 목록 응답
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 16)
+
+    def test_evicted_version_key_does_not_serve_stale_page(self):
+        """
+        버전 키가 캐시에서 밀려난 뒤 리뷰가 등록되어도 이전 페이지를 다시 응답하지 않음
+        """
+        # Given: 조회 후 리뷰 등록으로 버전을 올리고, 다시 조회하여 새 페이지를 캐시
+        cache.clear()
+        self.client.get(self.url)
+        self.client.force_authenticate(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, {"content": "새 리뷰입니다", "rating": 4})
+        self.assertEqual(self.client.get(self.url).data["count"], 16)
+
+        # When: 버전 키가 밀려난 상태에서 리뷰 등록
+        cache.delete(f"review:list:version:{self.game.id}")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, {"content": "또 다른 리뷰", "rating": 3})
+
+        # Then: 캐시된 16개 페이지가 아닌 새 목록 응답
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 17)
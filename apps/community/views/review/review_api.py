@@ -13,6 +13,7 @@ from apps.community.serializers.review.review_create import ReviewCreateSerializ
 from apps.community.serializers.review.review_list import ReviewListSerializer
 from apps.community.services.review.review_create_service import create_review
 from apps.community.services.review.review_list_service import (
+    get_cached_review_list,
     get_review_list,
     get_my_review_list,
 )
@@ -90,10 +91,19 @@ class ReviewAPIView(APIView, ReviewPaginationMixin):
         # 1. 서비스 레이어를 통해 QuerySet 가져오기
         queryset = get_review_list(game_id=game_id)
 
-        # 2. Mixin의 공통 메서드를 사용하여 응답 반환
-        return self.get_paginated_response(
-            request=request, queryset=queryset, serializer_class=ReviewListSerializer
+        # 2. Mixin의 공통 메서드로 만든 페이지 응답을 캐시 (잘못된 page 등 오류는 캐시하지 않음)
+        def load():
+            return self.get_paginated_response(
+                request=request,
+                queryset=queryset,
+                serializer_class=ReviewListSerializer,
+            ).data
+
+        page_key = "{}:{}".format(
+            request.query_params.get("page", "1"),
+            request.query_params.get("size", ""),
         )
+        return Response(get_cached_review_list(game_id, page_key, load))
 
 
 class MyReviewListAPIView(APIView, ReviewPaginationMixin):
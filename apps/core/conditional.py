@@ -0,0 +1,114 @@
+import time
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+# 버전 키 유지 시간 (만료되면 새 시작 값으로 다시 만들어지므로 한 번씩 캐시를 새로 채움)
+# 요청 URL로 만들어지는 키(게임별 버전 등)가 캐시에 계속 쌓이지 않도록 기한을 둠
+VERSION_KEY_TIMEOUT = getattr(settings, "CACHE_VERSION_KEY_TIMEOUT", 60 * 60 * 24)
+
+
+def new_version_stamp() -> int:
+    """
+    버전 키가 없을 때 쓰는 시작 값 (캐시에서 키가 밀려나도 이전에 준 값과 겹치지 않게 시각 사용)
+    """
+    return time.time_ns() // 1000
+
+
+def get_versions(keys: list[str]) -> dict[str, int]:
+    """
+    버전 키들을 get_many 한 번으로 읽음, 없는 키는 새 시작 값으로 채움
+    """
+    return get_with_versions(keys, [])[0]
+
+
+def get_with_versions(
+    version_keys: list[str], keys: list[str], *, seed: bool = True
+) -> tuple[dict[str, int], dict[str, Any]]:
+    """
+    버전 키들과 그 버전으로 저장한 캐시 값들을 get_many 한 번으로 함께 읽음
+    없는 버전 키는 get_versions와 같이 새 시작 값으로 채움, (버전, 캐시 값)을 반환
+    seed=False면 없는 버전 키를 만들지 않고 결과에서 뺌 (실제로 있는 대상인지 먼저 확인할 때)
+    """
+    cached = cache.get_many([*version_keys, *keys])
+    versions = {key: cached[key] for key in version_keys if key in cached}
+    missing = [key for key in version_keys if key not in versions]
+    if missing and seed:
+        seed_versions(missing, new_version_stamp())
+        versions.update(cache.get_many(missing))
+    return versions, {key: cached[key] for key in keys if key in cached}
+
+
+def seed_versions(keys: Iterable[str], stamp: int) -> None:
+    """
+    없는 버전 키만 stamp로 만듦 (이미 있는 키는 그대로 둠)
+    """
+    for key in keys:
+        cache.add(key, stamp, timeout=VERSION_KEY_TIMEOUT)
+
+
+def incr_version(key: str) -> int:
+    """
+    버전 키를 바로 올리고 새 값을 반환 (없는 키는 새 시작 값으로 설정)
+    """
+    try:
+        return cache.incr(key)
+    except ValueError:
+        stamp = new_version_stamp()
+        cache.set(key, stamp, timeout=VERSION_KEY_TIMEOUT)
+        return stamp
+
+
+def bump_versions(keys: Iterable[str]) -> None:
+    """
+    트랜잭션이 커밋된 뒤 버전 키들을 올림 (없는 키는 새 시작 값으로 설정)
+    """
+    keys = set(keys)
+    if not keys:
+        return
+
+    def bump():
+        for key in keys:
+            incr_version(key)
+
+    transaction.on_commit(bump)
+
+
+def version_etag(*parts: object) -> str:
+    """
+    버전 값으로 만든 약한 ETag (같은 JSON이면 gzip 등 표현이 달라도 같은 것으로 봄)
+    """
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def conditional_get(
+    request: HttpRequest,
+    etag: str,
+    build: Callable[[], HttpResponseBase],
+    *,
+    max_age: int = 0,
+) -> HttpResponseBase:
+    """
+    If-None-Match가 etag와 맞으면 본문 없이 304, 아니면 build()로 응답을 만듦
+    - etag는 본문을 만들기 전에 버전 값만으로 계산하므로 304일 때 조회/직렬화가 없음
+    - 성공 응답과 304 모두 ETag와 Cache-Control(max_age초 뒤 재검증)을 붙임
+    """
+    not_modified = get_conditional_response(request, etag=etag)
+    response: HttpResponseBase
+    if not_modified is not None:
+        response = not_modified
+    else:
+        response = build()
+        if response.status_code != 200:
+            return response
+
+    response.headers["ETag"] = etag
+    if max_age:
+        patch_cache_control(response, public=True, max_age=max_age)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
@@ -0,0 +1,127 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Generic, Protocol, TypeVar
+
+from django.db import DatabaseError, connection
+
+logger = logging.getLogger(__name__)
+
+
+class VersionedIndex(Protocol):
+    """IndexHolder가 보관하는 색인 (버전 비교용 version 속성만 필요)"""
+
+    version: int
+
+
+T = TypeVar("T", bound=VersionedIndex)
+
+
+class IndexHolder(ABC, Generic[T]):
+    """
+    워커 프로세스마다 하나씩 두는 메모리 색인 보관소 (자동완성/패싯/추천 공통)
+    - check_interval초마다 load_version()으로 버전을 확인하고, 바뀌었으면 색인을 다시 만듦
+    - 새 색인은 잠금 없이 만든 뒤 참조만 바꾸므로, 그동안의 요청은 기존 색인으로 바로 응답
+    - 다시 만드는 작업은 한 번에 하나만 실행 (이미 실행 중이면 기다리지 않고 건너뜀)
+    - background=False면 요청 스레드에서 바로 다시 만듦 (테스트용)
+    색인 객체는 version 속성을 가져야 함
+    """
+
+    name = "index"  # 로그에 쓰는 이름
+
+    def __init__(self, check_interval: float = 5.0, background: bool = True):
+        self.check_interval = check_interval
+        self.background = background
+        self._index: T | None = None
+        self._checked_at = 0.0
+        self._rebuild_lock = threading.Lock()
+
+    @abstractmethod
+    def load_version(self) -> int:
+        """공유 캐시에 저장된 현재 버전"""
+
+    @abstractmethod
+    def build(self, version: int) -> T:
+        """DB에서 읽어 version의 색인을 새로 만듦"""
+
+    def update(self, index: T, version: int) -> T | None:
+        """
+        기존 색인에 변경분만 반영한 새 색인 (전체를 다시 만들어야 하면 None)
+        """
+        return None
+
+    def get(self) -> T:
+        index = self._index
+        now = time.monotonic()
+        if index is not None and now - self._checked_at < self.check_interval:
+            return index
+
+        self._checked_at = now
+        version = self.load_version()
+        if index is None:
+            # 응답할 색인이 아직 없으므로 이 요청에서 만듦
+            return self.rebuild(version)
+        if index.version != version:
+            self._schedule_rebuild(version)
+        # 요청 스레드에서 바로 교체되었을 수 있으므로 최신 참조를 다시 읽음
+        current = self._index
+        return current if current is not None else index
+
+    def rebuild(self, version: int | None = None) -> T:
+        """
+        색인을 새로 만들어 교체 (잠금 없이 만든 뒤 마지막에 참조만 바꿈)
+        """
+        if version is None:
+            version = self.load_version()
+        index = self._index
+        if index is None or index.version != version:
+            index = self.build(version)
+            self._index = index
+        return index
+
+    def warm(self) -> None:
+        """
+        워커 시작 시 색인을 미리 만듦 (DB가 준비되지 않았으면 첫 조회 때 만듦)
+        """
+        try:
+            self.rebuild()
+        except DatabaseError:
+            logger.warning("%s warm-up skipped", self.name, exc_info=True)
+
+    def _refresh(self, version: int) -> None:
+        index = self._index
+        if index is not None:
+            updated = self.update(index, version)
+            if updated is not None:
+                self._index = updated
+                return
+        self.rebuild(version)
+
+    def _schedule_rebuild(self, version: int) -> None:
+        # 다른 스레드가 이미 다시 만드는 중이면 기다리지 않고 기존 색인으로 응답
+        if not self._rebuild_lock.acquire(blocking=False):
+            return
+
+        if not self.background:
+            try:
+                self._refresh(version)
+            finally:
+                self._rebuild_lock.release()
+            return
+
+        def run():
+            try:
+                self._refresh(version)
+            except DatabaseError:
+                logger.exception("%s rebuild failed", self.name)
+            finally:
+                self._rebuild_lock.release()
+                # 스레드 전용 DB 연결 정리
+                connection.close()
+
+        try:
+            threading.Thread(target=run, daemon=True).start()
+        except RuntimeError:
+            self._rebuild_lock.release()
+            raise
@@ -0,0 +1,67 @@
+import time
+import uuid
+from typing import Any, Callable, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+T = TypeVar("T")
+
+MISSING: Any = object()  # stale 값이 없음을 나타냄 (None도 정상 값일 수 있으므로)
+
+# 락 임대 시간 (락을 잡은 요청이 죽어도 이 시간이 지나면 다른 요청이 다시 계산)
+SINGLE_FLIGHT_LEASE = getattr(settings, "SINGLE_FLIGHT_LEASE", 10)
+# 락을 못 잡은 요청이 결과를 기다리는 최대 시간 (지나면 직접 계산)
+SINGLE_FLIGHT_WAIT = getattr(settings, "SINGLE_FLIGHT_WAIT", 2.0)
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+
+def single_flight(
+    key: str,
+    compute: Callable[[], T],
+    *,
+    lookup: Callable[[], T | None] | None = None,
+    stale: T = MISSING,
+    lease: float = SINGLE_FLIGHT_LEASE,
+    wait: float = SINGLE_FLIGHT_WAIT,
+    poll_interval: float = SINGLE_FLIGHT_POLL_INTERVAL,
+) -> T:
+    """
+    캐시가 만료된 순간 같은 key를 여러 요청이 동시에 다시 계산하지 않도록 묶음
+    - 캐시 락(cache.add, Redis에서는 SET NX EX)을 잡은 요청 하나만 compute() 실행
+    - 락을 못 잡은 요청은 stale 값이 있으면 바로 반환
+    - 없으면 wait초 동안 lookup()으로 계산 결과가 저장되었는지 확인하며 기다림
+    - 그래도 결과가 없으면(락을 잡은 요청이 실패/지연) 직접 compute() 실행
+    compute()는 결과를 캐시 등에 저장해야 하고, lookup()은 저장된 결과(없으면 None)를 반환
+    """
+    lock_key = f"single-flight:{key}"
+    token = uuid.uuid4().hex
+
+    if cache.add(lock_key, token, timeout=lease):
+        try:
+            # 확인한 직후 다른 요청이 계산을 끝내고 락을 풀었을 수 있으므로 한 번 더 확인
+            if lookup is not None:
+                value = lookup()
+                if value is not None:
+                    return value
+            return compute()
+        finally:
+            # 임대 시간이 지나 다른 요청이 새로 잡은 락은 지우지 않음
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    if stale is not MISSING:
+        return stale
+
+    if lookup is not None:
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            value = lookup()
+            if value is not None:
+                return value
+            if cache.get(lock_key) is None:
+                # 락이 풀렸는데 결과가 없으면 계산이 실패한 것이므로 기다리지 않음
+                break
+
+    return compute()
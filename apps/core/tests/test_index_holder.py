@@ -0,0 +1,73 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from django.test import SimpleTestCase
+
+from apps.core.index_holder import IndexHolder
+
+
+@dataclass
+class Index:
+    version: int
+    incremental: bool = False
+
+
+class FakeHolder(IndexHolder[Index]):
+    def __init__(self, **kwargs):
+        super().__init__(check_interval=0, **kwargs)
+        self.version = 1
+        self.builds = []
+        self.incremental = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def load_version(self):
+        return self.version
+
+    def build(self, version):
+        self.builds.append(version)
+        self.release.wait(5)
+        return Index(version)
+
+    def update(self, index, version):
+        return Index(version, incremental=True) if self.incremental else None
+
+
+class IndexHolderTest(SimpleTestCase):
+    def wait_for(self, holder, version):
+        deadline = time.monotonic() + 5
+        while holder._index.version != version and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(holder._index.version, version)
+
+    def test_only_one_rebuild_runs_at_a_time(self):
+        """다시 만드는 중에 버전이 또 바뀌어도 새로 시작하지 않고 기존 색인으로 응답"""
+        holder = FakeHolder()
+        old = holder.get()
+
+        holder.release.clear()
+        holder.version = 2
+        holder.get()
+        holder.version = 3
+        for _ in range(5):
+            self.assertIs(holder.get(), old)
+        holder.release.set()
+
+        self.wait_for(holder, 2)
+        self.assertEqual(holder.builds, [1, 2])
+
+        # 끝난 뒤 다음 조회에서 밀린 버전으로 다시 만듦
+        holder.get()
+        self.wait_for(holder, 3)
+
+    def test_incremental_update_skips_build(self):
+        holder = FakeHolder(background=False)
+        holder.get()
+        holder.incremental = True
+        holder.version = 2
+
+        index = holder.get()
+
+        self.assertTrue(index.incremental)
+        self.assertEqual(holder.builds, [1])
@@ -0,0 +1,95 @@
+import threading
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from apps.core.single_flight import single_flight
+
+LOCK_KEY = "single-flight:test"
+
+
+class SingleFlightTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_computes_and_releases_lock(self):
+        compute = mock.Mock(return_value="value")
+
+        self.assertEqual(single_flight("test", compute), "value")
+        compute.assert_called_once()
+        self.assertIsNone(cache.get(LOCK_KEY))
+
+    def test_lock_is_released_on_error(self):
+        with self.assertRaises(ValueError):
+            single_flight("test", mock.Mock(side_effect=ValueError))
+
+        self.assertIsNone(cache.get(LOCK_KEY))
+
+    def test_returns_stale_while_locked(self):
+        """다른 요청이 계산 중이면 계산하지 않고 이전 값을 반환"""
+        cache.add(LOCK_KEY, "other")
+        compute = mock.Mock()
+
+        self.assertEqual(single_flight("test", compute, stale="old"), "old")
+        compute.assert_not_called()
+
+    def test_waits_for_result_while_locked(self):
+        """이전 값이 없으면 다른 요청이 저장한 결과를 기다렸다가 반환"""
+        cache.add(LOCK_KEY, "other")
+        compute = mock.Mock()
+        lookup = mock.Mock(side_effect=[None, "fresh"])
+
+        result = single_flight("test", compute, lookup=lookup, poll_interval=0.001)
+
+        self.assertEqual(result, "fresh")
+        compute.assert_not_called()
+
+    def test_computes_after_waiting_too_long(self):
+        cache.add(LOCK_KEY, "other")
+
+        result = single_flight(
+            "test",
+            lambda: "computed",
+            lookup=lambda: None,
+            wait=0.01,
+            poll_interval=0.001,
+        )
+
+        self.assertEqual(result, "computed")
+        # 다른 요청의 락은 건드리지 않음
+        self.assertEqual(cache.get(LOCK_KEY), "other")
+
+    def test_concurrent_requests_compute_once(self):
+        store = {}
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(1)
+            store["value"] = "value"
+            return "value"
+
+        results = []
+
+        def request():
+            results.append(
+                single_flight(
+                    "test", compute, lookup=lambda: store.get("value"), wait=1
+                )
+            )
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        threads[0].start()
+        started.wait(1)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 5)
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class GameConfig(AppConfig):
     name = "apps.game"
+
+    def ready(self):
+        # 게임 카드/자동완성·패싯 색인/추천 행렬/위시리스트 동시 출현/리뷰 집계 갱신,
+        # 상세 캐시·목록 버전 무효화 시그널 등록
+        import apps.game.signals  # noqa
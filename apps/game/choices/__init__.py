@@ -0,0 +1,3 @@
+from .import_job import ImportJobStatus
+
+__all__ = ["ImportJobStatus"]
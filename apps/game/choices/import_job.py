@@ -0,0 +1,8 @@
+from django.db import models
+
+
+class ImportJobStatus(models.TextChoices):
+    PENDING = "pending", "PENDING"
+    RUNNING = "running", "RUNNING"
+    COMPLETED = "completed", "COMPLETED"
+    FAILED = "failed", "FAILED"
@@ -0,0 +1,120 @@
+import math
+import time
+import tracemalloc
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from apps.game.services.fake_rawg import FakeRawgServer
+from apps.game.services.importer import GameImportService
+from apps.game.services.rawg import PAGE_SIZE
+from apps.game.services.translation import FakeTranslationBackend, TranslationCache
+
+BENCHMARK_ID_OFFSET = (
+    10_000_000  # 실제 RAWG 게임과 겹치지 않도록 합성 게임 id에 더하는 값
+)
+
+
+class QueryCounter:
+    """
+    connection.execute_wrapper로 실행된 쿼리 수만 세는 래퍼 (쿼리 내용은 저장하지 않음)
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = "로컬 가짜 RAWG 서버와 가짜 번역기로 게임 임포트 처리량 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--games", type=int, default=200, help="임포트할 게임 수")
+        parser.add_argument(
+            "--chunk-size", type=int, help="한 트랜잭션에서 저장할 게임 수"
+        )
+        parser.add_argument(
+            "--latency", type=float, default=0.0, help="가짜 RAWG 응답 지연(초)"
+        )
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0.0,
+            help="가짜 RAWG가 503을 반환할 확률 (0~1)",
+        )
+        parser.add_argument(
+            "--translation-latency",
+            type=float,
+            default=0.0,
+            help="가짜 번역기의 배치당 지연(초)",
+        )
+        parser.add_argument("--workers", type=int, help="RAWG 수집 스레드 수")
+        parser.add_argument(
+            "--rate-limit",
+            type=float,
+            default=1000.0,
+            help="초당 RAWG 요청 수 제한",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="임포트 결과를 롤백하지 않고 DB에 남김",
+        )
+
+    def handle(self, *args, **options):
+        games = options["games"]
+        server = FakeRawgServer(
+            total_games=games,
+            latency=options["latency"],
+            error_rate=options["error_rate"],
+            id_offset=BENCHMARK_ID_OFFSET,
+        )
+        rawg_settings = {"RAWG_RATE_LIMIT_PER_SECOND": options["rate_limit"]}
+        if options["workers"]:
+            rawg_settings["RAWG_FETCH_MAX_WORKERS"] = options["workers"]
+
+        translation = TranslationCache(
+            backend=FakeTranslationBackend(latency=options["translation_latency"])
+        )
+        service = GameImportService(translation_cache=translation)
+        queries = QueryCounter()
+
+        with server, override_settings(RAWG_BASE_URL=server.url, **rawg_settings):
+            tracemalloc.start()
+            started_at = time.perf_counter()
+
+            with connection.execute_wrapper(queries), transaction.atomic():
+                job = service.create_job(
+                    max_pages=math.ceil(games / PAGE_SIZE),
+                    chunk_size=options["chunk_size"],
+                )
+                service.run_job(job)
+
+                if not options["keep"]:
+                    transaction.set_rollback(True)
+
+            elapsed = time.perf_counter() - started_at
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        created = job.games_created
+        self.stdout.write("")
+        self.stdout.write(self.style.SUCCESS("=== 임포트 벤치마크 결과 ==="))
+        self.stdout.write(f"게임: {job.games_processed}개 처리, {created}개 추가")
+        self.stdout.write(f"소요 시간: {elapsed:.2f}s")
+        self.stdout.write(
+            f"처리량: {created / elapsed if elapsed else 0:.2f} games/sec"
+        )
+        self.stdout.write(
+            f"쿼리: {queries.count}회 ({queries.count / created if created else 0:.2f} queries/game)"
+        )
+        self.stdout.write(f"최대 메모리: {peak_memory / 1024 / 1024:.2f} MB")
+        self.stdout.write(
+            f"가짜 RAWG 요청: {server.requests}회 (503 응답 {server.errors}회)"
+        )
+        self.stdout.write(
+            f"번역: hit {translation.hits}개, miss {translation.misses}개, "
+            f"요청 {translation.backend_calls}회"
+        )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from apps.game.services.similarity import (
+    SIMILAR_BLOCK_SIZE,
+    SIMILAR_NEIGHBORS,
+    build_similar_games,
+)
+
+
+class Command(BaseCommand):
+    help = "태그/장르/플랫폼/소개글 기반 유사 게임(game_neighbors)을 전체 게임 기준으로 다시 계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--block-size",
+            type=int,
+            default=SIMILAR_BLOCK_SIZE,
+            help="한 번에 계산/저장할 게임 수",
+        )
+        parser.add_argument(
+            "--neighbors",
+            type=int,
+            default=SIMILAR_NEIGHBORS,
+            help="게임별로 저장할 유사 게임 수",
+        )
+
+    def handle(self, *args, **options):
+        built = build_similar_games(
+            block_size=options["block_size"], k=options["neighbors"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"게임 {built}개의 유사 게임을 계산했습니다.")
+        )
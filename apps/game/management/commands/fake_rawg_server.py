@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from apps.game.services.fake_rawg import FakeRawgServer
+
+
+class Command(BaseCommand):
+    help = "RAWG API 대신 합성 데이터를 응답하는 로컬 HTTP 서버 실행 (RAWG_BASE_URL에 출력된 주소 지정)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument("--games", type=int, default=200, help="제공할 게임 수")
+        parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+        parser.add_argument(
+            "--error-rate", type=float, default=0.0, help="503을 반환할 확률 (0~1)"
+        )
+
+    def handle(self, *args, **options):
+        server = FakeRawgServer(
+            total_games=options["games"],
+            latency=options["latency"],
+            error_rate=options["error_rate"],
+            host=options["host"],
+            port=options["port"],
+        )
+        self.stdout.write(f"가짜 RAWG 서버 실행 중: {server.url} (Ctrl+C로 종료)")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
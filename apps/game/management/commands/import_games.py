@@ -1,15 +1,118 @@
-from django.core.management.base import BaseCommand
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from apps.game.choices import ImportJobStatus
+from apps.game.models.import_job import ImportJob
 from apps.game.services.importer import GameImportService
 
 
 class Command(BaseCommand):
 
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, help="가져올 RAWG 페이지 수")
+        parser.add_argument(
+            "--chunk-size", type=int, help="한 트랜잭션에서 저장할 게임 수"
+        )
+        parser.add_argument(
+            "--resume",
+            nargs="?",
+            const="latest",
+            help="중단된 작업 이어서 실행 (작업 id 생략 시 가장 최근 미완료 작업)",
+        )
+        parser.add_argument(
+            "--from-file",
+            help="RAWG API 대신 NDJSON/JSON-lines 덤프 파일(.gz 가능)에서 가져오기",
+        )
+        parser.add_argument(
+            "--refresh",
+            action="store_true",
+            help="기존 게임도 content hash를 비교하여 바뀐 게임만 갱신",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="저장하지 않고 추가/변경될 게임 목록만 출력",
+        )
+
     def handle(self, *args, **options):
         self.stdout.write("게임 데이터 가져오기 시작...")
 
         service = GameImportService()
-        count = service.import_games()
+        dry_run = options["dry_run"]
+
+        if options["from_file"]:
+            if options["resume"] or options["pages"]:
+                raise CommandError(
+                    "--from-file은 --resume, --pages와 함께 사용할 수 없습니다."
+                )
+            if not Path(options["from_file"]).is_file():
+                raise CommandError(f"파일을 찾을 수 없습니다: {options['from_file']}")
+
+            processed, created, updated = service.import_from_file(
+                options["from_file"],
+                chunk_size=options["chunk_size"],
+                refresh=options["refresh"],
+                dry_run=dry_run,
+            )
+            self._write_result(processed, created, updated, dry_run)
+            return
+
+        if options["resume"]:
+            if dry_run:
+                raise CommandError("--dry-run은 --resume과 함께 사용할 수 없습니다.")
+
+            job = self._get_resumable_job(options["resume"])
+            self.stdout.write(
+                f"작업 {job.id} 재개 (page {job.cursor_page}, "
+                f"마지막 게임 {job.last_rawg_id})"
+            )
+            service.run_job(job)
+        elif dry_run:
+            # 작업 기록까지 모두 롤백
+            with transaction.atomic():
+                job = service.create_job(
+                    max_pages=options["pages"],
+                    chunk_size=options["chunk_size"],
+                    refresh=options["refresh"],
+                )
+                service.run_job(job, dry_run=True)
+                transaction.set_rollback(True)
+        else:
+            job = service.create_job(
+                max_pages=options["pages"],
+                chunk_size=options["chunk_size"],
+                refresh=options["refresh"],
+            )
+            service.run_job(job)
+
+        self._write_result(
+            job.games_processed, job.games_created, job.games_updated, dry_run
+        )
+
+    def _write_result(self, processed, created, updated, dry_run):
+        if dry_run:
+            self.stdout.write(
+                f"[dry-run] {processed}개 중 {created}개 추가, "
+                f"{updated}개 갱신 예정 (저장하지 않음)"
+            )
+            return
 
         self.stdout.write(
-            self.style.SUCCESS(f"성공! {count}개의 게임이 추가되었습니다.")
+            self.style.SUCCESS(
+                f"성공! {processed}개 중 {created}개의 게임이 추가되고 "
+                f"{updated}개가 갱신되었습니다."
+            )
         )
+
+    def _get_resumable_job(self, resume):
+        jobs = ImportJob.objects.exclude(status=ImportJobStatus.COMPLETED)
+
+        if resume == "latest":
+            job = jobs.order_by("-created_at").first()
+        else:
+            job = jobs.filter(id=resume).first()
+
+        if job is None:
+            raise CommandError("이어서 실행할 임포트 작업이 없습니다.")
+
+        return job
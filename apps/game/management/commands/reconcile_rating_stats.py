@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from apps.game.services.rating_stats import reconcile_rating_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "게임 리뷰 집계(game_rating_stats)를 리뷰 테이블과 비교해 어긋난 값을 바로잡음"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="고치지 않고 어긋난 게임만 출력",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        game_ids = reconcile_rating_stats(dry_run=dry_run)
+
+        for game_id in game_ids:
+            self.stdout.write(f"{'[dry-run] ' if dry_run else ''}game_id={game_id}")
+
+        verb = "발견했습니다" if dry_run else "바로잡았습니다"
+        self.stdout.write(
+            self.style.SUCCESS(f"리뷰 집계가 어긋난 게임 {len(game_ids)}개를 {verb}.")
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from apps.game.services.cooccurrence import reconcile_wishlist_cooccurrence
+
+
+class Command(BaseCommand):
+    help = (
+        "위시리스트 동시 출현 수(wishlist_cooccurrence)를 위시리스트 테이블과 비교해 "
+        "어긋난 쌍을 바로잡음"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="고치지 않고 어긋난 쌍만 출력",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        pairs = reconcile_wishlist_cooccurrence(dry_run=dry_run)
+
+        for game_id, other_game_id in pairs:
+            self.stdout.write(
+                f"{'[dry-run] ' if dry_run else ''}"
+                f"game_id={game_id} other_game_id={other_game_id}"
+            )
+
+        verb = "발견했습니다" if dry_run else "바로잡았습니다"
+        self.stdout.write(
+            self.style.SUCCESS(f"동시 출현 수가 어긋난 쌍 {len(pairs)}개를 {verb}.")
+        )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from apps.game.services.game_card import (
+    CARD_REFRESH_BATCH_SIZE,
+    refresh_all_game_cards,
+)
+
+
+class Command(BaseCommand):
+    help = "목록 API용 게임 카드(game_card)를 전체 게임 기준으로 다시 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=CARD_REFRESH_BATCH_SIZE,
+            help="한 번에 갱신할 게임 수",
+        )
+
+    def handle(self, *args, **options):
+        refreshed = refresh_all_game_cards(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"게임 카드 {refreshed}개를 갱신했습니다.")
+        )
@@ -0,0 +1,42 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0005_rename_id_deleted_game_is_deleted"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationMemory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("source_lang", models.CharField(max_length=10)),
+                ("target_lang", models.CharField(max_length=10)),
+                ("content_hash", models.CharField(max_length=64)),
+                ("source_text", models.TextField()),
+                ("translated_text", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "translation_memory",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("source_lang", "target_lang", "content_hash"),
+                        name="uk_translation_memory_key",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0006_translationmemory"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="rawg_id",
+            field=models.PositiveIntegerField(blank=True, null=True, unique=True),
+        ),
+    ]
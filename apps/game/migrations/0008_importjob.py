@@ -0,0 +1,63 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0007_game_rawg_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "PENDING"),
+                            ("running", "RUNNING"),
+                            ("completed", "COMPLETED"),
+                            ("failed", "FAILED"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "max_pages",
+                    models.PositiveIntegerField(help_text="가져올 RAWG 페이지 수"),
+                ),
+                (
+                    "chunk_size",
+                    models.PositiveIntegerField(
+                        help_text="한 트랜잭션에서 저장할 게임 수"
+                    ),
+                ),
+                ("cursor_page", models.PositiveIntegerField(default=1)),
+                ("last_rawg_id", models.PositiveIntegerField(blank=True, null=True)),
+                ("pages_fetched", models.PositiveIntegerField(default=0)),
+                ("games_processed", models.PositiveIntegerField(default=0)),
+                ("games_created", models.PositiveIntegerField(default=0)),
+                ("error", models.TextField(blank=True, default="")),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "game_import_job",
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0009_importjob_progress"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="games_updated",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="refresh",
+            field=models.BooleanField(
+                default=False,
+                help_text="기존 게임도 비교하여 바뀐 내용을 갱신할지 여부",
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:17
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0010_game_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameCard",
+            fields=[
+                (
+                    "game",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="card",
+                        serialize=False,
+                        to="game.game",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("image_url", models.TextField(blank=True, null=True)),
+                ("released_at", models.DateField(blank=True, null=True)),
+                (
+                    "tags",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        blank=True,
+                        default=list,
+                    ),
+                ),
+                (
+                    "platforms",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        blank=True,
+                        default=list,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "game_card",
+                "indexes": [
+                    models.Index(
+                        fields=["-released_at", "-game"], name="idx_game_card_released"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# 기존 게임의 카드를 한 번에 채움 (이후에는 임포터와 시그널이 갱신)
+BACKFILL_GAME_CARD_SQL = """
+INSERT INTO game_card (game_id, name, image_url, released_at, tags, platforms, updated_at)
+SELECT
+    g.id,
+    g.name,
+    (SELECT i.img_url FROM game_img i WHERE i.game_id = g.id ORDER BY i.id LIMIT 1),
+    g.released_at,
+    COALESCE(
+        (SELECT array_agg(t.tag ORDER BY gt.id)
+         FROM game_tags gt JOIN tag t ON t.id = gt.tag_id
+         WHERE gt.game_id = g.id),
+        '{}'
+    ),
+    COALESCE(
+        (SELECT array_agg(p.platform ORDER BY gp.id)
+         FROM game_platforms gp JOIN platform p ON p.id = gp.platform_id
+         WHERE gp.game_id = g.id),
+        '{}'
+    ),
+    NOW()
+FROM games g
+WHERE NOT g.is_deleted
+ON CONFLICT (game_id) DO NOTHING
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0011_gamecard"),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_GAME_CARD_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:21
+
+import datetime
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0012_backfill_gamecard"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="gamecard",
+            name="idx_game_card_released",
+        ),
+        migrations.AddField(
+            model_name="gamecard",
+            name="released_sort",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.comparison.Coalesce(
+                    "released_at", models.Value(datetime.date(1, 1, 1))
+                ),
+                output_field=models.DateField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamecard",
+            index=models.Index(
+                fields=["-released_sort", "-game"], name="idx_game_card_released"
+            ),
+        ),
+    ]
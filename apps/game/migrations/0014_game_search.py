@@ -0,0 +1,54 @@
+# Generated by Django 6.1.2 on 2026-10-18 09:26
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0013_gamecard_released_sort"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="game",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.SearchVector(
+                            "name", config="simple", weight="A"
+                        ),
+                        "||",
+                        django.contrib.postgres.search.SearchVector(
+                            "developer", "publisher", config="simple", weight="B"
+                        ),
+                        django.contrib.postgres.search.SearchConfig("simple"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "intro", config="simple", weight="C"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="idx_games_search_vector"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="idx_games_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# 기존 리뷰로 게임 리뷰 집계를 한 번에 채움 (이후에는 리뷰 저장 시그널이 증감으로 갱신)
+BACKFILL_RATING_STATS_SQL = """
+INSERT INTO game_rating_stats (
+    game_id, review_count, rating_sum,
+    rating_1, rating_2, rating_3, rating_4, rating_5, updated_at
+)
+SELECT
+    r.game_id,
+    COUNT(*),
+    SUM(r.rating),
+    COUNT(*) FILTER (WHERE r.rating = 1),
+    COUNT(*) FILTER (WHERE r.rating = 2),
+    COUNT(*) FILTER (WHERE r.rating = 3),
+    COUNT(*) FILTER (WHERE r.rating = 4),
+    COUNT(*) FILTER (WHERE r.rating = 5),
+    NOW()
+FROM reviews r
+WHERE NOT r.is_deleted
+GROUP BY r.game_id
+ON CONFLICT (game_id) DO NOTHING
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0015_gameratingstats"),
+        ("community", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_RATING_STATS_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.1.2 on 2026-10-18 10:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0016_backfill_gameratingstats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WishlistCooccurrence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "game",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="wishlist_cooccurrences",
+                        to="game.game",
+                    ),
+                ),
+                (
+                    "other_game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.game",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "wishlist_cooccurrence",
+                "indexes": [
+                    models.Index(
+                        fields=["game", "-count", "other_game"],
+                        name="wishlist_cooccurrence_top_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game", "other_game"), name="uniq_wishlist_cooccurrence"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+# 기존 위시리스트로 동시 출현 수를 한 번에 채움 (이후에는 위시리스트 시그널이 증감으로 갱신)
+BACKFILL_WISHLIST_COOCCURRENCE_SQL = """
+INSERT INTO wishlist_cooccurrence (game_id, other_game_id, count)
+SELECT a.game_id, b.game_id, COUNT(DISTINCT a.user_id)
+FROM wishlist a
+JOIN wishlist b ON b.user_id = a.user_id AND b.game_id <> a.game_id
+GROUP BY a.game_id, b.game_id
+ON CONFLICT (game_id, other_game_id) DO NOTHING
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0017_wishlistcooccurrence"),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_WISHLIST_COOCCURRENCE_SQL, migrations.RunSQL.noop),
+    ]
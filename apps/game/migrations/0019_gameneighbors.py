@@ -0,0 +1,46 @@
+# Generated by Django 6.1.2 on 2026-10-18 10:15
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0018_backfill_wishlistcooccurrence"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameNeighbors",
+            fields=[
+                (
+                    "game",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="neighbors",
+                        serialize=False,
+                        to="game.game",
+                    ),
+                ),
+                (
+                    "neighbor_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(), blank=True, default=list
+                    ),
+                ),
+                (
+                    "scores",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.FloatField(), blank=True, default=list
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "game_neighbors",
+            },
+        ),
+    ]
@@ -6,6 +6,12 @@ from apps.game.models.game_tag import GameTag
 from apps.game.models.platform import Platform
 from apps.game.models.game_platform import GamePlatform
 from apps.game.models.game_img import GameImg
+from apps.game.models.translation_memory import TranslationMemory
+from apps.game.models.import_job import ImportJob
+from apps.game.models.game_card import GameCard
+from apps.game.models.game_rating_stats import GameRatingStats
+from apps.game.models.wishlist_cooccurrence import WishlistCooccurrence
+from apps.game.models.game_neighbors import GameNeighbors
 
 __all__ = [
     "Game",
@@ -16,4 +22,10 @@ __all__ = [
     "Platform",
     "GamePlatform",
     "GameImg",
+    "TranslationMemory",
+    "ImportJob",
+    "GameCard",
+    "GameRatingStats",
+    "WishlistCooccurrence",
+    "GameNeighbors",
 ]
@@ -1,14 +1,38 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 
+SEARCH_CONFIG = (
+    "simple"  # 한국어/영어가 섞여 있어 언어별 형태소 분석 없이 단어 단위로 색인
+)
+
 
 class Game(models.Model):
+    rawg_id = models.PositiveIntegerField(unique=True, null=True, blank=True)
     name = models.CharField(max_length=255)
     intro = models.TextField()
     released_at = models.DateField(null=True, blank=True)
     developer = models.CharField(max_length=255)
     publisher = models.CharField(max_length=255)
+    # 정규화한 RAWG 데이터의 sha256 (재임포트 시 바뀐 게임만 갱신하기 위해 사용)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
     is_deleted = models.BooleanField(default=False)
+    # 검색용 tsvector (이름 > 개발/배급사 > 번역된 소개글 순으로 가중치), DB가 자동 갱신
+    search_vector = models.GeneratedField(
+        expression=SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("developer", "publisher", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("intro", weight="C", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "games"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="idx_games_search_vector"),
+            # 오타 허용 이름 검색(pg_trgm 유사도)과 부분 일치(ILIKE)용
+            GinIndex(
+                fields=["name"], opclasses=["gin_trgm_ops"], name="idx_games_name_trgm"
+            ),
+        ]
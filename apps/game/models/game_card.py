@@ -0,0 +1,41 @@
+from datetime import date
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from apps.game.models.game import Game
+
+RELEASED_SORT_MIN = date(1, 1, 1)
+
+
+class GameCard(models.Model):
+    """
+    목록 API용 게임 카드 테이블 (Game + 대표 이미지/태그/플랫폼 이름을 한 행에 저장)
+    임포터와 시그널이 갱신하며, 목록 API는 이 테이블만 조회함
+    삭제된 게임(is_deleted)은 카드를 두지 않음
+    """
+
+    game = models.OneToOneField(
+        Game, on_delete=models.CASCADE, primary_key=True, related_name="card"
+    )
+    name = models.CharField(max_length=255)
+    image_url = models.TextField(null=True, blank=True)
+    released_at = models.DateField(null=True, blank=True)
+    # 정렬/커서용 출시일 (출시일이 없으면 가장 오래된 날짜로 취급하여 목록 끝에 배치)
+    released_sort = models.GeneratedField(
+        expression=Coalesce("released_at", Value(RELEASED_SORT_MIN)),
+        output_field=models.DateField(),
+        db_persist=True,
+    )
+    tags = ArrayField(models.CharField(max_length=255), default=list, blank=True)
+    platforms = ArrayField(models.CharField(max_length=255), default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "game_card"
+        indexes = [
+            # 목록 정렬 및 (released_sort, game_id) 키셋 페이지네이션용
+            models.Index(
+                fields=["-released_sort", "-game"], name="idx_game_card_released"
+            ),
+        ]
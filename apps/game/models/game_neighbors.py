@@ -0,0 +1,22 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+from apps.game.models.game import Game
+
+
+class GameNeighbors(models.Model):
+    """
+    게임별 내용 기반 유사 게임 (태그/장르/플랫폼 + 소개글 TF-IDF 벡터의 코사인 상위 k개)
+    배치 작업이 미리 계산해 게임당 한 행(배열)으로 저장, 조회는 기본키 한 번
+    """
+
+    game = models.OneToOneField(
+        Game, on_delete=models.CASCADE, primary_key=True, related_name="neighbors"
+    )
+    # 유사도 내림차순, 두 배열의 같은 위치가 한 쌍
+    neighbor_ids = ArrayField(models.IntegerField(), default=list, blank=True)
+    scores = ArrayField(models.FloatField(), default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "game_neighbors"
@@ -0,0 +1,38 @@
+from django.db import models
+from apps.game.models.game import Game
+
+RATING_VALUES = range(1, 6)  # 리뷰 별점 1~5
+
+
+class GameRatingStats(models.Model):
+    """
+    게임별 리뷰 집계 테이블 (삭제되지 않은 리뷰 기준)
+    리뷰가 저장/삭제될 때마다 증감으로 갱신하여 상세/요약 조회 시 리뷰를 다시 세지 않음
+    검색용 tsvector가 있는 games 행을 리뷰마다 다시 쓰지 않도록 별도 테이블로 둠
+    """
+
+    game = models.OneToOneField(
+        Game, on_delete=models.CASCADE, primary_key=True, related_name="rating_stats"
+    )
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    # 별점별 리뷰 수 (히스토그램)
+    rating_1 = models.PositiveIntegerField(default=0)
+    rating_2 = models.PositiveIntegerField(default=0)
+    rating_3 = models.PositiveIntegerField(default=0)
+    rating_4 = models.PositiveIntegerField(default=0)
+    rating_5 = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "game_rating_stats"
+
+    @property
+    def avg_rating(self) -> float:
+        if not self.review_count:
+            return 0
+        return self.rating_sum / self.review_count
+
+    @property
+    def histogram(self) -> dict[int, int]:
+        return {rating: getattr(self, f"rating_{rating}") for rating in RATING_VALUES}
@@ -0,0 +1,45 @@
+from django.db import models
+
+from apps.core.models import TimeStampedModel
+from apps.game.choices import ImportJobStatus
+
+
+class ImportJob(TimeStampedModel):
+    """
+    게임 임포트 작업 저장 테이블
+    청크 단위로 커밋할 때마다 커서(페이지, 마지막 처리한 게임)를 기록하여
+    중단된 작업을 이어서 실행할 수 있게 함
+    """
+
+    status = models.CharField(
+        max_length=20,
+        choices=ImportJobStatus.choices,
+        default=ImportJobStatus.PENDING,
+    )
+    max_pages = models.PositiveIntegerField(help_text="가져올 RAWG 페이지 수")
+    chunk_size = models.PositiveIntegerField(help_text="한 트랜잭션에서 저장할 게임 수")
+    refresh = models.BooleanField(
+        default=False, help_text="기존 게임도 비교하여 바뀐 내용을 갱신할지 여부"
+    )
+
+    # 커서: 처리 중인 페이지와 그 페이지에서 마지막으로 커밋된 게임의 rawg_id
+    cursor_page = models.PositiveIntegerField(default=1)
+    last_rawg_id = models.PositiveIntegerField(null=True, blank=True)
+
+    pages_fetched = models.PositiveIntegerField(default=0)
+    games_processed = models.PositiveIntegerField(default=0)
+    games_created = models.PositiveIntegerField(default=0)
+    games_updated = models.PositiveIntegerField(default=0)
+    relations_written = models.PositiveIntegerField(default=0)
+    translation_cache_hits = models.PositiveIntegerField(default=0)
+    translation_cache_misses = models.PositiveIntegerField(default=0)
+
+    error = models.TextField(blank=True, default="")
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "game_import_job"
+
+    def __str__(self):
+        return f"ImportJob({self.id}) {self.status}"
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class TranslationMemory(models.Model):
+    """
+    번역 결과 저장 테이블 (원문 해시 기준으로 재사용)
+    """
+
+    source_lang = models.CharField(max_length=10)
+    target_lang = models.CharField(max_length=10)
+    content_hash = models.CharField(max_length=64)
+    source_text = models.TextField()
+    translated_text = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "translation_memory"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source_lang", "target_lang", "content_hash"],
+                name="uk_translation_memory_key",
+            )
+        ]
@@ -0,0 +1,35 @@
+from django.db import models
+
+from apps.game.models.game import Game
+
+
+class WishlistCooccurrence(models.Model):
+    """
+    게임 쌍별로 두 게임을 모두 위시리스트에 담은 사용자 수 (동시 출현 행렬)
+    - 위시리스트가 추가/삭제될 때마다 해당 사용자의 다른 게임들과의 쌍만 증감 (전체 재계산 없음)
+    - 양방향(a, b), (b, a)를 모두 저장하여 (game, -count) 인덱스 순서대로 읽으면 바로 상위 k개
+    """
+
+    # game으로 시작하는 유니크 제약/상위 k 인덱스가 있어 단일 FK 인덱스는 두지 않음
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="wishlist_cooccurrences",
+        db_index=False,
+    )
+    other_game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="+")
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "wishlist_cooccurrence"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "other_game"], name="uniq_wishlist_cooccurrence"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["game", "-count", "other_game"],
+                name="wishlist_cooccurrence_top_idx",
+            ),
+        ]
@@ -0,0 +1,163 @@
+import base64
+import binascii
+import json
+from typing import Any, Optional, Protocol
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+# 게임 카드 기본 정렬 (최신 출시일 순, 모두 내림차순)
+GAME_CARD_ORDERING = ("released_sort", "game_id")
+
+
+class KeysetResults(Protocol):
+    """
+    메모리에서 순위를 매긴 결과 (추천 등): position보다 뒤의 상위 limit개를 돌려줌
+    """
+
+    def after(self, position: list[Any] | None, limit: int) -> list[Any]: ...
+
+
+class GamePagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 40
+
+
+class GameCursorPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션
+    - ordering의 필드들로 내림차순 정렬하고, 마지막 행의 값보다 작은 행만 LIMIT으로 조회
+    - COUNT(*)와 OFFSET이 없어 몇 페이지를 넘기든 같은 비용 (ordering에 맞는 인덱스 필요)
+    - 커서는 마지막 행의 정렬 값을 base64로 인코딩한 불투명한 토큰
+    - 쿼리셋 대신 after(position, limit)를 가진 메모리 결과도 받음 (추천 등)
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 40
+    cursor_query_param = "cursor"
+
+    def __init__(self, ordering: tuple[str, ...] = GAME_CARD_ORDERING):
+        self.ordering = ordering
+        self.next_position: list[Any] | None = None
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet[Any] | KeysetResults,
+        request: Request,
+        view: Optional[APIView] = None,
+    ) -> list[Any]:
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request)
+        if isinstance(queryset, QuerySet):
+            queryset = queryset.order_by(*[f"-{field}" for field in self.ordering])
+            if position is not None:
+                try:
+                    queryset = queryset.filter(self.keyset_filter(position))
+                except (DjangoValidationError, TypeError, ValueError):
+                    # 토큰은 디코딩되지만 값의 형식이 맞지 않는 경우
+                    raise ValidationError("cursor가 올바르지 않습니다.")
+
+            # 다음 페이지가 있는지 알기 위해 한 개 더 조회
+            results: list[Any] = list(queryset[: page_size + 1])
+        else:
+            # 메모리에서 순위를 매긴 결과 (RankedGames): position 뒤의 page_size + 1개
+            try:
+                results = queryset.after(position, page_size + 1)
+            except TypeError:
+                raise ValidationError("cursor가 올바르지 않습니다.")
+        has_next = len(results) > page_size
+        results = results[:page_size]
+
+        self.next_position = (
+            [getattr(results[-1], field) for field in self.ordering]
+            if has_next
+            else None
+        )
+        return results
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def keyset_filter(self, position: list[Any]) -> Q:
+        """
+        (f1, f2, ...) < (v1, v2, ...)를 Q로 표현
+        첫 필드에 f1 <= v1 조건을 함께 걸어 인덱스 범위 탐색이 되게 함
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            condition |= equal & Q(**{f"{field}__lt": value})
+            equal &= Q(**{field: value})
+
+        return Q(**{f"{self.ordering[0]}__lte": position[0]}) & condition
+
+    def encode_cursor(self, position: list[Any]) -> str:
+        payload = json.dumps(position, cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request: Request) -> list[Any] | None:
+        """
+        빈 커서(?cursor=)는 첫 페이지, 잘못된 커서는 400
+        """
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+
+        try:
+            position = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        except (ValueError, UnicodeError, binascii.Error):
+            raise ValidationError("cursor가 올바르지 않습니다.")
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise ValidationError("cursor가 올바르지 않습니다.")
+
+        return position
+
+
+def get_game_paginator(
+    request: Request, ordering: tuple[str, ...] = GAME_CARD_ORDERING
+) -> GamePagination | GameCursorPagination:
+    """
+    cursor 파라미터가 있으면(빈 값 포함) 커서 페이지네이션, 없으면 기존 페이지 번호 방식
+    """
+    if GameCursorPagination.cursor_query_param in request.query_params:
+        return GameCursorPagination(ordering=ordering)
+    return GamePagination()
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from apps.game.models import Game, Genre, Tag, Platform, GameImg
+from apps.game.models import Game, GameCard, Genre, Tag, Platform, GameImg
 
 
 class GenreSerializer(serializers.ModelSerializer):
@@ -35,12 +35,15 @@ class GameImageSerializer(serializers.ModelSerializer):
 
 
 class GameListSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
-    tags = serializers.SerializerMethodField()
-    platforms = serializers.SerializerMethodField()
+    """
+    목록 API용 게임 카드 (GameCard 한 행을 그대로 응답, 추가 쿼리 없음)
+    """
+
+    id = serializers.IntegerField(source="game_id", read_only=True)
+    image = serializers.CharField(source="image_url", read_only=True, allow_null=True)
 
     class Meta:
-        model = Game
+        model = GameCard
         fields = [
             "id",
             "name",
@@ -50,19 +53,6 @@ class GameListSerializer(serializers.ModelSerializer):
             "platforms",
         ]
 
-    def get_image(self, obj):
-        first_image = obj.game_images.first()
-        return first_image.img_url
-
-    def get_tags(self, obj):
-        return [game_tag.tag.tag for game_tag in obj.game_tags.all()]
-
-    def get_platforms(self, obj):
-        return [
-            game_platform.platform.platform
-            for game_platform in obj.game_platforms.all()
-        ]
-
 
 class GameDetailSerializer(serializers.ModelSerializer):
     genres = serializers.SerializerMethodField()
@@ -103,4 +93,56 @@ class GameDetailSerializer(serializers.ModelSerializer):
         return [image.img_url for image in obj.game_images.all()]
 
     def get_avg_score(self, obj):
-        return round(obj.avg_score, 1) if obj.avg_score else 0
+        # 리뷰를 다시 집계하지 않고 게임 리뷰 집계(GameRatingStats)를 읽음
+        stats = getattr(obj, "rating_stats", None)
+        return round(stats.avg_rating, 1) if stats and stats.review_count else 0
+
+
+class GameSuggestionSerializer(serializers.Serializer):
+    """
+    자동완성 항목 (type: game / tag / genre)
+    """
+
+    type = serializers.CharField(source="kind")
+    id = serializers.IntegerField()
+    label = serializers.CharField()  # type: ignore
+
+
+class GameFacetSerializer(serializers.Serializer):
+    """
+    패싯 값별 게임 수 (value: slug 또는 연도)
+    """
+
+    value = serializers.CharField()
+    label = serializers.CharField()  # type: ignore
+    count = serializers.IntegerField()
+
+
+BATCH_MAX_IDS = 100  # 한 번에 조회할 수 있는 게임 수
+
+
+class GameBatchQuerySerializer(serializers.Serializer):
+    """
+    여러 게임 조회 요청 (?ids=1,2,3&view=card|detail)
+    """
+
+    ids = serializers.CharField(
+        help_text=f"쉼표로 구분한 게임 id (최대 {BATCH_MAX_IDS}개)"
+    )
+    view = serializers.ChoiceField(choices=["card", "detail"], default="card")
+
+    def validate_ids(self, value):
+        try:
+            ids = [int(game_id) for game_id in value.split(",") if game_id.strip()]
+        except ValueError:
+            raise serializers.ValidationError("ids는 쉼표로 구분한 정수여야 합니다.")
+        if not ids:
+            raise serializers.ValidationError("ids가 비어 있습니다.")
+
+        # 중복은 처음 나온 순서만 유지
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > BATCH_MAX_IDS:
+            raise serializers.ValidationError(
+                f"ids는 최대 {BATCH_MAX_IDS}개까지 요청할 수 있습니다."
+            )
+        return ids
@@ -0,0 +1,61 @@
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.game.models.import_job import ImportJob
+from apps.game.services.rawg import PAGE_SIZE
+
+
+class GameImportRequestSerializer(serializers.Serializer):
+    pages = serializers.IntegerField(min_value=1, required=False)
+    chunk_size = serializers.IntegerField(min_value=1, max_value=200, required=False)
+    refresh = serializers.BooleanField(default=False)
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    job_id = serializers.IntegerField(source="id", read_only=True)
+    elapsed_seconds = serializers.SerializerMethodField()
+    eta_seconds = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            "job_id",
+            "status",
+            "max_pages",
+            "refresh",
+            "cursor_page",
+            "pages_fetched",
+            "games_processed",
+            "games_created",
+            "games_updated",
+            "relations_written",
+            "translation_cache_hits",
+            "translation_cache_misses",
+            "error",
+            "elapsed_seconds",
+            "eta_seconds",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+
+    def get_elapsed_seconds(self, obj):
+        if not obj.started_at:
+            return 0
+        end = obj.finished_at or timezone.now()
+        return round((end - obj.started_at).total_seconds(), 1)
+
+    def get_eta_seconds(self, obj):
+        """
+        처리한 게임 수 대비 예상 전체 게임 수(페이지 수 * 페이지 크기)로 남은 시간 추정
+        """
+        if obj.finished_at:
+            return 0
+
+        expected_games = obj.max_pages * PAGE_SIZE
+        if not obj.games_processed or not expected_games:
+            return None
+
+        progress = min(obj.games_processed / expected_games, 1.0)
+        elapsed = self.get_elapsed_seconds(obj)
+        return round(elapsed * (1 - progress) / progress, 1)
@@ -0,0 +1,154 @@
+from django.db import connection, transaction
+from django.db.models import F
+
+from apps.game.models.wishlist import Wishlist
+from apps.game.models.wishlist_cooccurrence import WishlistCooccurrence
+
+SIMILAR_LIMIT = 10
+SIMILAR_MAX_LIMIT = 30
+
+# 위시리스트 테이블에서 센 게임 쌍별 함께 담은 사용자 수 (마이그레이션 0018 백필과 같은 집계)
+EXPECTED_COOCCURRENCE_SQL = """
+SELECT a.game_id, b.game_id AS other_game_id, COUNT(DISTINCT a.user_id) AS count
+FROM wishlist a
+JOIN wishlist b ON b.user_id = a.user_id AND b.game_id <> a.game_id
+GROUP BY a.game_id, b.game_id
+"""
+
+DRIFTED_PAIRS_SQL = f"""
+WITH expected AS ({EXPECTED_COOCCURRENCE_SQL})
+SELECT COALESCE(e.game_id, s.game_id), COALESCE(e.other_game_id, s.other_game_id)
+FROM expected e
+FULL OUTER JOIN wishlist_cooccurrence s
+    ON s.game_id = e.game_id AND s.other_game_id = e.other_game_id
+WHERE e.count IS DISTINCT FROM s.count
+"""
+
+UPSERT_EXPECTED_SQL = f"""
+WITH expected AS ({EXPECTED_COOCCURRENCE_SQL})
+INSERT INTO wishlist_cooccurrence (game_id, other_game_id, count)
+SELECT e.game_id, e.other_game_id, e.count
+FROM expected e
+LEFT JOIN wishlist_cooccurrence s
+    ON s.game_id = e.game_id AND s.other_game_id = e.other_game_id
+WHERE s.count IS DISTINCT FROM e.count
+ON CONFLICT (game_id, other_game_id) DO UPDATE SET count = EXCLUDED.count
+"""
+
+DELETE_UNEXPECTED_SQL = """
+DELETE FROM wishlist_cooccurrence s
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM wishlist a
+    JOIN wishlist b ON b.user_id = a.user_id
+    WHERE a.game_id = s.game_id AND b.game_id = s.other_game_id
+)
+"""
+
+
+def _other_wishlist_games(user_id: int, game_id: int) -> list[int]:
+    return list(
+        Wishlist.objects.filter(user_id=user_id)
+        .exclude(game_id=game_id)
+        .values_list("game_id", flat=True)
+        .distinct()
+    )
+
+
+def _apply_pair_delta(game_id: int, other_ids: list[int], delta: int) -> None:
+    """
+    game_id와 other_ids 각각의 쌍을 양방향으로 delta만큼 증감
+    행 단위 UPDATE ... SET count = count + n 이라 동시에 저장되어도 값이 유실되지 않음
+    """
+    if not other_ids:
+        return
+
+    if delta > 0:
+        # 쌍 행이 없으면 먼저 만든 뒤 증가
+        WishlistCooccurrence.objects.bulk_create(
+            [
+                WishlistCooccurrence(game_id=a, other_game_id=b)
+                for other_id in other_ids
+                for a, b in ((game_id, other_id), (other_id, game_id))
+            ],
+            ignore_conflicts=True,
+        )
+
+    pairs = WishlistCooccurrence.objects.filter(
+        game_id=game_id, other_game_id__in=other_ids
+    ) | WishlistCooccurrence.objects.filter(
+        game_id__in=other_ids, other_game_id=game_id
+    )
+    if delta < 0:
+        pairs = pairs.filter(count__gte=-delta)
+    pairs.update(count=F("count") + delta)
+
+    if delta < 0:
+        # 아무도 함께 담지 않게 된 쌍은 지움 (상위 k 조회 대상에서 제외)
+        WishlistCooccurrence.objects.filter(game_id=game_id, count=0).delete()
+        WishlistCooccurrence.objects.filter(other_game_id=game_id, count=0).delete()
+
+
+def add_wishlist_game(user_id: int, game_id: int) -> None:
+    """
+    위시리스트 행을 저장한 뒤 호출, 이미 담아 둔 다른 게임들과의 쌍을 1씩 증가
+    같은 게임이 이미 담겨 있었으면(중복 행) 변화 없음
+    """
+    if Wishlist.objects.filter(user_id=user_id, game_id=game_id).count() > 1:
+        return
+    _apply_pair_delta(game_id, _other_wishlist_games(user_id, game_id), 1)
+
+
+def remove_wishlist_game(user_id: int, game_id: int) -> None:
+    """
+    위시리스트 행을 지운 뒤 호출, 남아 있는 다른 게임들과의 쌍을 1씩 감소
+    같은 게임의 행이 아직 남아 있으면(중복 행) 변화 없음
+    """
+    if Wishlist.objects.filter(user_id=user_id, game_id=game_id).exists():
+        return
+    _apply_pair_delta(game_id, _other_wishlist_games(user_id, game_id), -1)
+
+
+def remove_user_wishlist(user_id: int) -> None:
+    """
+    사용자의 위시리스트 전체가 지워질 때(회원 탈퇴) 그 안의 모든 쌍을 1씩 감소 (쿼리 3회)
+    """
+    game_ids = list(
+        Wishlist.objects.filter(user_id=user_id)
+        .values_list("game_id", flat=True)
+        .distinct()
+    )
+    if len(game_ids) < 2:
+        return
+
+    WishlistCooccurrence.objects.filter(
+        game_id__in=game_ids, other_game_id__in=game_ids, count__gt=0
+    ).update(count=F("count") - 1)
+    WishlistCooccurrence.objects.filter(game_id__in=game_ids, count=0).delete()
+
+
+def reconcile_wishlist_cooccurrence(dry_run: bool = False) -> list[tuple[int, int]]:
+    """
+    저장된 동시 출현 수를 위시리스트 테이블과 비교해 어긋난 쌍을 바로잡음
+    같은 사용자가 두 게임을 동시에 담으면 각 트랜잭션이 서로의 행을 보지 못해 쌍이 빠질 수 있음
+    (그 밖에 직접 SQL 수정 등으로 생긴 오차도 복구) 바로잡은 (game_id, other_game_id) 목록을 반환
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(DRIFTED_PAIRS_SQL)
+        pairs = sorted(tuple(row) for row in cursor.fetchall())
+        if pairs and not dry_run:
+            cursor.execute(UPSERT_EXPECTED_SQL)
+            cursor.execute(DELETE_UNEXPECTED_SQL)
+    return pairs
+
+
+def similar_game_ids(game_id: int, limit: int = SIMILAR_LIMIT) -> list[int]:
+    """
+    이 게임을 담은 사용자들이 함께 담은 게임 (함께 담은 사용자 수 -> id 순)
+    (game, -count, other_game) 인덱스를 앞에서부터 limit개만 읽음
+    """
+    return list(
+        WishlistCooccurrence.objects.filter(game_id=game_id)
+        .order_by("-count", "other_game_id")
+        .values_list("other_game_id", flat=True)[:limit]
+    )
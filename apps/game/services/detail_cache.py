@@ -0,0 +1,150 @@
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.conditional import (
+    bump_versions,
+    get_versions,
+    get_with_versions,
+    new_version_stamp,
+    seed_versions,
+)
+from apps.core.single_flight import MISSING, single_flight
+from apps.game.models.game import Game
+
+# 상세 응답 캐시 유지 시간 (버전이 바뀌면 그 전에 무효화됨)
+GAME_DETAIL_CACHE_TIMEOUT = getattr(settings, "GAME_DETAIL_CACHE_TIMEOUT", 60 * 60)
+# 상세 응답은 리뷰 평점이 자주 바뀌므로 기본값 0 (매번 ETag로 재검증)
+GAME_DETAIL_MAX_AGE = getattr(settings, "GAME_DETAIL_MAX_AGE", 0)
+
+
+def detail_cache_key(game_id: int) -> str:
+    return f"game:detail:{game_id}"
+
+
+def detail_version_key(game_id: int) -> str:
+    return f"game:detail:version:{game_id}"
+
+
+def get_cached_game_detail(
+    game_id: int, load: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    직렬화한 게임 상세 응답을 캐시에서 읽고, 없거나 버전이 다르면 load()로 만들어 저장
+    - 버전과 응답을 get_many 한 번으로 함께 읽어 캐시 적중 시 DB/캐시 왕복은 1회
+      (버전 키는 ETag와 같이 apps.core.conditional로만 읽고 올림)
+    - 응답에는 만들 때 읽은 버전을 함께 저장하여, 그 사이 버전이 오르면 다음 조회에서 다시 만듦
+    - 다시 만드는 동안 동시에 들어온 요청은 이전 버전 응답을 받거나 잠시 기다림 (single flight)
+    """
+    version_key = detail_version_key(game_id)
+    cache_key = detail_cache_key(game_id)
+
+    def read() -> tuple[int, dict | None]:
+        versions, cached = get_with_versions([version_key], [cache_key])
+        return versions[version_key], cached.get(cache_key)
+
+    version, entry = read()
+    if entry is not None and entry["version"] == version:
+        return entry["data"]
+
+    def compute() -> dict[str, Any]:
+        data = load()
+        cache.set(
+            cache_key, {"version": version, "data": data}, GAME_DETAIL_CACHE_TIMEOUT
+        )
+        return data
+
+    def lookup() -> dict[str, Any] | None:
+        current_version, current = read()
+        if current is not None and current["version"] == current_version:
+            return current["data"]
+        return None
+
+    return single_flight(
+        cache_key,
+        compute,
+        lookup=lookup,
+        stale=entry["data"] if entry is not None else MISSING,
+    )
+
+
+def get_game_detail_version(game_id: int) -> int | None:
+    """
+    상세 응답 ETag에 쓰는 버전, 게임이 없거나 삭제되었으면 None
+    - 버전 키나 상세 응답이 캐시에 있으면 실제 게임이므로 DB 조회 없이 버전을 읽음
+    - 둘 다 없으면 게임이 있는지 확인한 뒤에만 버전 키를 만듦 (없는 pk로 키가 쌓이지 않게)
+    """
+    version_key = detail_version_key(game_id)
+    cache_key = detail_cache_key(game_id)
+
+    cached = cache.get_many([version_key, cache_key])
+    if version_key in cached:
+        return cached[version_key]
+    if (
+        cache_key not in cached
+        and not Game.objects.filter(pk=game_id, is_deleted=False).exists()
+    ):
+        return None
+    return get_versions([version_key])[version_key]
+
+
+def get_cached_game_details(
+    game_ids: list[int], load_many: Callable[[list[int]], dict[int, dict[str, Any]]]
+) -> dict[int, dict[str, Any]]:
+    """
+    여러 게임의 상세 응답을 한 번에 조회 ({game_id: 응답}, 없는 게임은 제외)
+    - 모든 게임의 버전/응답을 get_many 한 번으로 읽음
+    - 없거나 버전이 다른 게임만 load_many(ids)로 한 번에 만들어 set_many로 저장
+    - 버전 키가 없는 게임은 load_many가 실제로 돌려준 게임만 키를 만듦
+      (요청으로 받은 없는 id로 키가 쌓이지 않게, 시작 값은 조회 전에 정해 그 사이 변경을 놓치지 않음)
+    (여러 게임을 묶어 조회하므로 게임별 single flight는 적용하지 않음)
+    """
+    keys = {}
+    for game_id in game_ids:
+        keys[game_id] = (detail_version_key(game_id), detail_cache_key(game_id))
+    current_versions, cached = get_with_versions(
+        [version_key for version_key, _ in keys.values()],
+        [cache_key for _, cache_key in keys.values()],
+        seed=False,
+    )
+    stamp = new_version_stamp()
+
+    results = {}
+    versions = {}
+    for game_id, (version_key, cache_key) in keys.items():
+        version = current_versions.get(version_key)
+        entry = cached.get(cache_key)
+        if version is not None and entry is not None and entry["version"] == version:
+            results[game_id] = entry["data"]
+        else:
+            versions[game_id] = version if version is not None else stamp
+
+    if versions:
+        loaded = load_many(list(versions))
+        seed_versions(
+            (
+                detail_version_key(game_id)
+                for game_id in loaded
+                if detail_version_key(game_id) not in current_versions
+            ),
+            stamp,
+        )
+        cache.set_many(
+            {
+                detail_cache_key(game_id): {"version": versions[game_id], "data": data}
+                for game_id, data in loaded.items()
+            },
+            GAME_DETAIL_CACHE_TIMEOUT,
+        )
+        results.update(loaded)
+
+    return results
+
+
+def bump_game_detail_version(game_ids: Iterable[int]) -> None:
+    """
+    게임 상세 캐시 무효화 (트랜잭션이 커밋된 뒤 게임별 버전을 올림)
+    버전은 상세 응답의 ETag로도 쓰임
+    """
+    bump_versions(detail_version_key(game_id) for game_id in game_ids)
@@ -0,0 +1,77 @@
+import gzip
+import json
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from apps.game.services.fetcher import SCREENSHOT_LIMIT, GameBundle
+
+logger = logging.getLogger(__name__)
+
+
+def iter_dump_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    RAWG 게임 덤프(NDJSON / JSON-lines, .gz 가능)를 한 줄씩 읽어 게임 dict를 반환
+    - 파일 전체를 메모리에 올리지 않음
+    - 파싱할 수 없거나 id/name이 없는 줄은 경고만 남기고 건너뜀
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"{path}:{line_no} JSON 파싱 실패: {e}")
+                continue
+
+            if not isinstance(record, dict) or not record.get("id"):
+                logger.warning(f"{path}:{line_no} id가 없는 레코드")
+                continue
+            if not record.get("name"):
+                logger.warning(f"{path}:{line_no} name이 없는 레코드")
+                continue
+
+            yield record
+
+
+def to_bundle(record: dict[str, Any]) -> tuple[dict[str, Any], GameBundle]:
+    """
+    덤프 레코드를 RAWG 목록 응답 형태(raw_game)와 GameBundle로 변환
+    - 레코드 자체를 상세 정보로 사용
+    - 스크린샷은 screenshots 또는 short_screenshots(목록 응답 형식)에서 가져옴
+    """
+    raw_game = {
+        "id": record["id"],
+        "name": record["name"],
+        "released": record.get("released"),
+    }
+
+    background_image = record.get("background_image")
+    screenshots = [
+        screenshot
+        for screenshot in (
+            record.get("screenshots") or record.get("short_screenshots") or []
+        )
+        # 목록 응답의 short_screenshots는 첫 항목이 배경 이미지와 같음
+        if screenshot.get("image") and screenshot["image"] != background_image
+    ][:SCREENSHOT_LIMIT]
+
+    return raw_game, GameBundle(
+        rawg_id=record["id"], detail=record, screenshots=screenshots
+    )
+
+
+def batched(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """
+    iterable을 size개씩 끊어서 리스트로 반환 (마지막 묶음은 더 작을 수 있음)
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,325 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.core.conditional import get_versions, incr_version
+from apps.core.index_holder import IndexHolder
+from apps.game.models.game import Game
+from apps.game.models.game_card import RELEASED_SORT_MIN, GameCard
+from apps.game.models.game_genre import GameGenre
+from apps.game.models.game_platform import GamePlatform
+from apps.game.models.game_tag import GameTag
+from apps.game.models.genre import Genre
+from apps.game.models.platform import Platform
+from apps.game.models.tag import Tag
+
+FACETS = ("genre", "platform", "tag", "year")
+FACET_VALUE_LIMIT = 50  # 패싯별로 응답하는 값 수 (게임 수 많은 순)
+
+FACET_VERSION_KEY = "game:facets:version"
+FACET_CHANGES_KEY = "game:facets:changes:{version}"
+FACET_CHANGES_TIMEOUT = 60 * 60 * 24
+MAX_INCREMENTAL_VERSIONS = 100  # 이보다 많이 밀리면 증분 대신 전체 재생성
+
+
+def bit(game_id: int) -> int:
+    return 1 << game_id
+
+
+def iter_bits(bitmap: int) -> Iterable[int]:
+    """
+    비트맵에 들어 있는 game_id를 작은 값부터 반환
+    """
+    while bitmap:
+        low = bitmap & -bitmap
+        yield low.bit_length() - 1
+        bitmap ^= low
+
+
+def release_bucket(released_sort: int) -> int:
+    """
+    정렬용 출시 월 버킷 (출시일 없는 게임은 0으로 목록 끝)
+    """
+    if released_sort <= RELEASED_SORT_MIN.toordinal():
+        return 0
+    released = date.fromordinal(released_sort)
+    return released.year * 12 + released.month
+
+
+@dataclass
+class GameFacets:
+    """
+    게임 한 개의 패싯 값과 정렬 키
+    """
+
+    released_sort: int  # 출시일 ordinal (없으면 RELEASED_SORT_MIN)
+    values: list[tuple[str, str]] = field(default_factory=list)  # (패싯, 값)
+
+
+class FacetIndex:
+    """
+    패싯 값별 game_id 비트맵 (파이썬 int의 i번째 비트 = game_id i)
+    - 필터 결과는 값별 비트맵의 OR(같은 패싯)/AND(다른 패싯), 개수는 int.bit_count()
+    - 패싯별 개수는 그 패싯을 뺀 나머지 필터 결과 기준 (선택한 값 외 다른 값의 개수도 보여줌)
+    - 목록 정렬(최신 출시일 순)은 출시 월 버킷 비트맵으로 페이지 위치까지 건너뛴 뒤
+      해당 버킷 안의 게임만 꺼내 정렬
+    """
+
+    def __init__(self, version: int = 0):
+        self.version = version
+        self.games: dict[int, GameFacets] = {}
+        self.bitmaps: dict[str, dict[str, int]] = {facet: {} for facet in FACETS}
+        self.buckets: dict[int, int] = {}
+        self.all_games = 0
+        self.labels: dict[str, dict[str, str]] = {facet: {} for facet in FACETS}
+
+    def copy(self) -> "FacetIndex":
+        index = FacetIndex(self.version)
+        index.games = dict(self.games)
+        index.bitmaps = {facet: dict(values) for facet, values in self.bitmaps.items()}
+        index.buckets = dict(self.buckets)
+        index.all_games = self.all_games
+        index.labels = {facet: dict(values) for facet, values in self.labels.items()}
+        return index
+
+    def add(self, game_id: int, facets: GameFacets) -> None:
+        game_bit = bit(game_id)
+        self.games[game_id] = facets
+        self.all_games |= game_bit
+        bucket = release_bucket(facets.released_sort)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) | game_bit
+        for facet, value in facets.values:
+            values = self.bitmaps[facet]
+            values[value] = values.get(value, 0) | game_bit
+
+    def remove(self, game_id: int) -> None:
+        facets = self.games.pop(game_id, None)
+        if facets is None:
+            return
+        mask = ~bit(game_id)
+        self.all_games &= mask
+        bucket = release_bucket(facets.released_sort)
+        self.buckets[bucket] &= mask
+        for facet, value in facets.values:
+            self.bitmaps[facet][value] &= mask
+
+    def filter(self, filters: dict[str, list[str]]) -> tuple[int, dict]:
+        """
+        필터 결과 비트맵과 패싯별 {값: 개수}를 반환
+        """
+        selected = {}
+        for facet, values in filters.items():
+            if facet in self.bitmaps and values:
+                bitmap = 0
+                for value in values:
+                    bitmap |= self.bitmaps[facet].get(value, 0)
+                selected[facet] = bitmap
+
+        result = self.all_games
+        for bitmap in selected.values():
+            result &= bitmap
+
+        counts = {}
+        for facet in FACETS:
+            # 이 패싯을 제외한 나머지 필터의 결과
+            base = self.all_games
+            for other, bitmap in selected.items():
+                if other != facet:
+                    base &= bitmap
+            facet_counts = []
+            for value, bitmap in self.bitmaps[facet].items():
+                count = (bitmap & base).bit_count()
+                if count:
+                    facet_counts.append((value, count))
+            facet_counts.sort(key=lambda item: (-item[1], item[0]))
+            counts[facet] = facet_counts[:FACET_VALUE_LIMIT]
+
+        return result, counts
+
+    def page(self, result: int, offset: int, limit: int) -> list[int]:
+        """
+        결과 중 (출시일, id) 내림차순으로 offset부터 limit개의 game_id
+        """
+        game_ids: list[int] = []
+        for bucket in sorted(self.buckets, reverse=True):
+            in_bucket = result & self.buckets[bucket]
+            count = in_bucket.bit_count()
+            if offset >= count:
+                offset -= count
+                continue
+
+            ordered = sorted(
+                iter_bits(in_bucket),
+                key=lambda game_id: (self.games[game_id].released_sort, game_id),
+                reverse=True,
+            )
+            game_ids.extend(ordered[offset : offset + limit - len(game_ids)])
+            offset = 0
+            if len(game_ids) >= limit:
+                break
+
+        return game_ids
+
+
+def load_game_facets(game_ids: list[int] | None = None) -> dict[int, GameFacets]:
+    """
+    게임별 패싯 값을 DB에서 읽음 (game_ids가 없으면 전체, 쿼리 4회)
+    삭제된 게임은 포함하지 않음
+    """
+    games = Game.objects.filter(is_deleted=False)
+    if game_ids is not None:
+        games = games.filter(id__in=game_ids)
+
+    result = {}
+    for game_id, released_at in games.values_list("id", "released_at").iterator(
+        chunk_size=5000
+    ):
+        released = released_at or RELEASED_SORT_MIN
+        result[game_id] = GameFacets(released_sort=released.toordinal())
+        if released_at:
+            result[game_id].values.append(("year", str(released_at.year)))
+
+    for facet, model, path in (
+        ("genre", GameGenre, "genre__slug"),
+        ("platform", GamePlatform, "platform__slug"),
+        ("tag", GameTag, "tag__slug"),
+    ):
+        relations = model.objects.all()
+        if game_ids is not None:
+            relations = relations.filter(game_id__in=game_ids)
+        for game_id, value in relations.values_list("game_id", path).iterator(
+            chunk_size=5000
+        ):
+            if game_id in result:
+                result[game_id].values.append((facet, value))
+
+    return result
+
+
+def load_facet_labels() -> dict[str, dict[str, str]]:
+    """
+    패싯 값(slug)의 표시 이름 (장르/태그는 한국어 이름 우선)
+    """
+    labels: defaultdict[str, dict[str, str]] = defaultdict(dict)
+    for slug, name, name_ko in Genre.objects.values_list("slug", "genre", "genre_ko"):
+        labels["genre"][slug] = name_ko or name
+    for slug, name, name_ko in Tag.objects.values_list("slug", "tag", "tag_ko"):
+        labels["tag"][slug] = name_ko or name
+    for slug, name in Platform.objects.values_list("slug", "platform"):
+        labels["platform"][slug] = name
+    return dict(labels)
+
+
+def build_facet_index(version: int = 0) -> FacetIndex:
+    index = FacetIndex(version)
+    for game_id, facets in load_game_facets().items():
+        index.add(game_id, facets)
+    index.labels.update(load_facet_labels())
+    return index
+
+
+def get_facet_version() -> int:
+    return get_versions([FACET_VERSION_KEY])[FACET_VERSION_KEY]
+
+
+def record_facet_changes(game_ids: Iterable[int]) -> None:
+    """
+    패싯이 바뀐 게임을 커밋 후 변경 로그에 기록하고 버전을 올림
+    각 워커는 밀린 버전의 변경 로그만 읽어 해당 게임의 비트만 다시 계산함
+    """
+    game_ids = sorted(set(game_ids))
+    if not game_ids:
+        return
+
+    def record():
+        version = incr_version(FACET_VERSION_KEY)
+        cache.set(
+            FACET_CHANGES_KEY.format(version=version),
+            game_ids,
+            FACET_CHANGES_TIMEOUT,
+        )
+
+    transaction.on_commit(record)
+
+
+def apply_facet_changes(index: FacetIndex, version: int) -> FacetIndex | None:
+    """
+    index.version 이후의 변경 로그를 적용한 새 색인 (로그가 없거나 너무 많이 밀렸으면 None)
+    """
+    # 버전 키가 캐시에서 밀려나 새 시작 값이 되었으면 건너뛴 변경을 알 수 없음
+    if not 0 < version - index.version <= MAX_INCREMENTAL_VERSIONS:
+        return None
+
+    keys = [
+        FACET_CHANGES_KEY.format(version=v)
+        for v in range(index.version + 1, version + 1)
+    ]
+    changes = cache.get_many(keys)
+    if len(changes) != len(keys):
+        return None
+
+    game_ids = sorted({game_id for ids in changes.values() for game_id in ids})
+    updated = index.copy()
+    updated.version = version
+    loaded = load_game_facets(game_ids)
+    for game_id in game_ids:
+        updated.remove(game_id)
+        if game_id in loaded:
+            updated.add(game_id, loaded[game_id])
+    # 새 태그/장르/플랫폼이 생겼을 수 있으므로 이름도 다시 읽음 (작은 테이블)
+    updated.labels.update(load_facet_labels())
+    return updated
+
+
+class FacetIndexHolder(IndexHolder[FacetIndex]):
+    """
+    워커 프로세스마다 하나씩 두는 패싯 색인 보관소
+    버전이 바뀌면 변경 로그를 증분 적용하고, 로그를 쓸 수 없으면 전체를 다시 만듦
+    (어느 쪽이든 새 색인이 준비될 때까지 기존 색인으로 응답)
+    """
+
+    name = "Facet index"
+
+    def load_version(self) -> int:
+        return get_facet_version()
+
+    def build(self, version: int) -> FacetIndex:
+        return build_facet_index(version)
+
+    def update(self, index: FacetIndex, version: int) -> FacetIndex | None:
+        return apply_facet_changes(index, version)
+
+
+class FacetPage:
+    """
+    패싯 필터 결과를 페이지네이터가 자를 수 있는 시퀀스로 감쌈
+    잘라낸 구간의 게임 카드만 조회 (쿼리 1회)
+    """
+
+    def __init__(self, index: FacetIndex, result: int):
+        self.index = index
+        self.result = result
+        self._count = result.bit_count()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def count(self) -> int:
+        return self._count
+
+    def __getitem__(self, item: slice) -> list[GameCard]:
+        offset = item.start or 0
+        stop = self._count if item.stop is None else min(item.stop, self._count)
+        game_ids = self.index.page(self.result, offset, max(stop - offset, 0))
+        cards = GameCard.objects.in_bulk(game_ids)
+        return [cards[game_id] for game_id in game_ids if game_id in cards]
+
+
+facet_index = FacetIndexHolder(
+    check_interval=getattr(settings, "GAME_FACET_CHECK_INTERVAL", 5.0),
+)
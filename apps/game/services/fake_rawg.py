@@ -0,0 +1,233 @@
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from apps.game.services.rawg import PAGE_SIZE
+
+GENRES = [
+    "action",
+    "adventure",
+    "rpg",
+    "shooter",
+    "strategy",
+    "puzzle",
+    "racing",
+    "sports",
+    "simulation",
+    "platformer",
+    "fighting",
+    "family",
+    "indie",
+    "casual",
+    "arcade",
+]
+PLATFORMS = [
+    "pc",
+    "playstation5",
+    "playstation4",
+    "xbox-series-x",
+    "xbox-one",
+    "nintendo-switch",
+    "ios",
+    "android",
+    "macos",
+    "linux",
+]
+TAG_COUNT = 300  # 합성 태그 종류 수
+TAGS_PER_GAME = 8
+SCREENSHOTS_PER_GAME = 6
+
+GAME_DETAIL_PATH = re.compile(r"^/api/games/(\d+)$")
+GAME_SCREENSHOTS_PATH = re.compile(r"^/api/games/(\d+)/screenshots$")
+
+
+def build_game(rawg_id: int) -> dict[str, Any]:
+    """
+    rawg_id로 항상 같은 내용의 합성 게임 상세 정보를 생성
+    """
+    rng = random.Random(rawg_id)
+    tags = sorted(rng.sample(range(TAG_COUNT), TAGS_PER_GAME))
+
+    return {
+        "id": rawg_id,
+        "slug": f"game-{rawg_id}",
+        "name": f"Synthetic Game {rawg_id}",
+        "released": f"20{rng.randint(0, 24):02d}-{rng.randint(1, 12):02d}-"
+        f"{rng.randint(1, 28):02d}",
+        "description": f"<p>Synthetic description for game {rawg_id}. "
+        + " ".join(f"word{rng.randint(0, 999)}" for _ in range(40))
+        + "</p>",
+        "background_image": f"https://media.fake-rawg.local/{rawg_id}/bg.jpg",
+        "developers": [{"name": f"Developer {rng.randint(1, 500)}"}],
+        "publishers": [{"name": f"Publisher {rng.randint(1, 200)}"}],
+        "genres": [
+            {"slug": slug, "name": slug.title()} for slug in rng.sample(GENRES, 2)
+        ],
+        "tags": [
+            {
+                "slug": f"tag-{tag}",
+                "name": f"Tag {tag}",
+                "games_count": rng.randint(1, 9999),
+            }
+            for tag in tags
+        ],
+        "platforms": [
+            {"platform": {"slug": slug, "name": slug.replace("-", " ").title()}}
+            for slug in rng.sample(PLATFORMS, 3)
+        ],
+    }
+
+
+class FakeRawgServer:
+    """
+    RAWG API 대신 사용하는 로컬 HTTP 서버 (벤치마크/개발용)
+    - /api/games, /api/games/{id}, /api/games/{id}/screenshots에 합성 데이터 응답
+    - latency만큼 응답을 지연시키고, error_rate 확률로 503을 반환 (재시도 경로 측정용)
+    - 게임 id는 id_offset + 1부터 id_offset + total_games까지
+    """
+
+    def __init__(
+        self,
+        total_games: int = 200,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        id_offset: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+    ):
+        self.total_games = total_games
+        self.latency = latency
+        self.error_rate = error_rate
+        self.id_offset = id_offset
+
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "FakeRawgServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeRawgServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(self, path: str, query: dict[str, list[str]]) -> tuple[int, Any]:
+        """
+        요청 경로에 맞는 (상태 코드, 응답 본문) 반환
+        """
+        with self._lock:
+            self.requests += 1
+            fail = self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            return 503, {"detail": "Service temporarily unavailable"}
+
+        if path == "/api/games":
+            return 200, self._games_page(query)
+
+        if match := GAME_DETAIL_PATH.match(path):
+            rawg_id = int(match.group(1))
+            if not self._exists(rawg_id):
+                return 404, {"detail": "Not found."}
+            return 200, build_game(rawg_id)
+
+        if match := GAME_SCREENSHOTS_PATH.match(path):
+            rawg_id = int(match.group(1))
+            if not self._exists(rawg_id):
+                return 404, {"detail": "Not found."}
+            return 200, {
+                "count": SCREENSHOTS_PER_GAME,
+                "results": [
+                    {
+                        "id": rawg_id * 100 + index,
+                        "image": f"https://media.fake-rawg.local/{rawg_id}/{index}.jpg",
+                    }
+                    for index in range(SCREENSHOTS_PER_GAME)
+                ],
+            }
+
+        return 404, {"detail": "Not found."}
+
+    def _exists(self, rawg_id: int) -> bool:
+        return self.id_offset < rawg_id <= self.id_offset + self.total_games
+
+    def _games_page(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        page = int(query.get("page", ["1"])[0])
+        page_size = int(query.get("page_size", [str(PAGE_SIZE)])[0])
+
+        start = (page - 1) * page_size
+        end = min(start + page_size, self.total_games)
+        results = []
+        for index in range(start, end):
+            game = build_game(self.id_offset + index + 1)
+            results.append(
+                {key: game[key] for key in ("id", "slug", "name", "released")}
+            )
+
+        return {
+            "count": self.total_games,
+            "next": (
+                f"{self.url}/games?page={page + 1}&page_size={page_size}"
+                if end < self.total_games
+                else None
+            ),
+            "results": results,
+        }
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 커넥션 재사용
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                status, body = fake.handle(parsed.path, parse_qs(parsed.query))
+
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
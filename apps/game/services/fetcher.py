@@ -0,0 +1,105 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+
+from apps.game.services.rate_limiter import TokenBucket
+from apps.game.services.rawg import RawgClient
+
+SCREENSHOT_LIMIT = 3  # 게임당 저장할 스크린샷 최대 개수
+
+
+@dataclass
+class GameBundle:
+    """
+    게임 한 개에 대해 RAWG에서 가져온 상세 정보와 스크린샷 묶음
+    """
+
+    rawg_id: int
+    detail: dict[str, Any] | None = None
+    screenshots: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+    requests: int = 0
+
+
+@dataclass
+class FetchStats:
+    games: int = 0
+    failed: int = 0
+    requests: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.games / self.elapsed
+
+
+class RawgFetcher:
+    """
+    여러 게임의 상세 정보/스크린샷을 스레드 풀로 동시에 수집
+    모든 요청(재시도 포함)은 클라이언트에 연결한 하나의 토큰 버킷을 공유하여 RAWG 호출 속도를 제한함
+    """
+
+    def __init__(
+        self,
+        client: RawgClient | None = None,
+        max_workers: int | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ):
+        self.client = client or RawgClient()
+        self.max_workers = max_workers or getattr(settings, "RAWG_FETCH_MAX_WORKERS", 8)
+        # 재시도까지 제한되도록 버킷은 클라이언트가 요청을 보낼 때마다 소비함
+        self.rate_limiter = (
+            rate_limiter
+            or self.client.rate_limiter
+            or TokenBucket(rate=getattr(settings, "RAWG_RATE_LIMIT_PER_SECOND", 5.0))
+        )
+        self.client.rate_limiter = self.rate_limiter
+        self.stats = FetchStats()
+
+    def fetch(self, raw_games: list[dict[str, Any]]) -> dict[int, GameBundle]:
+        """
+        RAWG 목록 응답(raw_games)의 게임들을 동시에 수집하여 {rawg_id: GameBundle}로 반환
+        """
+        self.stats = FetchStats()
+        started_at = time.monotonic()
+
+        game_ids = [g["id"] for g in raw_games]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            bundles = list(executor.map(self._fetch_one, game_ids))
+
+        self.stats.elapsed = time.monotonic() - started_at
+        self.stats.games = len(bundles)
+        self.stats.failed = sum(1 for bundle in bundles if bundle.error)
+        self.stats.requests = sum(bundle.requests for bundle in bundles)
+
+        print(
+            f"RAWG 수집 {self.stats.games}개 ({self.stats.failed}개 실패) / "
+            f"{self.stats.elapsed:.2f}s ({self.stats.games_per_second:.2f} games/sec)"
+        )
+
+        return {bundle.rawg_id: bundle for bundle in bundles}
+
+    def _fetch_one(self, game_id: int) -> GameBundle:
+        bundle = GameBundle(rawg_id=game_id)
+
+        try:
+            bundle.requests += 1
+            bundle.detail = self.client.fetch_game_detail(game_id)
+        except Exception as e:
+            bundle.error = str(e)
+            return bundle
+
+        # 스크린샷은 실패해도 상세 정보만으로 저장 진행
+        try:
+            bundle.requests += 1
+            screenshots_data = self.client.fetch_game_screenshots(game_id)
+            bundle.screenshots = screenshots_data.get("results", [])[:SCREENSHOT_LIMIT]
+        except Exception:
+            pass
+
+        return bundle
@@ -0,0 +1,121 @@
+from collections import defaultdict
+from typing import Iterable
+
+from django.conf import settings
+
+from apps.core.conditional import bump_versions
+from apps.game.models.game import Game
+from apps.game.models.game_card import GameCard
+from apps.game.models.game_img import GameImg
+from apps.game.models.game_platform import GamePlatform
+from apps.game.models.game_tag import GameTag
+
+CARD_REFRESH_BATCH_SIZE = 500  # 전체 재생성 시 한 번에 갱신할 게임 수
+
+# 게임 목록(카드) 버전, 카드가 바뀔 때마다 올라가며 목록 응답의 ETag로 사용
+GAME_LIST_VERSION_KEY = "game:list:version"
+# 목록 응답을 클라이언트가 재검증 없이 쓸 수 있는 시간 (초)
+GAME_LIST_MAX_AGE = getattr(settings, "GAME_LIST_MAX_AGE", 60)
+
+
+def bump_game_list_version() -> None:
+    bump_versions([GAME_LIST_VERSION_KEY])
+
+
+def refresh_game_cards(game_ids: Iterable[int]) -> int:
+    """
+    주어진 게임들의 카드를 다시 만들어 저장 (게임 수와 관계없이 쿼리 5회)
+    삭제되었거나 없는 게임의 카드는 지움, 갱신한 카드 수를 반환
+    """
+    game_ids = list(set(game_ids))
+    if not game_ids:
+        return 0
+
+    bump_game_list_version()
+
+    games = list(
+        Game.objects.filter(id__in=game_ids, is_deleted=False).values(
+            "id", "name", "released_at"
+        )
+    )
+    visible_ids = [game["id"] for game in games]
+
+    GameCard.objects.filter(game_id__in=game_ids).exclude(
+        game_id__in=visible_ids
+    ).delete()
+    if not games:
+        return 0
+
+    # 관계는 id 순서(저장된 순서)대로 모음
+    tags = defaultdict(list)
+    for game_id, tag in (
+        GameTag.objects.filter(game_id__in=visible_ids)
+        .order_by("id")
+        .values_list("game_id", "tag__tag")
+    ):
+        tags[game_id].append(tag)
+
+    platforms = defaultdict(list)
+    for game_id, platform in (
+        GamePlatform.objects.filter(game_id__in=visible_ids)
+        .order_by("id")
+        .values_list("game_id", "platform__platform")
+    ):
+        platforms[game_id].append(platform)
+
+    # 게임별 첫 번째 이미지만 조회
+    images = dict(
+        GameImg.objects.filter(game_id__in=visible_ids)
+        .order_by("game_id", "id")
+        .distinct("game_id")
+        .values_list("game_id", "img_url")
+    )
+
+    GameCard.objects.bulk_create(
+        [
+            GameCard(
+                game_id=game["id"],
+                name=game["name"],
+                released_at=game["released_at"],
+                image_url=images.get(game["id"]),
+                tags=tags[game["id"]],
+                platforms=platforms[game["id"]],
+            )
+            for game in games
+        ],
+        update_conflicts=True,
+        unique_fields=["game"],
+        update_fields=[
+            "name",
+            "released_at",
+            "image_url",
+            "tags",
+            "platforms",
+            "updated_at",
+        ],
+    )
+
+    return len(games)
+
+
+def refresh_all_game_cards(batch_size: int = CARD_REFRESH_BATCH_SIZE) -> int:
+    """
+    모든 게임의 카드를 batch_size개씩 다시 만듦 (최초 적재/복구용)
+    """
+    refreshed = 0
+    last_id = 0
+
+    while True:
+        game_ids = list(
+            Game.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not game_ids:
+            break
+
+        refreshed += refresh_game_cards(game_ids)
+        last_id = game_ids[-1]
+
+    # 게임 자체가 지워진 카드는 CASCADE로 함께 삭제되므로 따로 정리하지 않음
+    return refreshed
@@ -1,7 +1,9 @@
+from dataclasses import dataclass
 from datetime import datetime
-import time
+from django.conf import settings
 from django.db import transaction
-from deep_translator import GoogleTranslator  # type: ignore
+from django.utils import timezone
+from apps.game.choices import ImportJobStatus
 from apps.game.models.game import Game
 from apps.game.models.genre import Genre
 from apps.game.models.game_genre import GameGenre
@@ -10,211 +12,650 @@ from apps.game.models.game_tag import GameTag
 from apps.game.models.platform import Platform
 from apps.game.models.game_platform import GamePlatform
 from apps.game.models.game_img import GameImg
-from apps.game.services.rawg import RawgClient
+from apps.game.models.import_job import ImportJob
+from apps.game.services.detail_cache import bump_game_detail_version
+from apps.game.services.dump_source import batched, iter_dump_records, to_bundle
+from apps.game.services.facets import record_facet_changes
+from apps.game.services.fetcher import RawgFetcher
+from apps.game.services.game_card import refresh_game_cards
+from apps.game.services.normalize import content_hash, normalize_game
+from apps.game.services.rawg import MAX_PAGE, RawgClient
+from apps.game.services.recommend import bump_recommend_version
+from apps.game.services.translation import TranslationCache
+from apps.game.services.taxonomy import bump_taxonomy_version
+from apps.game.services.typeahead import bump_typeahead_version
+
+DEFAULT_CHUNK_SIZE = 20  # 한 트랜잭션에서 저장할 게임 수
+FILE_CHUNK_SIZE = 500  # 덤프 파일 임포트 시 한 트랜잭션에서 저장할 게임 수
+
+
+@dataclass
+class ChunkChanges:
+    """
+    트랜잭션을 열기 전에 준비한 청크의 변경 내용 (상세 조회/정규화/번역까지 끝난 상태)
+    """
+
+    new_raw_games: list
+    bundles: dict  # {rawg_id: GameBundle}
+    normalized: dict  # {rawg_id: 정규화 데이터 또는 None}, 새 게임만
+    changed: list  # (Game, 정규화 데이터, 해시), 내용이 바뀐 기존 게임
+    translations: dict[str, str]  # {원문: 번역문}, 소개글과 새 장르/태그 이름
 
 
 class GameImportService:
-    def __init__(self):
-        self.translator = GoogleTranslator(source="en", target="ko")
-
-    @transaction.atomic
-    def import_games(self):
-        raw_games = RawgClient().fetch_games()
+    def __init__(self, translation_cache: TranslationCache | None = None):
+        self.translation = translation_cache or TranslationCache()
+        self._dimension_ids: dict[type, dict[str, int]] = {}
+
+    def import_games(self, max_pages=None, chunk_size=None, refresh=False):
+        """
+        새 임포트 작업을 만들어 실행하고, 추가된 게임 수를 반환
+        """
+        job = self.create_job(
+            max_pages=max_pages, chunk_size=chunk_size, refresh=refresh
+        )
+        self.run_job(job)
+        return job.games_created
+
+    @staticmethod
+    def create_job(max_pages=None, chunk_size=None, refresh=False):
+        return ImportJob.objects.create(
+            max_pages=max_pages or MAX_PAGE,
+            chunk_size=chunk_size
+            or getattr(settings, "GAME_IMPORT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE),
+            refresh=refresh,
+        )
+
+    def run_job(self, job, dry_run=False):
+        """
+        작업의 커서부터 RAWG 페이지를 순회하며 chunk_size개씩 커밋
+        - 상세 조회/번역은 트랜잭션 밖에서 먼저 끝내고, 트랜잭션은 저장과 커서 갱신만 감쌈
+        - 중간에 실패하면 마지막으로 커밋된 청크 다음부터 다시 실행 가능
+        - job.refresh면 기존 게임도 content_hash를 비교하여 바뀐 게임만 갱신
+        - dry_run이면 게임 데이터는 저장하지 않고 변경 목록만 출력
+        """
         client = RawgClient()
-        games = []
-        game_genres_data = []
-        game_tags_data = []
-        game_platforms_data = []
-        game_images_data = []
 
-        for g in raw_games:
-            if Game.objects.filter(name=g["name"]).exists():
-                continue
-
-            try:
-                detail = client.fetch_game_detail(g["id"])
-
-                developer = "Unknown"
-                if detail.get("developers") and len(detail["developers"]) > 0:
-                    developer = detail["developers"][0]["name"]
-
-                publisher = "Unknown"
-                if detail.get("publishers") and len(detail["publishers"]) > 0:
-                    publisher = detail["publishers"][0]["name"]
-
-                intro = detail.get("description", "") or ""
-
-                intro_ko = ""
-                if intro:
-                    try:
-                        text_to_translate = intro[:500]
-                        intro_ko = self.translator.translate(text_to_translate)
-                        time.sleep(0.5)
-                    except Exception:
-                        intro_ko = intro[:500]
-
-                genres_info = detail.get("genres", [])
-
-                tags_info = detail.get("tags", [])
-
-                platforms_info = detail.get("platforms", [])
-
-                images_info = []
-
-                if detail.get("background_image"):
-                    images_info.append(detail["background_image"])
-
-                try:
-                    screenshots_data = client.fetch_game_screenshots(g["id"])
-                    screenshots = screenshots_data.get("results", [])
-                    for screenshot in screenshots[:3]:
-                        if screenshot.get("image"):
-                            images_info.append(screenshot["image"])
-                    time.sleep(0.5)
-                except Exception:
-                    pass
-
-                time.sleep(0.5)
-
-            except Exception as e:
-                print(f"오류 발생: {g['name']} - {e}")
-                developer = "Unknown"
-                publisher = "Unknown"
-                intro_ko = ""
-                genres_info = []
-                tags_info = []
-                platforms_info = []
-                images_info = []
-
-            released_at = None
-            if g.get("released"):
-                try:
-                    released_at = datetime.strptime(g["released"], "%Y-%m-%d").date()
-                except ValueError:
-                    pass
-
-            games.append(
-                Game(
-                    name=g["name"],
-                    intro=intro_ko,
-                    released_at=released_at,
-                    developer=developer,
-                    publisher=publisher,
+        job.status = ImportJobStatus.RUNNING
+        job.error = ""
+        job.started_at = job.started_at or timezone.now()
+        job.save(update_fields=["status", "error", "started_at", "updated_at"])
+
+        try:
+            page = job.cursor_page
+            while page <= job.max_pages:
+                data = client.fetch_games_page(page)
+                job.pages_fetched += 1
+                raw_games = self._skip_processed(
+                    data.get("results", []), job.last_rawg_id
                 )
-            )
 
-            game_genres_data.append({"game_name": g["name"], "genres": genres_info})
+                for start in range(0, len(raw_games), job.chunk_size):
+                    chunk = raw_games[start : start + job.chunk_size]
 
-            game_tags_data.append({"game_name": g["name"], "tags": tags_info})
+                    hits, misses = self.translation.hits, self.translation.misses
+                    changes = self.prepare_chunk(
+                        client, chunk, refresh=job.refresh, dry_run=dry_run
+                    )
 
-            game_platforms_data.append(
-                {"game_name": g["name"], "platforms": platforms_info}
+                    with transaction.atomic():
+                        created, updated, relations = self.write_changes(
+                            changes, dry_run=dry_run
+                        )
+
+                        job.last_rawg_id = chunk[-1]["id"]
+                        job.games_processed += len(chunk)
+                        job.games_created += created
+                        job.games_updated += updated
+                        job.relations_written += relations
+                        job.translation_cache_hits += self.translation.hits - hits
+                        job.translation_cache_misses += self.translation.misses - misses
+                        job.save()
+
+                    print(
+                        f"[ImportJob {job.id}] page {page}: "
+                        f"{job.games_processed}개 처리, {job.games_created}개 추가, "
+                        f"{job.games_updated}개 갱신"
+                    )
+
+                # 페이지를 모두 처리했으면 커서를 다음 페이지로 이동
+                page += 1
+                job.cursor_page = page
+                job.last_rawg_id = None
+                job.save()
+
+                if not data.get("next"):
+                    break
+
+        except Exception as e:
+            # 롤백된 청크에서 만든 slug가 남아있지 않도록 캐시 초기화
+            self._dimension_ids.clear()
+            job.status = ImportJobStatus.FAILED
+            job.error = str(e)
+            job.save(update_fields=["status", "error", "updated_at"])
+            raise
+
+        job.status = ImportJobStatus.COMPLETED
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "finished_at", "updated_at"])
+
+        for endpoint, stat in client.get_stats().items():
+            print(
+                f"RAWG {endpoint}: 요청 {stat['requests']}회, 재시도 {stat['retries']}회, "
+                f"실패 {stat['failures']}회, 평균 {stat['avg_latency']:.3f}s"
             )
+        print(
+            f"번역 캐시 hit {self.translation.hits}개, miss {self.translation.misses}개 "
+            f"(번역 요청 {self.translation.backend_calls}회)"
+        )
+
+        return job
+
+    def _skip_processed(self, raw_games, last_rawg_id):
+        """
+        재개한 페이지에서 이미 커밋된 게임(last_rawg_id까지)은 건너뜀
+        """
+        if last_rawg_id is None:
+            return raw_games
+
+        for index, g in enumerate(raw_games):
+            if g["id"] == last_rawg_id:
+                return raw_games[index + 1 :]
+
+        # 페이지 내용이 바뀌어 커서를 찾을 수 없으면 전체를 다시 처리 (rawg_id로 중복 방지)
+        return raw_games
+
+    def import_from_file(self, path, chunk_size=None, refresh=False, dry_run=False):
+        """
+        RAWG 덤프 파일(NDJSON / JSON-lines)을 스트리밍으로 읽어 chunk_size개씩 커밋
+        - RAWG API를 호출하지 않고, 레코드를 상세 정보로 그대로 사용
+        - 한 번에 한 청크만 메모리에 올림
+        (처리한 레코드 수, 추가된 게임 수, 갱신된 게임 수)를 반환
+        """
+        chunk_size = chunk_size or FILE_CHUNK_SIZE
+        processed = 0
+        created = 0
+        updated = 0
+
+        try:
+            for records in batched(iter_dump_records(path), chunk_size):
+                chunk_created, chunk_updated, _ = self.import_records(
+                    records, refresh=refresh, dry_run=dry_run
+                )
+
+                processed += len(records)
+                created += chunk_created
+                updated += chunk_updated
+                print(
+                    f"[{path}] {processed}개 처리, {created}개 추가, {updated}개 갱신"
+                )
+        except Exception:
+            # 롤백된 청크에서 만든 slug가 남아있지 않도록 캐시 초기화
+            self._dimension_ids.clear()
+            raise
+
+        print(
+            f"번역 캐시 hit {self.translation.hits}개, miss {self.translation.misses}개 "
+            f"(번역 요청 {self.translation.backend_calls}회)"
+        )
+
+        return processed, created, updated
+
+    def prepare_chunk(self, client, raw_games, refresh=False, dry_run=False):
+        """
+        RAWG 목록 응답 일부의 상세 정보/스크린샷을 수집하고 저장할 변경 내용을 준비
+        네트워크 호출은 모두 여기서 끝내므로 트랜잭션 밖에서 호출
+        """
+        new_raw_games, existing = self._split_games(raw_games, refresh, dry_run)
+
+        # 상세 정보/스크린샷은 스레드 풀로 한 번에 수집
+        bundles = RawgFetcher(client).fetch(
+            new_raw_games + [raw_game for raw_game, _ in existing.values()]
+        )
+
+        return self._prepare_changes(new_raw_games, existing, bundles, dry_run)
+
+    def import_records(self, records, refresh=False, dry_run=False):
+        """
+        덤프 레코드 일부를 받아 새 게임을 저장하고, refresh면 바뀐 게임도 갱신
+        번역은 트랜잭션 밖에서 먼저 끝내고 저장만 한 트랜잭션으로 묶음
+        (추가된 게임 수, 갱신된 게임 수, 저장한 관계 수)를 반환
+        """
+        raw_games = []
+        bundles = {}
+        for record in records:
+            raw_game, bundle = to_bundle(record)
+            raw_games.append(raw_game)
+            bundles[bundle.rawg_id] = bundle
+
+        new_raw_games, existing = self._split_games(raw_games, refresh, dry_run)
+        changes = self._prepare_changes(new_raw_games, existing, bundles, dry_run)
+
+        with transaction.atomic():
+            return self.write_changes(changes, dry_run=dry_run)
+
+    def _prepare_changes(self, new_raw_games, existing, bundles, dry_run):
+        """
+        새 게임을 정규화하고, 기존 게임은 저장된 content_hash와 비교하여 바뀐 게임만 골라냄
+        저장할 소개글과 DB에 없는 장르/태그 이름은 미리 번역 (dry_run이면 번역하지 않음)
+        """
+        normalized = {
+            g["id"]: normalize_game(g, bundles[g["id"]]) for g in new_raw_games
+        }
+
+        changed = []
+        for rawg_id, (raw_game, game) in existing.items():
+            data = normalize_game(raw_game, bundles[rawg_id])
+            if data is None:
+                # 상세 조회에 실패하면 기존 데이터를 그대로 둠
+                continue
+
+            data_hash = content_hash(data)
+            if data_hash != game.content_hash:
+                changed.append((game, data, data_hash))
+
+        translations = {}
+        if not dry_run:
+            games_data = [data for data in normalized.values() if data is not None]
+            games_data += [data for _, data, _ in changed]
+            texts = [data["intro"] for data in games_data]
+            for model, key in ((Genre, "genres"), (Tag, "tags")):
+                texts += self._unknown_dimension_names(
+                    model,
+                    {
+                        info["slug"]: info["name"]
+                        for data in games_data
+                        for info in data[key]
+                    },
+                )
+            translations = self.translation.translate_many(texts)
+
+        return ChunkChanges(new_raw_games, bundles, normalized, changed, translations)
+
+    def write_changes(self, changes, dry_run=False):
+        """
+        준비한 변경 내용을 저장 (네트워크 호출 없음, 호출하는 쪽에서 트랜잭션으로 감쌈)
+        dry_run이면 변경 목록만 출력하고 아무것도 저장하지 않음
+        (추가된 게임 수, 갱신된 게임 수, 저장한 관계 수)를 반환
+        """
+        if dry_run:
+            self._print_change_set(changes.new_raw_games, changes.changed)
+            return len(changes.new_raw_games), len(changes.changed), 0
+
+        created, relations = self.write_games(
+            changes.new_raw_games,
+            changes.bundles,
+            changes.normalized,
+            changes.translations,
+        )
+        updated, updated_relations = self.update_games(
+            changes.changed, changes.translations
+        )
+
+        return created, updated, relations + updated_relations
+
+    def write_games(self, new_raw_games, bundles, normalized, translations):
+        """
+        새 게임 목록과 {rawg_id: GameBundle}을 Game 및 관계 테이블에 저장
+        normalized/translations는 _prepare_changes에서 만든 정규화 데이터와 번역문
+        (추가된 게임 수, 저장한 관계 수)를 반환
+        """
+        games = []
+        games_data = []
+        for g in new_raw_games:
+            data = normalized[g["id"]]
+
+            if data is not None:
+                game = Game(
+                    rawg_id=g["id"],
+                    content_hash=content_hash(data),
+                    **self._game_fields(data, translations),
+                )
+            else:
+                # 해시를 비워두어 다음 refresh 때 다시 채워지게 함
+                print(f"오류 발생: {g['name']} - {bundles[g['id']].error}")
+                game = Game(
+                    rawg_id=g["id"],
+                    name=g["name"],
+                    intro="",
+                    released_at=self._parse_released(g.get("released")),
+                    developer="Unknown",
+                    publisher="Unknown",
+                )
 
-            game_images_data.append({"game_name": g["name"], "images": images_info})
+            games.append(game)
+            games_data.append((game, data))
 
         Game.objects.bulk_create(games)
         print(f"\n{len(games)}개의 새로운 게임이 추가되었습니다.")
-        self.import_genres(game_genres_data)
-        self.import_tags(game_tags_data)
-        self.import_platforms(game_platforms_data)
-        self.import_images(game_images_data)
 
-        return len(games)
+        relations = self._write_relations(games_data, translations)
+        # bulk 작업은 시그널이 발생하지 않으므로 목록용 카드를 직접 갱신
+        refresh_game_cards(game.pk for game in games)
+        bump_typeahead_version()
+        record_facet_changes(game.pk for game in games)
+        bump_recommend_version()
 
-    def import_genres(self, game_genres_data):
+        return len(games), relations
+
+    def update_games(self, changed, translations):
+        """
+        내용이 바뀐 게임의 필드를 갱신하고 장르/태그/플랫폼/이미지 관계를 다시 저장
+        changed는 (Game, 정규화 데이터, 해시) 목록, (갱신된 게임 수, 저장한 관계 수)를 반환
+        """
+        if not changed:
+            return 0, 0
+
+        games = []
+        for game, data, data_hash in changed:
+            for field, value in self._game_fields(data, translations).items():
+                setattr(game, field, value)
+            game.content_hash = data_hash
+            games.append(game)
+
+        Game.objects.bulk_update(
+            games,
+            ["name", "intro", "released_at", "developer", "publisher", "content_hash"],
+        )
+
+        # 바뀐 게임의 관계만 지우고 새로 저장
+        game_ids = [game.pk for game in games]
+        for model in (GameGenre, GameTag, GamePlatform, GameImg):
+            model.objects.filter(game_id__in=game_ids).delete()
+
+        relations = self._write_relations(
+            [(game, data) for game, data, _ in changed], translations
+        )
+        refresh_game_cards(game_ids)
+        bump_typeahead_version()
+        bump_game_detail_version(game_ids)
+        record_facet_changes(game_ids)
+        bump_recommend_version()
+        print(f"{len(games)}개의 게임이 갱신되었습니다.")
+
+        return len(games), relations
+
+    def _write_relations(self, games_data, translations=None):
+        """
+        (Game, 정규화 데이터) 목록의 장르/태그/플랫폼/이미지 관계 저장
+        관계 데이터는 Game 객체로 연결 (bulk_create 후 채워지는 id 사용)
+        """
+
+        def relation_data(key):
+            return [
+                {"game": game, key: data[key] if data is not None else []}
+                for game, data in games_data
+            ]
+
+        return (
+            self.import_genres(relation_data("genres"), translations)
+            + self.import_tags(relation_data("tags"), translations)
+            + self.import_platforms(relation_data("platforms"))
+            + self.import_images(relation_data("images"))
+        )
+
+    def _game_fields(self, data, translations):
+        return {
+            "name": data["name"],
+            "intro": translations.get(data["intro"], data["intro"]),
+            "released_at": self._parse_released(data["released"]),
+            "developer": data["developer"],
+            "publisher": data["publisher"],
+        }
+
+    @staticmethod
+    def _parse_released(released):
+        if not released:
+            return None
+        try:
+            return datetime.strptime(released, "%Y-%m-%d").date()
+        except ValueError:
+            return None
+
+    def _print_change_set(self, new_raw_games, changed):
+        for g in new_raw_games:
+            print(f"[dry-run] 추가: rawg_id={g['id']} {g['name']}")
+
+        for game, data, _ in changed:
+            fields = [
+                field
+                for field, value in (
+                    ("name", game.name != data["name"]),
+                    (
+                        "released_at",
+                        game.released_at != self._parse_released(data["released"]),
+                    ),
+                    ("developer", game.developer != data["developer"]),
+                    ("publisher", game.publisher != data["publisher"]),
+                )
+                if value
+            ]
+            print(
+                f"[dry-run] 변경: rawg_id={game.rawg_id} {data['name']} "
+                f"({', '.join(fields) or '소개글/관계'})"
+            )
+
+    def _split_games(self, raw_games, refresh=False, dry_run=False):
+        """
+        RAWG 목록을 새 게임과 기존 게임으로 나눔 (rawg_id 기준, 쿼리 1~2회)
+        - rawg_id 없이 저장된 기존 게임은 이름으로 찾아서 rawg_id를 채워줌
+        - 기존 게임은 refresh일 때만 {rawg_id: (raw_game, Game)}으로 반환
+        """
+        unique_games = {g["id"]: g for g in raw_games}
+
+        existing_games = {
+            game.rawg_id: game
+            for game in Game.objects.filter(rawg_id__in=list(unique_games)).only(
+                "id",
+                "rawg_id",
+                "content_hash",
+                "name",
+                "released_at",
+                "developer",
+                "publisher",
+            )
+        }
+        candidates = {
+            rawg_id: g
+            for rawg_id, g in unique_games.items()
+            if rawg_id not in existing_games
+        }
+
+        if candidates:
+            rawg_id_by_name = {g["name"]: rawg_id for rawg_id, g in candidates.items()}
+            legacy_games = list(
+                Game.objects.filter(
+                    rawg_id__isnull=True, name__in=list(rawg_id_by_name)
+                )
+            )
+            backfilled = []
+            for game in legacy_games:
+                rawg_id = rawg_id_by_name.get(game.name)
+                if rawg_id in candidates:
+                    game.rawg_id = rawg_id
+                    backfilled.append(game)
+                    existing_games[rawg_id] = game
+                    del candidates[rawg_id]
+
+            if backfilled and not dry_run:
+                Game.objects.bulk_update(backfilled, ["rawg_id"])
+
+        existing = (
+            {
+                rawg_id: (unique_games[rawg_id], game)
+                for rawg_id, game in existing_games.items()
+            }
+            if refresh
+            else {}
+        )
+
+        return list(candidates.values()), existing
+
+    def import_genres(self, game_genres_data, translations=None):
         game_genre_relation = []
+        genre_ids = self._resolve_dimension(
+            Genre,
+            {
+                genre_info["slug"]: genre_info["name"]
+                for data in game_genres_data
+                for genre_info in data["genres"]
+            },
+            lambda slug, name, name_ko: Genre(slug=slug, genre=name, genre_ko=name_ko),
+            translations=translations,
+        )
 
         for data in game_genres_data:
-            try:
-                game = Game.objects.get(name=data["game_name"])
-            except Game.DoesNotExist:
+            game_id = data["game"].pk
+            if game_id is None:
                 continue
 
             for genre_info in data["genres"]:
-                genre = Genre.objects.filter(slug=genre_info["slug"]).first()
-
-                if not genre:
-                    try:
-                        genre_ko = self.translator.translate(genre_info["name"])
-                        time.sleep(0.3)
-                    except Exception:
-                        genre_ko = genre_info["name"]
-
-                    genre = Genre.objects.create(
-                        slug=genre_info["slug"],
-                        genre=genre_info["name"],
-                        genre_ko=genre_ko,
-                    )
+                genre_id = genre_ids.get(genre_info["slug"])
+                if genre_id is None:
+                    continue
 
-                game_genre_relation.append(GameGenre(game=game, genre=genre))
+                game_genre_relation.append(
+                    GameGenre(game_id=game_id, genre_id=genre_id)
+                )
 
         GameGenre.objects.bulk_create(game_genre_relation, ignore_conflicts=True)
         print(f"장르 관계 {len(game_genre_relation)}개 저장 완료")
+        return len(game_genre_relation)
 
-    def import_tags(self, game_tags_data):
+    def import_tags(self, game_tags_data, translations=None):
         game_tag_relation = []
+        tag_ids = self._resolve_dimension(
+            Tag,
+            {
+                tag_info["slug"]: tag_info["name"]
+                for data in game_tags_data
+                for tag_info in data["tags"]
+            },
+            lambda slug, name, name_ko: Tag(slug=slug, tag=name, tag_ko=name_ko),
+            translations=translations,
+        )
 
         for data in game_tags_data:
-            try:
-                game = Game.objects.get(name=data["game_name"])
-            except Game.DoesNotExist:
+            game_id = data["game"].pk
+            if game_id is None:
                 continue
 
             for tag_info in data["tags"]:
-                tag = Tag.objects.filter(slug=tag_info["slug"]).first()
-
-                if not tag:
-                    try:
-                        tag_ko = self.translator.translate(tag_info["name"])
-                        time.sleep(0.1)
-                    except Exception:
-                        tag_ko = tag_info["name"]
+                tag_id = tag_ids.get(tag_info["slug"])
+                if tag_id is None:
+                    continue
 
-                    tag = Tag.objects.create(
-                        slug=tag_info["slug"], tag=tag_info["name"], tag_ko=tag_ko
-                    )
-
-                game_tag_relation.append(GameTag(game=game, tag=tag))
+                game_tag_relation.append(GameTag(game_id=game_id, tag_id=tag_id))
 
         GameTag.objects.bulk_create(game_tag_relation, ignore_conflicts=True)
         print(f"태그 관계 {len(game_tag_relation)}개 저장 완료")
+        return len(game_tag_relation)
 
     def import_platforms(self, game_platforms_data):
         game_platform_relation = []
+        platform_ids = self._resolve_dimension(
+            Platform,
+            {
+                platform_info["platform"]["slug"]: platform_info["platform"].get(
+                    "name", "Unknown"
+                )
+                for data in game_platforms_data
+                for platform_info in data["platforms"]
+                if platform_info.get("platform", {}).get("slug")
+            },
+            lambda slug, name, name_ko: Platform(slug=slug, platform=name),
+            translate=False,
+        )
 
         for data in game_platforms_data:
-            try:
-                game = Game.objects.get(name=data["game_name"])
-            except Game.DoesNotExist:
+            game_id = data["game"].pk
+            if game_id is None:
                 continue
 
             for platform_info in data["platforms"]:
-                platform_data = platform_info.get("platform", {})
-
-                platform, created = Platform.objects.get_or_create(
-                    slug=platform_data.get("slug", ""),
-                    defaults={"platform": platform_data.get("name", "Unknown")},
+                platform_id = platform_ids.get(
+                    platform_info.get("platform", {}).get("slug")
                 )
+                if platform_id is None:
+                    continue
 
                 game_platform_relation.append(
-                    GamePlatform(game=game, platform=platform)
+                    GamePlatform(game_id=game_id, platform_id=platform_id)
                 )
 
         GamePlatform.objects.bulk_create(game_platform_relation, ignore_conflicts=True)
         print(f"플랫폼 관계 {len(game_platform_relation)}개 저장 완료")
+        return len(game_platform_relation)
+
+    def _unknown_dimension_names(self, model, names_by_slug):
+        """
+        DB에 아직 없는 장르/태그/플랫폼 slug의 이름 목록 (새로 생성할 때 번역할 이름)
+        조회한 slug의 id는 서비스 인스턴스에 보관
+        """
+        slug_to_id = self._dimension_ids.setdefault(model, {})
+
+        unknown_slugs = [slug for slug in names_by_slug if slug not in slug_to_id]
+        if unknown_slugs:
+            slug_to_id.update(
+                model.objects.filter(slug__in=unknown_slugs).values_list("slug", "id")
+            )
+
+        return [names_by_slug[slug] for slug in unknown_slugs if slug not in slug_to_id]
+
+    def _resolve_dimension(
+        self, model, names_by_slug, build, translate=True, translations=None
+    ):
+        """
+        장르/태그/플랫폼의 {slug: id} 맵을 반환
+        - 한 번 조회한 slug는 서비스 인스턴스에 보관하여 다시 조회하지 않음
+        - DB에 없는 slug는 모아서 bulk_create 한 번으로 생성
+        - 이름은 translations(미리 번역한 이름)에서 찾고, 없는 이름만 여기서 번역
+        """
+        slug_to_id = self._dimension_ids.setdefault(model, {})
+        missing_names = self._unknown_dimension_names(model, names_by_slug)
+        if not missing_names:
+            return slug_to_id
+
+        missing_slugs = [slug for slug in names_by_slug if slug not in slug_to_id]
+        translations = dict(translations or {})
+        if translate:
+            untranslated = [name for name in missing_names if name not in translations]
+            if untranslated:
+                translations.update(self.translation.translate_many(untranslated))
+        else:
+            translations = {}
+
+        model.objects.bulk_create(
+            [
+                build(
+                    slug,
+                    names_by_slug[slug],
+                    translations.get(names_by_slug[slug], names_by_slug[slug]),
+                )
+                for slug in missing_slugs
+            ],
+            ignore_conflicts=True,
+        )
+        if model in (Genre, Tag):
+            bump_taxonomy_version()
+        # ignore_conflicts는 id를 돌려주지 않으므로 새로 만든 slug만 다시 조회
+        slug_to_id.update(
+            model.objects.filter(slug__in=missing_slugs).values_list("slug", "id")
+        )
+
+        return slug_to_id
 
     def import_images(self, game_images_data):
         game_images = []
 
         for data in game_images_data:
-            try:
-                game = Game.objects.get(name=data["game_name"])
-            except Game.DoesNotExist:
+            game_id = data["game"].pk
+            if game_id is None:
                 continue
 
             for img_url in data["images"]:
-                game_images.append(GameImg(game=game, img_url=img_url))
+                game_images.append(GameImg(game_id=game_id, img_url=img_url))
 
         GameImg.objects.bulk_create(game_images)
         print(f"이미지 {len(game_images)}개 저장 완료")
+        return len(game_images)
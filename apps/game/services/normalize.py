@@ -0,0 +1,65 @@
+import hashlib
+import json
+from typing import Any
+
+from apps.game.services.fetcher import GameBundle
+
+INTRO_MAX_LENGTH = 500  # 번역/저장할 소개글 최대 길이
+
+
+def normalize_game(
+    raw_game: dict[str, Any], bundle: GameBundle
+) -> dict[str, Any] | None:
+    """
+    RAWG 응답에서 실제로 저장하는 값만 뽑아 정규화한 dict 반환 (상세 조회 실패 시 None)
+    - games_count처럼 저장하지 않고 자주 바뀌는 값은 제외하여 해시가 흔들리지 않게 함
+    - 장르/태그/플랫폼은 slug 순으로 정렬 (순서만 바뀐 경우는 변경으로 보지 않음)
+    """
+    detail = bundle.detail
+    if detail is None:
+        return None
+
+    developers = detail.get("developers") or []
+    publishers = detail.get("publishers") or []
+
+    images = []
+    if detail.get("background_image"):
+        images.append(detail["background_image"])
+    for screenshot in bundle.screenshots:
+        if screenshot.get("image"):
+            images.append(screenshot["image"])
+
+    return {
+        "name": raw_game["name"],
+        "released": raw_game.get("released") or None,
+        "developer": developers[0]["name"] if developers else "Unknown",
+        "publisher": publishers[0]["name"] if publishers else "Unknown",
+        "intro": (detail.get("description", "") or "")[:INTRO_MAX_LENGTH],
+        "genres": _normalize_dimension(detail.get("genres")),
+        "tags": _normalize_dimension(detail.get("tags")),
+        "platforms": [
+            {"platform": platform}
+            for platform in _normalize_dimension(
+                (platform_info or {}).get("platform")
+                for platform_info in detail.get("platforms") or []
+            )
+        ],
+        "images": images,
+    }
+
+
+def content_hash(data: dict[str, Any]) -> str:
+    """
+    정규화한 게임 데이터의 sha256 해시
+    """
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _normalize_dimension(items) -> list[dict[str, str]]:
+    by_slug = {
+        item["slug"]: {"slug": item["slug"], "name": item.get("name") or item["slug"]}
+        for item in items or []
+        if item and item.get("slug")
+    }
+    return [by_slug[slug] for slug in sorted(by_slug)]
@@ -0,0 +1,55 @@
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    여러 스레드가 공유하는 토큰 버킷 방식의 요청 속도 제한기
+    - 초당 rate개의 토큰이 채워지고, 최대 capacity개까지 모아둘 수 있음
+    - 토큰이 없으면 다음 토큰이 채워질 때까지 대기
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 꺼낼 수 있을 때까지 대기한 뒤 토큰을 소비하고, 대기한 시간(초)을 반환
+        """
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                # 부족한 토큰이 채워지는 데 걸리는 시간만큼 대기
+                wait_time = (tokens - self._tokens) / self.rate
+
+            self._sleep(wait_time)
+            waited += wait_time
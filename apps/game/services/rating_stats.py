@@ -0,0 +1,103 @@
+from typing import Iterable
+
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from apps.community.models.reviews import Review
+from apps.game.models.game_rating_stats import RATING_VALUES, GameRatingStats
+from apps.game.services.detail_cache import bump_game_detail_version
+
+STATS_FIELDS = ["review_count", "rating_sum"] + [
+    f"rating_{rating}" for rating in RATING_VALUES
+]
+
+
+def apply_rating_change(
+    game_id: int, old_rating: int | None, new_rating: int | None
+) -> None:
+    """
+    리뷰 하나의 변화를 게임 집계에 반영 (None은 집계되지 않는 상태: 새 리뷰 이전/삭제됨)
+    - 생성: (None, 5), 별점 수정: (3, 5), 소프트 삭제: (5, None)
+    - 행 단위 UPDATE ... SET x = x + n 이라 동시에 여러 리뷰가 저장되어도 값이 유실되지 않음
+    """
+    if old_rating == new_rating:
+        return
+
+    deltas = dict.fromkeys(STATS_FIELDS, 0)
+    if old_rating is not None:
+        deltas["review_count"] -= 1
+        deltas["rating_sum"] -= old_rating
+        deltas[f"rating_{old_rating}"] -= 1
+    if new_rating is not None:
+        deltas["review_count"] += 1
+        deltas["rating_sum"] += new_rating
+        deltas[f"rating_{new_rating}"] += 1
+
+    # 집계 행이 없으면 먼저 만든 뒤 증감
+    GameRatingStats.objects.bulk_create(
+        [GameRatingStats(game_id=game_id)], ignore_conflicts=True
+    )
+    GameRatingStats.objects.filter(game_id=game_id).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + delta for field, delta in deltas.items() if delta},
+    )
+
+
+def compute_rating_stats(
+    game_ids: Iterable[int] | None = None,
+) -> dict[int, dict[str, int]]:
+    """
+    리뷰 테이블에서 게임별 집계를 다시 계산 ({game_id: {필드: 값}}, 리뷰가 없는 게임은 제외)
+    """
+    reviews = Review.objects.filter(is_deleted=False)
+    if game_ids is not None:
+        reviews = reviews.filter(game_id__in=list(game_ids))
+
+    rows = (
+        reviews.values("game_id")
+        .annotate(
+            review_count=Count("id"),
+            rating_sum=Sum("rating"),
+            **{
+                f"rating_{rating}": Count("id", filter=Q(rating=rating))
+                for rating in RATING_VALUES
+            },
+        )
+        .values_list("game_id", *STATS_FIELDS)
+    )
+    return {game_id: dict(zip(STATS_FIELDS, values)) for game_id, *values in rows}
+
+
+def reconcile_rating_stats(dry_run: bool = False) -> list[int]:
+    """
+    저장된 집계와 리뷰 테이블을 비교해 어긋난 게임의 집계를 바로잡음
+    (직접 SQL 수정, 동시 수정 등으로 생긴 오차 복구용) 바로잡은 game_id 목록을 반환
+    """
+    expected = compute_rating_stats()
+    stored = {
+        stats.game_id: stats
+        for stats in GameRatingStats.objects.all().iterator(chunk_size=2000)
+    }
+
+    empty = dict.fromkeys(STATS_FIELDS, 0)
+    fixes = []
+    for game_id in expected.keys() | stored.keys():
+        values = expected.get(game_id, empty)
+        stats = stored.get(game_id)
+        if stats is not None and all(
+            getattr(stats, field) == value for field, value in values.items()
+        ):
+            continue
+        fixes.append(GameRatingStats(game_id=game_id, **values))
+
+    if fixes and not dry_run:
+        GameRatingStats.objects.bulk_create(
+            fixes,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["game"],
+            update_fields=STATS_FIELDS + ["updated_at"],
+        )
+        bump_game_detail_version(stats.game_id for stats in fixes)
+
+    return sorted(stats.game_id for stats in fixes)
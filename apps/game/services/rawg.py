@@ -1,28 +1,110 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+
 import requests
 from django.conf import settings
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+
+from apps.game.services.rate_limiter import TokenBucket
 
 RAWG_BASE_URL = "https://api.rawg.io/api"
 PAGE_SIZE = 40  # rawg api에서 제공하는 최대 페이지 사이즈가 40
 MAX_PAGE = 2  # 40개만 긁어오기
 
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}  # 재시도할 응답 코드
+MAX_RETRY_AFTER_SECONDS = 60  # Retry-After 헤더를 따르더라도 최대 대기 시간
+
+
+@dataclass
+class EndpointStats:
+    """
+    엔드포인트별 호출 횟수, 재시도 횟수, 지연 시간 통계
+    """
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        if not self.requests:
+            return 0.0
+        return self.total_latency / self.requests
+
 
 class RawgClient:
+    """
+    RAWG API 클라이언트
+    - keep-alive 커넥션 풀을 공유하는 requests.Session 사용
+    - 일시적인 오류(연결 실패, 429, 5xx)는 지수 백오프 + 지터로 재시도
+    - 429 응답의 Retry-After 헤더를 우선적으로 따름
+    - rate_limiter가 있으면 재시도를 포함한 모든 HTTP 요청마다 토큰을 하나씩 소비
+    """
+
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        max_retries: int | None = None,
+        backoff_base: float | None = None,
+        backoff_max: float | None = None,
+        timeout: float | None = None,
+        session: requests.Session | None = None,
+        base_url: str | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ):
+        self.base_url: str = (
+            base_url
+            if base_url is not None
+            else getattr(settings, "RAWG_BASE_URL", RAWG_BASE_URL)
+        ).rstrip("/")
+        self.pool_size: int = (
+            pool_size
+            if pool_size is not None
+            else getattr(settings, "RAWG_HTTP_POOL_SIZE", 10)
+        )
+        self.max_retries: int = (
+            max_retries
+            if max_retries is not None
+            else getattr(settings, "RAWG_HTTP_MAX_RETRIES", 3)
+        )
+        self.backoff_base: float = (
+            backoff_base
+            if backoff_base is not None
+            else getattr(settings, "RAWG_HTTP_BACKOFF_BASE", 0.5)
+        )
+        self.backoff_max: float = (
+            backoff_max
+            if backoff_max is not None
+            else getattr(settings, "RAWG_HTTP_BACKOFF_MAX", 30)
+        )
+        self.timeout: float = (
+            timeout
+            if timeout is not None
+            else getattr(settings, "RAWG_HTTP_TIMEOUT", 10)
+        )
+        self.rate_limiter = rate_limiter
+
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.stats: dict[str, EndpointStats] = {}
+        self._stats_lock = threading.Lock()
+
     def fetch_games(self):
         games = []
 
         for page in range(1, MAX_PAGE + 1):
-            response = requests.get(
-                f"{RAWG_BASE_URL}/games",
-                params={
-                    "key": settings.RAWG_API_KEY,
-                    "page": page,
-                    "page_size": PAGE_SIZE,
-                },
-                timeout=10,
-            )
-            response.raise_for_status()  # 오류나면 종료
-
-            data = response.json()
+            data = self.fetch_games_page(page)
             games.extend(data.get("results", []))
 
             if not data.get("next"):
@@ -30,20 +112,116 @@ class RawgClient:
 
         return games
 
-    def fetch_game_detail(self, game_id):
-        response = requests.get(
-            f"{RAWG_BASE_URL}/games/{game_id}",
-            params={"key": settings.RAWG_API_KEY},
-            timeout=10,
+    def fetch_games_page(self, page):
+        return self._get(
+            "games",
+            "/games",
+            params={"page": page, "page_size": PAGE_SIZE},
         )
-        response.raise_for_status()
-        return response.json()
+
+    def fetch_game_detail(self, game_id):
+        return self._get("game_detail", f"/games/{game_id}")
 
     def fetch_game_screenshots(self, game_id):
-        response = requests.get(
-            f"{RAWG_BASE_URL}/games/{game_id}/screenshots",
-            params={"key": settings.RAWG_API_KEY},
-            timeout=10,
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get("game_screenshots", f"/games/{game_id}/screenshots")
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """
+        엔드포인트별 통계를 딕셔너리로 반환 (로그/응답 출력용)
+        """
+        with self._stats_lock:
+            return {
+                endpoint: {
+                    "requests": stat.requests,
+                    "retries": stat.retries,
+                    "failures": stat.failures,
+                    "avg_latency": round(stat.avg_latency, 4),
+                }
+                for endpoint, stat in self.stats.items()
+            }
+
+    def _get(self, endpoint: str, path: str, params: dict | None = None):
+        request_params = {"key": settings.RAWG_API_KEY, **(params or {})}
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            started_at = time.monotonic()
+
+            try:
+                response = self.session.get(
+                    f"{self.base_url}{path}",
+                    params=request_params,
+                    timeout=self.timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(endpoint, time.monotonic() - started_at)
+                if attempt >= self.max_retries:
+                    self._record_failure(endpoint)
+                    raise
+            else:
+                self._record(endpoint, time.monotonic() - started_at)
+
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()  # 재시도 대상이 아닌 오류는 바로 종료
+                    return response.json()
+
+                if attempt >= self.max_retries:
+                    self._record_failure(endpoint)
+                    response.raise_for_status()
+
+                if response.status_code == 429:
+                    retry_after = self._parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+
+            self._record_retry(endpoint)
+            time.sleep(
+                retry_after if retry_after is not None else self._backoff(attempt)
+            )
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        지수 백오프 + full jitter (0 ~ base * 2^attempt 사이의 임의 값)
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _parse_retry_after(self, value: str | None) -> float | None:
+        """
+        Retry-After 헤더(초 또는 HTTP 날짜 형식)를 대기 시간(초)으로 변환
+        """
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if timezone.is_naive(retry_at):
+                retry_at = timezone.make_aware(retry_at, UTC)
+            seconds = (retry_at - timezone.now()).total_seconds()
+
+        return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+    def _get_stat(self, endpoint: str) -> EndpointStats:
+        if endpoint not in self.stats:
+            self.stats[endpoint] = EndpointStats()
+        return self.stats[endpoint]
+
+    def _record(self, endpoint: str, latency: float) -> None:
+        with self._stats_lock:
+            stat = self._get_stat(endpoint)
+            stat.requests += 1
+            stat.total_latency += latency
+
+    def _record_retry(self, endpoint: str) -> None:
+        with self._stats_lock:
+            self._get_stat(endpoint).retries += 1
+
+    def _record_failure(self, endpoint: str) -> None:
+        with self._stats_lock:
+            self._get_stat(endpoint).failures += 1
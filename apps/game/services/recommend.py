@@ -0,0 +1,324 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Sequence
+
+import numpy as np
+from django.conf import settings
+from scipy import sparse  # type: ignore
+
+from apps.core.conditional import bump_versions, get_versions
+from apps.core.index_holder import IndexHolder
+from apps.game.models.game_card import GameCard
+from apps.game.models.game_genre import GameGenre
+from apps.game.models.game_tag import GameTag
+
+RECOMMEND_VERSION_KEY = "game:recommend:version"
+
+# 추천 정렬 (점수 -> 출시일 -> id, 모두 내림차순, 커서 페이지네이션 키로도 사용)
+RECOMMEND_ORDERING = ("score", "released_ordinal", "game_id")
+# 더하는 순서에 따른 부동소수점 오차로 커서 비교가 흔들리지 않게 반올림
+SCORE_DIGITS = 6
+Key = tuple[float, int, int]  # (점수, 출시일 ordinal, game_id)
+
+# 위시리스트 선호 벡터에 남기는 태그 수 (위시리스트가 커져도 점수 계산 비용이 일정하도록)
+PROFILE_TAG_LIMIT = 20
+
+
+def top_candidates(values: np.ndarray, limit: int) -> np.ndarray:
+    """
+    값이 큰 상위 limit개의 위치 (정렬하지 않음, argpartition)
+    경계 값과 같은 위치도 모두 포함하므로 다른 키로 동점을 정렬한 뒤 limit개를 자르면 됨
+    """
+    if limit <= 0:
+        return np.array([], dtype=np.int64)
+    if len(values) <= limit:
+        return np.arange(len(values))
+    threshold = values[np.argpartition(-values, limit - 1)[:limit]].min()
+    return np.flatnonzero(values >= threshold)
+
+
+class RecommendIndex:
+    """
+    게임 x 태그, 게임 x 장르 희소 행렬 (scipy.sparse.csc_matrix, 행 = game_ids 순서)
+    - 사용자 선호 벡터(태그/장르별 가중치 x idf)와 행렬의 곱 한 번으로 전체 게임 점수를 계산
+    - 각 열에는 idf를 곱해 흔한 태그보다 드문 태그가 일치할 때 더 높은 점수
+    - 페이지는 점수 전체를 정렬하지 않고 필요한 개수만 뽑음 (argpartition top-k)
+    """
+
+    def __init__(
+        self,
+        released: dict[int, int],
+        game_tags: dict[int, list[int]],
+        game_genres: dict[int, list[int]],
+        version: int = 0,
+    ):
+        self.version = version
+        # 추천 대상 게임 전체와 출시일 ordinal (행 순서)
+        self.game_ids = np.array(sorted(released), dtype=np.int64)
+        self.released = np.array(
+            [released[game_id] for game_id in self.game_ids.tolist()], dtype=np.int64
+        )
+        self.rows = {game_id: row for row, game_id in enumerate(self.game_ids.tolist())}
+        self.tag_matrix, self.tag_columns, self.tag_idf = self._matrix(game_tags)
+        # 열 순서의 tag_id (선호 벡터를 태그별 딕셔너리로 되돌릴 때 사용)
+        self.tag_ids = np.array(list(self.tag_columns), dtype=np.int64)
+        self.genre_matrix, self.genre_columns, self.genre_idf = self._matrix(
+            game_genres
+        )
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    def _matrix(
+        self, values_by_game: dict[int, list[int]]
+    ) -> tuple[sparse.csc_matrix, dict[int, int], np.ndarray]:
+        """
+        (게임 x 값 0/1 행렬, {값: 열}, 열별 idf)
+        """
+        columns: dict[int, int] = {}
+        rows = []
+        cols = []
+        for game_id, values in values_by_game.items():
+            row = self.rows.get(game_id)
+            if row is None:
+                continue
+            for value in values:
+                rows.append(row)
+                cols.append(columns.setdefault(value, len(columns)))
+
+        matrix = sparse.csc_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(self), len(columns))
+        )
+        counts = np.diff(matrix.indptr)
+        idf = np.log((1 + len(self)) / (1 + counts)) + 1
+        return matrix, columns, idf
+
+    @staticmethod
+    def _weights(
+        columns: dict[int, int], idf: np.ndarray, weights: dict[int, float]
+    ) -> np.ndarray:
+        vector = np.zeros(len(columns))
+        for value, weight in weights.items():
+            column = columns.get(value)
+            if column is not None:
+                vector[column] += weight
+        return vector * idf
+
+    def tag_profile(
+        self, game_weights: dict[int, float], limit: int = PROFILE_TAG_LIMIT
+    ) -> dict[int, float]:
+        """
+        게임별 가중치를 태그별로 더한 선호 벡터 (위시리스트 기반)
+        - 태그 행렬의 전치와 게임 가중치 벡터의 곱 한 번으로 계산
+        - 여러 게임에 함께 달린 태그일수록 큰 값, 가중치가 큰 limit개 태그만 남김
+          (가중치가 같으면 tag_id 순)
+        """
+        game_vector = np.zeros(len(self))
+        for game_id, weight in game_weights.items():
+            row = self.rows.get(game_id)
+            if row is not None:
+                game_vector[row] = weight
+
+        totals = self.tag_matrix.T @ game_vector
+        columns = np.flatnonzero(totals > 0)
+        columns = columns[top_candidates(totals[columns], limit)]
+        columns = columns[np.lexsort((self.tag_ids[columns], -totals[columns]))][:limit]
+        return dict(zip(self.tag_ids[columns].tolist(), totals[columns].tolist()))
+
+    def score(
+        self,
+        tags: dict[int, float],
+        genres: dict[int, float] | None = None,
+        exclude: Iterable[int] = (),
+    ) -> np.ndarray:
+        """
+        행(game_ids 순서)별 점수, 선호 태그/장르가 하나도 없는 게임과 exclude는 0
+        """
+        scores = self.tag_matrix @ self._weights(self.tag_columns, self.tag_idf, tags)
+        if genres:
+            scores += self.genre_matrix @ self._weights(
+                self.genre_columns, self.genre_idf, genres
+            )
+
+        excluded = [self.rows[game_id] for game_id in exclude if game_id in self.rows]
+        scores[excluded] = 0.0
+        return scores
+
+    def recommend(
+        self,
+        tags: dict[int, float],
+        genres: dict[int, float] | None = None,
+        exclude: Iterable[int] = (),
+    ) -> "RankedGames":
+        return RankedGames(self, self.score(tags, genres, exclude))
+
+
+class RankedGames:
+    """
+    점수를 매긴 게임을 페이지네이터가 자를 수 있는 시퀀스로 감쌈
+    - 페이지 번호 방식: [offset:offset+limit]는 상위 offset+limit개만 뽑아 자름
+    - 커서 방식: after(position, limit)는 position보다 뒤(작은) 게임 중 상위 limit개
+    잘라낸 게임의 카드만 조회 (쿼리 1회)
+    """
+
+    def __init__(self, index: RecommendIndex, scores: np.ndarray):
+        rows = np.flatnonzero(scores > 0)
+        self.scores = np.round(scores[rows], SCORE_DIGITS)
+        self.released = index.released[rows]
+        self.game_ids = index.game_ids[rows]
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    def count(self) -> int:
+        return len(self.game_ids)
+
+    def top(self, limit: int, candidates: np.ndarray | None = None) -> list[Key]:
+        """
+        (점수, 출시일, id) 내림차순 상위 limit개 (candidates가 있으면 그 위치 중에서)
+        """
+        if candidates is None:
+            candidates = np.arange(len(self))
+        candidates = candidates[top_candidates(self.scores[candidates], limit)]
+        if not len(candidates):
+            return []
+
+        order = np.lexsort(
+            (
+                -self.game_ids[candidates],
+                -self.released[candidates],
+                -self.scores[candidates],
+            )
+        )[:limit]
+        chosen = candidates[order]
+        return list(
+            zip(
+                self.scores[chosen].tolist(),
+                self.released[chosen].tolist(),
+                self.game_ids[chosen].tolist(),
+            )
+        )
+
+    def __getitem__(self, item: slice) -> list["RankedCard"]:
+        offset = item.start or 0
+        stop = len(self) if item.stop is None else min(item.stop, len(self))
+        if stop <= offset:
+            return []
+        return load_ranked_cards(self.top(stop)[offset:stop])
+
+    def after(self, position: list | None, limit: int) -> list["RankedCard"]:
+        if position is None:
+            return load_ranked_cards(self.top(limit))
+
+        score, released, game_id = position
+        before = (self.scores < score) | (
+            (self.scores == score)
+            & (
+                (self.released < released)
+                | ((self.released == released) & (self.game_ids < game_id))
+            )
+        )
+        return load_ranked_cards(self.top(limit, np.flatnonzero(before)))
+
+
+@dataclass(frozen=True)
+class RankedCard:
+    """
+    추천 순위를 매긴 게임 카드 (목록 직렬화 필드 + 커서 키 score/released_ordinal/game_id)
+    """
+
+    card: GameCard
+    score: float
+    released_ordinal: int
+
+    @property
+    def game_id(self) -> int:
+        return self.card.game_id
+
+    @property
+    def name(self) -> str:
+        return self.card.name
+
+    @property
+    def tags(self) -> list[str]:
+        return self.card.tags
+
+    @property
+    def image_url(self) -> str | None:
+        return self.card.image_url
+
+    @property
+    def released_at(self) -> date | None:
+        return self.card.released_at
+
+    @property
+    def platforms(self) -> list[str]:
+        return self.card.platforms
+
+
+def load_ranked_cards(keys: Sequence[Key]) -> list[RankedCard]:
+    """
+    (점수, 출시일, id) 순서대로 게임 카드를 조회 (쿼리 1회), 카드가 없는 게임은 제외
+    """
+    cards = GameCard.objects.in_bulk([game_id for _, _, game_id in keys])
+    return [
+        RankedCard(cards[game_id], score, released_ordinal)
+        for score, released_ordinal, game_id in keys
+        if game_id in cards
+    ]
+
+
+def load_recommend_index(version: int = 0) -> RecommendIndex:
+    """
+    카드가 있는(삭제되지 않은) 게임과 태그/장르 관계를 DB에서 읽음 (쿼리 3회)
+    """
+    released = {
+        game_id: released_sort.toordinal()
+        for game_id, released_sort in GameCard.objects.values_list(
+            "game_id", "released_sort"
+        )
+    }
+
+    game_tags: dict[int, list[int]] = defaultdict(list)
+    for game_id, tag_id in GameTag.objects.values_list("game_id", "tag_id"):
+        if game_id in released:
+            game_tags[game_id].append(tag_id)
+
+    game_genres: dict[int, list[int]] = defaultdict(list)
+    for game_id, genre_id in GameGenre.objects.values_list("game_id", "genre_id"):
+        if game_id in released:
+            game_genres[game_id].append(genre_id)
+
+    return RecommendIndex(released, dict(game_tags), dict(game_genres), version)
+
+
+def get_recommend_version() -> int:
+    return get_versions([RECOMMEND_VERSION_KEY])[RECOMMEND_VERSION_KEY]
+
+
+def bump_recommend_version() -> None:
+    """
+    게임/태그/장르 관계가 바뀌었음을 알림, 각 워커는 다음 조회 때 행렬을 다시 만듦
+    """
+    bump_versions([RECOMMEND_VERSION_KEY])
+
+
+class RecommendIndexHolder(IndexHolder[RecommendIndex]):
+    """
+    워커 프로세스마다 하나씩 두는 추천 행렬 보관소
+    버전이 바뀌면 기존 행렬로 응답하면서 새 행렬을 만들어 교체
+    """
+
+    name = "Recommend index"
+
+    def load_version(self) -> int:
+        return get_recommend_version()
+
+    def build(self, version: int) -> RecommendIndex:
+        return load_recommend_index(version)
+
+
+recommend_index = RecommendIndexHolder(
+    check_interval=getattr(settings, "GAME_RECOMMEND_CHECK_INTERVAL", 5.0),
+)
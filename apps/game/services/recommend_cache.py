@@ -0,0 +1,152 @@
+import bisect
+from datetime import datetime
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.game.models.wishlist import Wishlist
+from apps.game.services.recommend import (
+    Key,
+    RankedCard,
+    RecommendIndex,
+    load_ranked_cards,
+    recommend_index,
+)
+from apps.preference.models import GenrePreference, TagPreference
+
+RECOMMEND_KINDS = ("preference", "wishlist")
+# 사용자별로 저장하는 추천 게임 수 (목록은 여기까지만 넘길 수 있음)
+RECOMMEND_CACHE_SIZE = getattr(settings, "RECOMMEND_CACHE_SIZE", 200)
+# 매일 밤 전체 갱신하므로 하루보다 조금 길게 유지
+RECOMMEND_CACHE_TIMEOUT = getattr(settings, "RECOMMEND_CACHE_TIMEOUT", 60 * 60 * 26)
+# 위시리스트에 담은 지 이 기간(일)이 지날 때마다 그 게임의 가중치가 절반이 됨
+WISHLIST_HALF_LIFE_DAYS = getattr(settings, "WISHLIST_HALF_LIFE_DAYS", 90)
+
+
+def recommend_cache_key(kind: str, user_id: int) -> str:
+    return f"game:recommend:{kind}:{user_id}"
+
+
+def wishlist_weight(created_at: datetime, now: datetime) -> float:
+    """
+    최근에 담은 게임일수록 큰 가중치 (담은 직후 1.0, 반감기마다 절반)
+    """
+    age_days = max((now - created_at).total_seconds(), 0) / 86400
+    return 0.5 ** (age_days / WISHLIST_HALF_LIFE_DAYS)
+
+
+def compute_recommendations(
+    kind: str, user_id: int, index: RecommendIndex | None = None
+) -> list[Key]:
+    """
+    사용자의 선호 태그/장르(preference) 또는 위시리스트(wishlist)로 상위 추천 게임을 계산
+    """
+    if index is None:
+        index = recommend_index.get()
+
+    if kind == "preference":
+        tag_ids = TagPreference.objects.filter(user_id=user_id).values_list(
+            "tag_id", flat=True
+        )
+        genre_ids = GenrePreference.objects.filter(user_id=user_id).values_list(
+            "genre_id", flat=True
+        )
+        ranked = index.recommend(
+            tags={tag_id: 1.0 for tag_id in tag_ids},
+            genres={genre_id: 1.0 for genre_id in genre_ids},
+        )
+    else:
+        # 태그 가중치 = 그 태그가 달린 위시리스트 게임들의 최근성 가중치 합 (빈도 x 최근성)
+        now = timezone.now()
+        game_weights: dict[int, float] = {}
+        for game_id, created_at in Wishlist.objects.filter(user_id=user_id).values_list(
+            "game_id", "created_at"
+        ):
+            game_weights[game_id] = max(
+                game_weights.get(game_id, 0.0), wishlist_weight(created_at, now)
+            )
+        ranked = index.recommend(
+            tags=index.tag_profile(game_weights), exclude=game_weights
+        )
+
+    return ranked.top(RECOMMEND_CACHE_SIZE)
+
+
+def refresh_user_recommendations(
+    user_id: int,
+    kinds: Iterable[str] = RECOMMEND_KINDS,
+    index: RecommendIndex | None = None,
+) -> dict[str, list[Key]]:
+    """
+    사용자의 추천 목록을 다시 계산해 캐시에 저장 (Celery 작업/야간 갱신에서 호출)
+    """
+    results = {
+        kind: compute_recommendations(kind, user_id, index=index) for kind in kinds
+    }
+    cache.set_many(
+        {recommend_cache_key(kind, user_id): keys for kind, keys in results.items()},
+        RECOMMEND_CACHE_TIMEOUT,
+    )
+    return results
+
+
+def schedule_recommend_refresh(user_id: int) -> None:
+    """
+    선호도/위시리스트 변경이 커밋된 뒤 Celery로 추천 목록을 다시 계산
+    """
+    from apps.game.tasks.recommend import run_recommend_refresh
+
+    transaction.on_commit(lambda: run_recommend_refresh.delay(user_id))
+
+
+class CachedRecommendations:
+    """
+    캐시에 저장된 추천 목록을 페이지네이터가 자를 수 있는 시퀀스로 감쌈
+    - 목록은 (점수, 출시일, id) 내림차순으로 저장되어 있어 페이지는 잘라내기만 함
+    - 커서 방식은 이분 탐색으로 position 다음 위치를 찾음
+    잘라낸 게임의 카드만 조회 (쿼리 1회)
+    """
+
+    def __init__(self, keys: Iterable[Iterable]):
+        # 캐시 백엔드에 따라 목록으로 돌아올 수 있으므로 (점수, 출시일, id) 튜플로 맞춤
+        self.keys: list[Key] = [
+            (float(score), int(released), int(game_id))
+            for score, released, game_id in keys
+        ]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def count(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, item: slice) -> list[RankedCard]:
+        return load_ranked_cards(self.keys[item])
+
+    def after(self, position: list | None, limit: int) -> list[RankedCard]:
+        start = 0
+        if position is not None:
+            # 내림차순 목록에서 position보다 작은 첫 위치
+            score, released, game_id = position
+            start = bisect.bisect_right(
+                self.keys, _descending((score, released, game_id)), key=_descending
+            )
+        return load_ranked_cards(self.keys[start : start + limit])
+
+
+def _descending(key: Key) -> Key:
+    score, released, game_id = key
+    return -score, -released, -game_id
+
+
+def get_user_recommendations(kind: str, user_id: int) -> CachedRecommendations:
+    """
+    캐시된 추천 목록, 없으면(첫 요청/캐시 만료) 바로 계산해 저장
+    """
+    keys = cache.get(recommend_cache_key(kind, user_id))
+    if keys is None:
+        keys = refresh_user_recommendations(user_id, kinds=[kind])[kind]
+    return CachedRecommendations(keys)
@@ -0,0 +1,79 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import (
+    Case,
+    Exists,
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce
+
+from apps.game.models.game import SEARCH_CONFIG, Game
+from apps.game.models.game_card import GameCard
+from apps.game.models.game_tag import GameTag
+from apps.game.models.tag import Tag
+
+TAG_MATCH_BOOST = 0.5  # 검색어와 일치하는 태그가 달린 게임에 더하는 점수
+
+# 검색 결과 정렬 (관련도 -> id, 커서 페이지네이션 키로도 사용)
+SEARCH_ORDERING = ("score", "game_id")
+
+
+def find_matching_tags(query: str) -> QuerySet[Tag]:
+    """
+    검색어와 일치하거나(대소문자 무시) 철자가 비슷한 태그 (태그 테이블은 작아서 인덱스 없이 조회)
+    """
+    return Tag.objects.filter(
+        Q(slug__iexact=query)
+        | Q(tag__iexact=query)
+        | Q(tag_ko=query)
+        | Q(tag__trigram_word_similar=query)
+        | Q(tag_ko__trigram_word_similar=query)
+    )
+
+
+def search_game_cards(query: str) -> QuerySet[GameCard]:
+    """
+    전문 검색 + 이름 유사도 + 태그 일치를 합쳐 관련도(score)를 붙인 게임 카드 쿼리셋
+    - 후보는 각각 인덱스를 타는 세 쿼리(tsvector GIN, 이름 trigram GIN, 태그)의 합집합
+    - 점수는 ts_rank + 이름 trigram 단어 유사도 + 태그 일치 가산점
+    - 긴 이름 속 한 단어만 검색하는 경우가 많아 전체 유사도 대신 단어 유사도(<%)를 사용
+    """
+    search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+    tag_game_ids = GameTag.objects.filter(tag__in=find_matching_tags(query)).values(
+        "game_id"
+    )
+
+    candidate_ids = (
+        Game.objects.filter(search_vector=search_query)
+        .values("id")
+        .union(
+            Game.objects.filter(
+                Q(name__trigram_word_similar=query) | Q(name__icontains=query)
+            ).values("id"),
+            tag_game_ids,
+        )
+    )
+
+    return GameCard.objects.filter(game_id__in=candidate_ids).annotate(
+        score=Cast(
+            Coalesce(SearchRank(F("game__search_vector"), search_query), Value(0.0))
+            + TrigramWordSimilarity(query, "name")
+            + Case(
+                When(
+                    Exists(tag_game_ids.filter(game_id=OuterRef("game_id"))),
+                    then=Value(TAG_MATCH_BOOST),
+                ),
+                default=Value(0.0),
+            ),
+            output_field=FloatField(),
+        )
+    )
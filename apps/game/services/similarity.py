@@ -0,0 +1,216 @@
+import math
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+from django.conf import settings
+from scipy import sparse  # type: ignore
+
+from apps.game.models.game import Game
+from apps.game.models.game_genre import GameGenre
+from apps.game.models.game_neighbors import GameNeighbors
+from apps.game.models.game_platform import GamePlatform
+from apps.game.models.game_tag import GameTag
+from apps.game.services.dump_source import batched
+
+# 게임별로 저장하는 유사 게임 수
+SIMILAR_NEIGHBORS = getattr(settings, "GAME_SIMILAR_NEIGHBORS", 30)
+# 한 번에 행렬 곱으로 이웃을 계산하고 저장할 게임 수 (블록 x 전체 게임 유사도가 메모리에 올라감)
+# 흔한 장르/플랫폼이 겹치는 게임은 대부분 유사도가 0이 아니므로 블록 행은 거의 빽빽함
+SIMILAR_BLOCK_SIZE = getattr(settings, "GAME_SIMILAR_BLOCK_SIZE", 128)
+
+# 특성 종류별 가중치 (종류마다 따로 정규화한 뒤 곱해서 합침)
+FEATURE_WEIGHTS = {"tag": 1.0, "genre": 0.5, "platform": 0.25, "word": 1.0}
+# 종류별로 너무 흔한(전체 중 비율 초과) 특성은 제외, 한 게임에만 있는 특성은 종류와 관계없이 제외
+# 소개글 단어만 제한하고 태그/장르/플랫폼(one-hot)은 흔해도 모두 사용 (흔할수록 idf가 작아짐)
+MAX_DF_RATIO = {"word": 0.1}
+MIN_DF = 2
+
+WORD = re.compile(r"\w{2,}")
+
+Feature = tuple[str, int | str]  # (종류, 값) 예: ("tag", 3), ("word", "오픈월드")
+
+
+def tokenize(text: str) -> list[str]:
+    return WORD.findall(text.lower())
+
+
+def load_game_features() -> dict[int, Counter[Feature]]:
+    """
+    삭제되지 않은 게임별 특성 개수 (태그/장르/플랫폼은 1, 소개글 단어는 등장 횟수, 쿼리 4회)
+    """
+    features: dict[int, Counter[Feature]] = {}
+    for game_id, intro in (
+        Game.objects.filter(is_deleted=False)
+        .values_list("id", "intro")
+        .iterator(chunk_size=2000)
+    ):
+        features[game_id] = Counter(("word", word) for word in tokenize(intro or ""))
+
+    for kind, model, field in (
+        ("tag", GameTag, "tag_id"),
+        ("genre", GameGenre, "genre_id"),
+        ("platform", GamePlatform, "platform_id"),
+    ):
+        for game_id, value in model.objects.values_list("game_id", field):
+            if game_id in features:
+                features[game_id][(kind, value)] = 1
+
+    return features
+
+
+def build_vectors(
+    features: dict[int, Counter[Feature]],
+) -> dict[int, dict[Feature, float]]:
+    """
+    특성 개수를 TF-IDF 가중치 벡터로 바꿈 (길이 1로 정규화하여 내적 = 코사인 유사도)
+    - 가중치는 (1 + log(개수)) x idf, 태그/장르/플랫폼은 개수가 1이라 idf만 남음
+    - 소개글 단어 수가 많아도 태그 쪽 비중이 줄지 않도록 종류별로 정규화한 뒤 FEATURE_WEIGHTS를 곱함
+    """
+    total = len(features)
+    document_frequency: Counter[Feature] = Counter()
+    for counts in features.values():
+        document_frequency.update(counts.keys())
+
+    max_df = {kind: max(ratio * total, MIN_DF) for kind, ratio in MAX_DF_RATIO.items()}
+    idf = {
+        feature: math.log((1 + total) / (1 + df)) + 1
+        for feature, df in document_frequency.items()
+        if MIN_DF <= df <= max_df.get(feature[0], total)
+    }
+
+    vectors = {}
+    for game_id, counts in features.items():
+        by_kind: dict[str, dict[Feature, float]] = defaultdict(dict)
+        for feature, count in counts.items():
+            if feature in idf:
+                by_kind[feature[0]][feature] = (1 + math.log(count)) * idf[feature]
+
+        vector = {}
+        for kind, weights in by_kind.items():
+            norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+            for feature, weight in weights.items():
+                vector[feature] = FEATURE_WEIGHTS[kind] * weight / norm
+
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if norm:
+            vectors[game_id] = {
+                feature: weight / norm for feature, weight in vector.items()
+            }
+    return vectors
+
+
+def build_matrix(
+    vectors: dict[int, dict[Feature, float]],
+) -> tuple[list[int], sparse.csr_matrix]:
+    """
+    벡터를 게임 x 특성 희소 행렬로 바꿈 (행 순서 = 반환하는 game_ids 순서)
+    """
+    game_ids = sorted(vectors)
+    columns: dict[Feature, int] = {}
+    indptr = [0]
+    indices = []
+    data = []
+    for game_id in game_ids:
+        for feature, weight in vectors[game_id].items():
+            indices.append(columns.setdefault(feature, len(columns)))
+            data.append(weight)
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (
+            np.asarray(data, dtype=np.float32),
+            np.asarray(indices, dtype=np.int32),
+            np.asarray(indptr, dtype=np.int64),
+        ),
+        shape=(len(game_ids), len(columns)),
+    )
+    return game_ids, matrix
+
+
+def nearest_neighbors(
+    matrix: sparse.csr_matrix,
+    game_ids: list[int],
+    start: int,
+    stop: int,
+    k: int = SIMILAR_NEIGHBORS,
+) -> dict[int, list[tuple[int, float]]]:
+    """
+    start~stop 행 게임 각각과 코사인 유사도가 높은 상위 k개 게임 [(game_id, 유사도)]
+    - 블록 행렬 곱(X[start:stop] @ X.T) 한 번으로 블록 전체의 유사도를 계산
+    - 행마다 argpartition으로 후보를 줄인 뒤 (유사도 내림차순, game_id 오름차순)으로 정렬
+    """
+    scores = (matrix[start:stop] @ matrix.T).tocsr()
+    ids = np.asarray(game_ids)
+
+    results = {}
+    for offset in range(stop - start):
+        row = start + offset
+        lo, hi = scores.indptr[offset], scores.indptr[offset + 1]
+        columns = scores.indices[lo:hi]
+        values = np.round(scores.data[lo:hi].astype(np.float64), 6)
+        keep = (columns != row) & (values > 0)
+        columns, values = columns[keep], values[keep]
+
+        if len(values) > k:
+            # k번째 점수와 같은 후보는 모두 남겨 game_id 순으로 고르게 함
+            threshold = np.partition(values, len(values) - k)[len(values) - k]
+            candidates = values >= threshold
+            columns, values = columns[candidates], values[candidates]
+
+        order = np.lexsort((ids[columns], -values))[:k]
+        results[game_ids[row]] = [
+            (int(ids[columns[i]]), float(values[i])) for i in order
+        ]
+    return results
+
+
+def build_similar_games(
+    block_size: int = SIMILAR_BLOCK_SIZE, k: int = SIMILAR_NEIGHBORS
+) -> int:
+    """
+    모든 게임의 유사 게임을 다시 계산해 game_neighbors에 저장 (야간 배치/관리 명령)
+    - 희소 행렬은 한 번 만들고, block_size개 행씩 행렬 곱으로 계산/저장
+    - 이번 계산에 없는 게임(삭제되었거나 특성이 없어진 게임)의 행은 지움
+    - 저장한 게임 수를 반환
+    """
+    game_ids, matrix = build_matrix(build_vectors(load_game_features()))
+
+    for start in range(0, len(game_ids), block_size):
+        stop = min(start + block_size, len(game_ids))
+        neighbors = nearest_neighbors(matrix, game_ids, start, stop, k=k)
+        GameNeighbors.objects.bulk_create(
+            [
+                GameNeighbors(
+                    game_id=game_id,
+                    neighbor_ids=[other_id for other_id, _ in neighbors[game_id]],
+                    scores=[score for _, score in neighbors[game_id]],
+                )
+                for game_id in game_ids[start:stop]
+            ],
+            update_conflicts=True,
+            unique_fields=["game"],
+            update_fields=["neighbor_ids", "scores", "updated_at"],
+        )
+
+    built = set(game_ids)
+    stale = [
+        game_id
+        for game_id in GameNeighbors.objects.values_list("game_id", flat=True)
+        if game_id not in built
+    ]
+    for batch in batched(stale, block_size):
+        GameNeighbors.objects.filter(game_id__in=batch).delete()
+    return len(game_ids)
+
+
+def similar_content_game_ids(game_id: int, limit: int) -> list[int]:
+    """
+    미리 계산해 둔 내용 기반 유사 게임 (기본키 조회 1회, 없으면 빈 목록)
+    """
+    neighbor_ids = (
+        GameNeighbors.objects.filter(game_id=game_id)
+        .values_list("neighbor_ids", flat=True)
+        .first()
+    )
+    return (neighbor_ids or [])[:limit]
@@ -0,0 +1,12 @@
+from django.conf import settings
+
+from apps.core.conditional import bump_versions
+
+# 장르/태그 목록 버전, 임포트 등으로 장르/태그가 바뀔 때만 올라감 (목록 응답의 ETag로 사용)
+TAXONOMY_VERSION_KEY = "game:taxonomy:version"
+# 목록 응답을 클라이언트가 재검증 없이 쓸 수 있는 시간 (초)
+TAXONOMY_MAX_AGE = getattr(settings, "TAXONOMY_MAX_AGE", 60 * 60)
+
+
+def bump_taxonomy_version() -> None:
+    bump_versions([TAXONOMY_VERSION_KEY])
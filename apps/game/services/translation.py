@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from deep_translator import GoogleTranslator  # type: ignore
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from apps.game.models.translation_memory import TranslationMemory
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationBackend(ABC):
+    """
+    번역 백엔드 공통 인터페이스
+    translate_batch는 입력 순서대로 번역문을 반환하고, 실패한 항목은 None으로 채움
+    translate_batch를 구현하지 않은 백엔드는 생성할 때 TypeError
+    """
+
+    @abstractmethod
+    def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str | None]: ...
+
+
+class GoogleTranslationBackend(TranslationBackend):
+    """
+    deep_translator의 GoogleTranslator를 스레드 풀로 동시에 호출하는 백엔드
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or getattr(
+            settings, "GAME_TRANSLATION_MAX_WORKERS", 4
+        )
+
+    def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str | None]:
+        translator = GoogleTranslator(source=source, target=target)
+
+        def translate_one(text: str) -> str | None:
+            try:
+                return translator.translate(text)
+            except Exception as e:
+                logger.warning(f"Translation failed: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(translate_one, texts))
+
+
+class FakeTranslationBackend(TranslationBackend):
+    """
+    테스트/벤치마크용 백엔드 (네트워크 호출 없이 접두어만 붙여서 반환)
+    """
+
+    def __init__(self, prefix: str = "[ko] ", latency: float = 0.0):
+        self.prefix = prefix
+        self.latency = latency
+        self.calls: list[list[str]] = []
+
+    def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str | None]:
+        self.calls.append(list(texts))
+        if self.latency:
+            time.sleep(self.latency)
+        return [f"{self.prefix}{text}" for text in texts]
+
+
+def get_translation_backend() -> TranslationBackend:
+    """
+    settings.GAME_TRANSLATION_BACKEND에 지정된 백엔드 인스턴스 생성
+    """
+    backend_path = getattr(
+        settings,
+        "GAME_TRANSLATION_BACKEND",
+        "apps.game.services.translation.GoogleTranslationBackend",
+    )
+    return import_string(backend_path)()
+
+
+class TranslationCache:
+    """
+    TranslationMemory 테이블을 먼저 조회하고, 없는 문장만 모아서 백엔드로 번역
+    번역에 성공한 문장은 다시 테이블에 저장하여 다음 임포트에서 재사용
+    """
+
+    def __init__(
+        self,
+        backend: TranslationBackend | None = None,
+        source: str = "en",
+        target: str = "ko",
+        batch_size: int | None = None,
+    ):
+        self.backend = backend or get_translation_backend()
+        self.source = source
+        self.target = target
+        self.batch_size: int = (
+            batch_size
+            if batch_size is not None
+            else getattr(settings, "GAME_TRANSLATION_BATCH_SIZE", 50)
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self.backend_calls = 0
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def translate(self, text: str) -> str:
+        return self.translate_many([text]).get(text, text)
+
+    def translate_many(self, texts: Iterable[str]) -> dict[str, str]:
+        """
+        {원문: 번역문} 딕셔너리 반환 (번역 실패 시 원문 그대로)
+        """
+        hash_to_text = {self.hash_text(text): text for text in set(texts) if text}
+        if not hash_to_text:
+            return {}
+
+        # 1. 저장된 번역 조회
+        stored = TranslationMemory.objects.filter(
+            source_lang=self.source,
+            target_lang=self.target,
+            content_hash__in=list(hash_to_text),
+        ).values_list("content_hash", "translated_text")
+
+        result = {hash_to_text[content_hash]: text for content_hash, text in stored}
+        self.hits += len(result)
+
+        # 2. 없는 문장만 batch_size 단위로 번역
+        missing = [text for text in hash_to_text.values() if text not in result]
+        self.misses += len(missing)
+
+        new_memories = []
+        for start in range(0, len(missing), self.batch_size):
+            chunk = missing[start : start + self.batch_size]
+            translated = self.backend.translate_batch(chunk, self.source, self.target)
+            self.backend_calls += 1
+
+            for text, translated_text in zip(chunk, translated):
+                if not translated_text:
+                    # 실패한 번역은 저장하지 않고 원문 사용 (다음 임포트 때 재시도)
+                    result[text] = text
+                    continue
+
+                result[text] = translated_text
+                new_memories.append(
+                    TranslationMemory(
+                        source_lang=self.source,
+                        target_lang=self.target,
+                        content_hash=self.hash_text(text),
+                        source_text=text,
+                        translated_text=translated_text,
+                    )
+                )
+
+        # 3. 새 번역 저장
+        TranslationMemory.objects.bulk_create(new_memories, ignore_conflicts=True)
+
+        return result
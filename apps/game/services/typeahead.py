@@ -0,0 +1,234 @@
+import bisect
+import heapq
+import itertools
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.conf import settings
+from django.db.models import Count
+
+from apps.core.conditional import bump_versions, get_versions
+from apps.core.index_holder import IndexHolder
+from apps.game.models.game import Game
+from apps.game.models.genre import Genre
+from apps.game.models.tag import Tag
+
+TYPEAHEAD_VERSION_KEY = "game:typeahead:version"
+SUGGEST_LIMIT = 10
+SUGGEST_MAX_LIMIT = 20
+TOP_PREFIX_LENGTH = 4  # 이 길이 이하의 접두어는 상위 결과를 미리 계산해 둠
+MAX_SCAN = 500  # 긴 접두어에서 순위를 매길 최대 후보 수
+MAX_WORD_KEYS = 4  # 이름 중간 단어로 찾을 수 있게 추가 색인하는 단어 수
+
+# 한글 음절 -> 호환용 자모 (겹모음/겹받침은 입력 순서대로 나눔)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]  # fmt: skip
+JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ",
+    "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ",
+    "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]  # fmt: skip
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}  # fmt: skip
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+NON_WORD = re.compile(r"[\W_]+")
+
+
+def _build_jamo_table() -> dict[int, str]:
+    table = {ord(char): jamo for char, jamo in COMPOUND_JAMO.items()}
+    for code in range(HANGUL_BASE, HANGUL_LAST + 1):
+        index = code - HANGUL_BASE
+        table[code] = (
+            CHOSEONG[index // 588]
+            + JUNGSEONG[(index % 588) // 28]
+            + JONGSEONG[index % 28]
+        )
+    return table
+
+
+JAMO_TABLE = _build_jamo_table()  # str.translate용 (음절 11,172자)
+
+
+def decompose_hangul(text: str) -> str:
+    """
+    한글 음절을 자모로 분해 ("스탇" -> "ㅅㅡㅌㅏㄷ")
+    입력 중인 글자("스탇")도 완성된 이름("스타듀")의 접두어가 됨
+    """
+    return text.translate(JAMO_TABLE)
+
+
+def normalize_key(text: str) -> str:
+    """
+    색인/검색 공통 키: 소문자, 특수문자는 공백 하나로, 한글은 자모로 분해
+    """
+    text = unicodedata.normalize("NFC", text).lower()
+    text = NON_WORD.sub(" ", text).strip()
+    return decompose_hangul(text)
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    kind: str  # game / tag / genre
+    id: int
+    label: str
+    weight: int = 0  # 클수록 먼저 (태그/장르는 달린 게임 수)
+
+
+class TypeaheadIndex:
+    """
+    게임 이름/태그/장르의 접두어 색인 (DB 없이 메모리에서 조회)
+    - 정렬된 키 배열을 이분 탐색해 접두어 범위를 찾음
+    - 짧은 접두어는 후보가 많으므로 상위 결과를 미리 계산해 둠
+    - 이름 전체 접두어 일치 > 중간 단어 일치, 같은 경우 weight가 크고 이름이 짧은 순
+    """
+
+    def __init__(self, suggestions: Iterable[Suggestion], version: int = 0):
+        self.version = version
+
+        items = []
+        for suggestion in suggestions:
+            for position, key in enumerate(self._keys(suggestion.label)):
+                rank = (
+                    position > 0,
+                    -suggestion.weight,
+                    len(suggestion.label),
+                    suggestion.label,
+                )
+                items.append((key, rank, suggestion))
+        items.sort(key=lambda item: item[0])
+
+        self._keys_sorted = [key for key, _, _ in items]
+        self._items = [(rank, suggestion) for _, rank, suggestion in items]
+
+        # 정렬되어 있으므로 같은 접두어의 항목은 연속된 구간에 모여 있음
+        self._top: dict[str, list[Suggestion]] = {}
+        for length in range(1, TOP_PREFIX_LENGTH + 1):
+            for prefix, group in itertools.groupby(
+                (item for item in items if len(item[0]) >= length),
+                key=lambda item: item[0][:length],
+            ):
+                # 같은 항목이 여러 키로 들어 있을 수 있어 여유 있게 뽑은 뒤 중복 제거
+                candidates = heapq.nsmallest(
+                    SUGGEST_MAX_LIMIT * 2, group, key=lambda item: item[1]
+                )
+                self._top[prefix] = self._rank(
+                    [(rank, suggestion) for _, rank, suggestion in candidates],
+                    SUGGEST_MAX_LIMIT,
+                )
+
+    def __len__(self) -> int:
+        return len(self._keys_sorted)
+
+    def suggest(self, query: str, limit: int = SUGGEST_LIMIT) -> list[Suggestion]:
+        prefix = normalize_key(query)
+        if not prefix:
+            return []
+
+        if len(prefix) <= TOP_PREFIX_LENGTH:
+            return self._top.get(prefix, [])[:limit]
+
+        start = bisect.bisect_left(self._keys_sorted, prefix)
+        end = bisect.bisect_left(
+            self._keys_sorted,
+            prefix + "\U0010ffff",
+            lo=start,
+            hi=min(start + MAX_SCAN, len(self._keys_sorted)),
+        )
+        return self._rank(self._items[start:end], limit)
+
+    @staticmethod
+    def _keys(label: str) -> list[str]:
+        """
+        이름 전체 + 두 번째 단어부터 시작하는 접미어 ("witcher 3 wild hunt" 등)
+        """
+        key = normalize_key(label)
+        if not key:
+            return []
+        keys = [key]
+        words = key.split(" ")
+        for index in range(1, min(len(words), MAX_WORD_KEYS + 1)):
+            keys.append(" ".join(words[index:]))
+        return keys
+
+    @staticmethod
+    def _rank(candidates: list, limit: int) -> list[Suggestion]:
+        results = []
+        seen = set()
+        for _, suggestion in sorted(candidates, key=lambda item: item[0]):
+            if (suggestion.kind, suggestion.id) in seen:
+                continue
+            seen.add((suggestion.kind, suggestion.id))
+            results.append(suggestion)
+            if len(results) == limit:
+                break
+        return results
+
+
+def load_suggestions() -> list[Suggestion]:
+    """
+    색인할 게임/태그/장르를 DB에서 읽음 (쿼리 3회)
+    """
+    suggestions = [
+        Suggestion("game", game_id, name)
+        for game_id, name in Game.objects.filter(is_deleted=False).values_list(
+            "id", "name"
+        )
+    ]
+
+    for tag_id, tag, tag_ko, games_count in Tag.objects.annotate(
+        games_count=Count("game_tags")
+    ).values_list("id", "tag", "tag_ko", "games_count"):
+        suggestions.append(Suggestion("tag", tag_id, tag, games_count))
+        if tag_ko and tag_ko != tag:
+            suggestions.append(Suggestion("tag", tag_id, tag_ko, games_count))
+
+    for genre_id, genre_ko, games_count in Genre.objects.annotate(
+        games_count=Count("game_genres")
+    ).values_list("id", "genre_ko", "games_count"):
+        if genre_ko:
+            suggestions.append(Suggestion("genre", genre_id, genre_ko, games_count))
+
+    return suggestions
+
+
+def get_typeahead_version() -> int:
+    return get_versions([TYPEAHEAD_VERSION_KEY])[TYPEAHEAD_VERSION_KEY]
+
+
+def bump_typeahead_version() -> None:
+    """
+    게임/태그/장르가 바뀌었음을 알림, 트랜잭션이 커밋된 뒤에 올림
+    각 워커는 다음 조회 때 버전을 비교해 색인을 다시 만듦
+    """
+    bump_versions([TYPEAHEAD_VERSION_KEY])
+
+
+class TypeaheadIndexHolder(IndexHolder[TypeaheadIndex]):
+    """
+    워커 프로세스마다 하나씩 두는 자동완성 색인 보관소
+    버전이 바뀌면 기존 색인으로 응답하면서 새 색인을 만들어 교체
+    """
+
+    name = "Typeahead index"
+
+    def load_version(self) -> int:
+        return get_typeahead_version()
+
+    def build(self, version: int) -> TypeaheadIndex:
+        return TypeaheadIndex(load_suggestions(), version=version)
+
+
+typeahead = TypeaheadIndexHolder(
+    check_interval=getattr(settings, "GAME_TYPEAHEAD_CHECK_INTERVAL", 5.0),
+)
@@ -0,0 +1,54 @@
+from .game_card import (
+    bump_game_list_on_game_delete,
+    refresh_card_on_game_change,
+    refresh_card_on_relation_change,
+    refresh_cards_on_platform_change,
+    refresh_cards_on_tag_change,
+)
+from .typeahead import bump_typeahead_on_change
+from .taxonomy import bump_taxonomy_on_change
+from .detail_cache import (
+    bump_detail_on_game_change,
+    bump_detail_on_genre_change,
+    bump_detail_on_platform_change,
+    bump_detail_on_relation_change,
+    bump_detail_on_tag_change,
+)
+from .facets import record_facets_on_game_change, record_facets_on_relation_change
+from .recommend import (
+    bump_recommend_on_change,
+    refresh_recommendations_on_wishlist_change,
+)
+from .cooccurrence import (
+    add_cooccurrence_on_wishlist_save,
+    remove_cooccurrence_on_user_delete,
+    remove_cooccurrence_on_wishlist_delete,
+)
+from .rating_stats import (
+    update_rating_stats_on_review_delete,
+    update_rating_stats_on_review_save,
+)
+
+__all__ = [
+    "refresh_card_on_game_change",
+    "refresh_card_on_relation_change",
+    "refresh_cards_on_tag_change",
+    "refresh_cards_on_platform_change",
+    "bump_game_list_on_game_delete",
+    "bump_typeahead_on_change",
+    "bump_taxonomy_on_change",
+    "bump_detail_on_game_change",
+    "bump_detail_on_relation_change",
+    "bump_detail_on_genre_change",
+    "bump_detail_on_tag_change",
+    "bump_detail_on_platform_change",
+    "record_facets_on_game_change",
+    "record_facets_on_relation_change",
+    "bump_recommend_on_change",
+    "refresh_recommendations_on_wishlist_change",
+    "add_cooccurrence_on_wishlist_save",
+    "remove_cooccurrence_on_wishlist_delete",
+    "remove_cooccurrence_on_user_delete",
+    "update_rating_stats_on_review_save",
+    "update_rating_stats_on_review_delete",
+]
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.game.models.game import Game
+from apps.game.models.wishlist import Wishlist
+from apps.game.services.cooccurrence import (
+    add_wishlist_game,
+    remove_user_wishlist,
+    remove_wishlist_game,
+)
+from apps.user.models.user import User
+
+
+@receiver(post_save, sender=Wishlist)
+def add_cooccurrence_on_wishlist_save(sender, instance, created, **kwargs):
+    if created:
+        add_wishlist_game(instance.user_id, instance.game_id)
+
+
+@receiver(post_delete, sender=Wishlist)
+def remove_cooccurrence_on_wishlist_delete(sender, instance, **kwargs):
+    """
+    위시리스트에서 게임을 빼면 동시 출현 수에서 뺌
+    - 게임 삭제로 함께 지워지면 그 게임의 쌍도 CASCADE로 지워지므로 건너뜀
+    - 회원 탈퇴는 위시리스트가 지워지기 전에 아래 pre_delete에서 한꺼번에 뺌
+    - QuerySet.delete()로 한 사용자의 여러 행을 지우는 경우는 호출한 쪽에서 직접 반영
+    """
+    if isinstance(kwargs.get("origin"), (Game, User)):
+        return
+    remove_wishlist_game(instance.user_id, instance.game_id)
+
+
+@receiver(pre_delete, sender=User)
+def remove_cooccurrence_on_user_delete(sender, instance, **kwargs):
+    remove_user_wishlist(instance.pk)
@@ -0,0 +1,60 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game.models.game import Game
+from apps.game.models.game_genre import GameGenre
+from apps.game.models.game_img import GameImg
+from apps.game.models.game_platform import GamePlatform
+from apps.game.models.game_tag import GameTag
+from apps.game.models.genre import Genre
+from apps.game.models.platform import Platform
+from apps.game.models.tag import Tag
+from apps.game.services.detail_cache import bump_game_detail_version
+
+
+@receiver(post_save, sender=Game)
+def bump_detail_on_game_change(sender, instance, **kwargs):
+    """
+    관리자 화면 등에서 게임을 수정/삭제 처리하면 상세 캐시 무효화
+    """
+    bump_game_detail_version([instance.pk])
+
+
+@receiver(post_save, sender=GameGenre)
+@receiver(post_delete, sender=GameGenre)
+@receiver(post_save, sender=GameTag)
+@receiver(post_delete, sender=GameTag)
+@receiver(post_save, sender=GamePlatform)
+@receiver(post_delete, sender=GamePlatform)
+@receiver(post_save, sender=GameImg)
+@receiver(post_delete, sender=GameImg)
+def bump_detail_on_relation_change(sender, instance, **kwargs):
+    """
+    게임의 장르/태그/플랫폼/이미지가 바뀌면 상세 캐시 무효화
+    QuerySet.delete()로 한꺼번에 지우는 경우(임포터 등)는 호출한 쪽에서 직접 무효화
+    """
+    if isinstance(kwargs.get("origin"), (QuerySet, Game)):
+        return
+    bump_game_detail_version([instance.game_id])
+
+
+@receiver(post_save, sender=Genre)
+def bump_detail_on_genre_change(sender, instance, created, **kwargs):
+    if created:
+        return
+    bump_game_detail_version(instance.game_genres.values_list("game_id", flat=True))
+
+
+@receiver(post_save, sender=Tag)
+def bump_detail_on_tag_change(sender, instance, created, **kwargs):
+    if created:
+        return
+    bump_game_detail_version(instance.game_tags.values_list("game_id", flat=True))
+
+
+@receiver(post_save, sender=Platform)
+def bump_detail_on_platform_change(sender, instance, created, **kwargs):
+    if created:
+        return
+    bump_game_detail_version(instance.game_platforms.values_list("game_id", flat=True))
@@ -0,0 +1,35 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game.models.game import Game
+from apps.game.models.game_genre import GameGenre
+from apps.game.models.game_platform import GamePlatform
+from apps.game.models.game_tag import GameTag
+from apps.game.services.facets import record_facet_changes
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+def record_facets_on_game_change(sender, instance, **kwargs):
+    """
+    관리자 화면 등에서 게임의 출시일/삭제 여부가 바뀌거나 게임이 지워지면 패싯 색인에 반영
+    (장르/플랫폼/태그가 하나도 없는 게임은 관계 행의 삭제 신호가 없으므로 여기서 기록)
+    """
+    record_facet_changes([instance.pk])
+
+
+@receiver(post_save, sender=GameGenre)
+@receiver(post_delete, sender=GameGenre)
+@receiver(post_save, sender=GamePlatform)
+@receiver(post_delete, sender=GamePlatform)
+@receiver(post_save, sender=GameTag)
+@receiver(post_delete, sender=GameTag)
+def record_facets_on_relation_change(sender, instance, **kwargs):
+    """
+    게임의 장르/플랫폼/태그가 바뀌면 패싯 색인에 반영
+    QuerySet.delete()로 한꺼번에 지우는 경우(임포터 등)는 호출한 쪽에서 직접 기록
+    """
+    if isinstance(kwargs.get("origin"), QuerySet):
+        return
+    record_facet_changes([instance.game_id])
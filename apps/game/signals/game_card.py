@@ -0,0 +1,66 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game.models.game import Game
+from apps.game.models.game_img import GameImg
+from apps.game.models.game_platform import GamePlatform
+from apps.game.models.game_tag import GameTag
+from apps.game.models.platform import Platform
+from apps.game.models.tag import Tag
+from apps.game.services.game_card import bump_game_list_version, refresh_game_cards
+
+
+@receiver(post_save, sender=Game)
+def refresh_card_on_game_change(sender, instance, **kwargs):
+    """
+    관리자 화면/셸 등에서 게임을 저장하면 카드도 갱신 (삭제 처리 시 카드 제거)
+    임포터의 bulk 작업은 시그널이 발생하지 않으므로 임포터가 직접 갱신함
+    """
+    refresh_game_cards([instance.pk])
+
+
+@receiver(post_delete, sender=Game)
+def bump_game_list_on_game_delete(sender, instance, **kwargs):
+    """
+    게임을 완전히 지우면 카드도 CASCADE로 지워지므로 목록 버전만 올림
+    """
+    bump_game_list_version()
+
+
+@receiver(post_save, sender=GameTag)
+@receiver(post_delete, sender=GameTag)
+@receiver(post_save, sender=GamePlatform)
+@receiver(post_delete, sender=GamePlatform)
+@receiver(post_save, sender=GameImg)
+@receiver(post_delete, sender=GameImg)
+def refresh_card_on_relation_change(sender, instance, **kwargs):
+    """
+    게임의 태그/플랫폼/이미지가 바뀌면 해당 게임 카드 갱신
+    - QuerySet.delete()로 한꺼번에 지우는 경우(임포터 등)는 호출한 쪽에서 직접 갱신
+    - 게임 삭제로 함께 지워지는 관계는 건너뜀 (카드도 CASCADE로 삭제됨)
+    """
+    origin = kwargs.get("origin")
+    if isinstance(origin, (QuerySet, Game)):
+        return
+    refresh_game_cards([instance.game_id])
+
+
+@receiver(post_save, sender=Tag)
+def refresh_cards_on_tag_change(sender, instance, created, **kwargs):
+    """
+    태그 이름이 바뀌면 그 태그가 달린 게임 카드를 모두 갱신
+    """
+    if created:
+        return
+    refresh_game_cards(instance.game_tags.values_list("game_id", flat=True))
+
+
+@receiver(post_save, sender=Platform)
+def refresh_cards_on_platform_change(sender, instance, created, **kwargs):
+    """
+    플랫폼 이름이 바뀌면 그 플랫폼의 게임 카드를 모두 갱신
+    """
+    if created:
+        return
+    refresh_game_cards(instance.game_platforms.values_list("game_id", flat=True))
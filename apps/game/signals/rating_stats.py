@@ -0,0 +1,51 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.community.models.reviews import Review
+from apps.game.models.game import Game
+from apps.game.models.game_rating_stats import GameRatingStats
+from apps.game.services.rating_stats import (
+    STATS_FIELDS,
+    apply_rating_change,
+    compute_rating_stats,
+)
+
+UNKNOWN = object()
+
+
+@receiver(post_save, sender=Review)
+def update_rating_stats_on_review_save(sender, instance, created, **kwargs):
+    """
+    리뷰 생성/별점 수정/소프트 삭제를 게임 리뷰 집계에 반영
+    서비스/관리자 화면/셸 어디서 저장하든 같은 트랜잭션에서 함께 갱신됨
+    (game 앱의 시그널이 ai 앱보다 먼저 등록되어 리뷰 요약 시그널은 갱신된 집계를 읽음)
+    """
+    previous = None if created else getattr(instance, "_counted_rating", UNKNOWN)
+
+    if previous is UNKNOWN:
+        # 이전 상태를 모르면(only/defer로 조회한 경우) 해당 게임만 다시 계산
+        values = compute_rating_stats([instance.game_id]).get(
+            instance.game_id, dict.fromkeys(STATS_FIELDS, 0)
+        )
+        GameRatingStats.objects.update_or_create(
+            game_id=instance.game_id, defaults=values
+        )
+    else:
+        apply_rating_change(instance.game_id, previous, instance.counted_rating)
+
+    instance._counted_rating = instance.counted_rating
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_stats_on_review_delete(sender, instance, **kwargs):
+    """
+    리뷰가 실제로 지워지면(회원 탈퇴 등) 집계에서 뺌
+    게임 삭제로 함께 지워지는 경우는 집계도 CASCADE로 삭제되므로 건너뜀
+    """
+    if isinstance(kwargs.get("origin"), Game):
+        return
+    apply_rating_change(
+        instance.game_id,
+        getattr(instance, "_counted_rating", instance.counted_rating),
+        None,
+    )
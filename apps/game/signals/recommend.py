@@ -0,0 +1,40 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game.models.game import Game
+from apps.game.models.game_genre import GameGenre
+from apps.game.models.game_tag import GameTag
+from apps.game.models.wishlist import Wishlist
+from apps.game.services.recommend import bump_recommend_version
+from apps.game.services.recommend_cache import schedule_recommend_refresh
+from apps.user.models.user import User
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+@receiver(post_save, sender=GameGenre)
+@receiver(post_delete, sender=GameGenre)
+@receiver(post_save, sender=GameTag)
+@receiver(post_delete, sender=GameTag)
+def bump_recommend_on_change(sender, instance, **kwargs):
+    """
+    관리자 화면 등에서 게임이나 게임의 태그/장르가 바뀌면 추천 행렬 버전을 올림
+    - QuerySet.delete()로 한꺼번에 지우는 경우(임포터 등)는 호출한 쪽에서 직접 올림
+    - 게임 삭제로 함께 지워지는 관계는 게임 쪽 시그널에서 한 번만 올림
+    """
+    if isinstance(kwargs.get("origin"), (QuerySet, Game)) and sender is not Game:
+        return
+    bump_recommend_version()
+
+
+@receiver(post_save, sender=Wishlist)
+@receiver(post_delete, sender=Wishlist)
+def refresh_recommendations_on_wishlist_change(sender, instance, **kwargs):
+    """
+    위시리스트가 바뀌면 커밋 후 그 사용자의 추천 목록을 다시 계산
+    사용자/게임 삭제로 함께 지워지는 경우는 건너뜀
+    """
+    if isinstance(kwargs.get("origin"), (Game, User)):
+        return
+    schedule_recommend_refresh(instance.user_id)
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game.models.genre import Genre
+from apps.game.models.tag import Tag
+from apps.game.services.taxonomy import bump_taxonomy_version
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def bump_taxonomy_on_change(sender, instance, **kwargs):
+    """
+    관리자 화면 등에서 장르/태그가 바뀌면 목록 버전을 올림
+    임포터의 bulk 작업은 임포터가 직접 올림
+    """
+    bump_taxonomy_version()
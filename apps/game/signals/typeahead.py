@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game.models.game import Game
+from apps.game.models.genre import Genre
+from apps.game.models.tag import Tag
+from apps.game.services.typeahead import bump_typeahead_version
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def bump_typeahead_on_change(sender, instance, **kwargs):
+    """
+    관리자 화면 등에서 게임/태그/장르가 바뀌면 자동완성 색인 버전을 올림
+    임포터의 bulk 작업은 임포터가 직접 올림
+    """
+    bump_typeahead_version()
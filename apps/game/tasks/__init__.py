@@ -0,0 +1,10 @@
+from .import_games import run_game_import
+from .recommend import run_nightly_recommend_refresh, run_recommend_refresh
+from .similar import run_similar_games_build
+
+__all__ = (
+    "run_game_import",
+    "run_recommend_refresh",
+    "run_nightly_recommend_refresh",
+    "run_similar_games_build",
+)
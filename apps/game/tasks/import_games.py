@@ -0,0 +1,26 @@
+from celery import shared_task  # type: ignore
+from apps.game.models.import_job import ImportJob
+from apps.game.services.importer import GameImportService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def run_game_import(job_id: int):
+    """
+    임포트 작업을 커서부터 실행 (워커가 죽으면 메시지가 재전달되어 체크포인트부터 재개)
+    """
+    try:
+        job = ImportJob.objects.get(id=job_id)
+    except ImportJob.DoesNotExist:
+        logger.error(f"ImportJob not found: {job_id}")
+        return
+
+    logger.info(f"Start Game Import Job: {job_id} (page {job.cursor_page})")
+
+    try:
+        GameImportService().run_job(job)
+        logger.info(f"Finished Game Import Job: {job_id} ({job.games_created} games)")
+    except Exception as e:
+        logger.error(f"Error in Game Import Task: {e}", exc_info=True)
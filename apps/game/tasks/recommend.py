@@ -0,0 +1,44 @@
+from celery import shared_task  # type: ignore
+from apps.game.models.wishlist import Wishlist
+from apps.game.services.recommend import recommend_index
+from apps.game.services.recommend_cache import refresh_user_recommendations
+from apps.preference.models import GenrePreference, TagPreference
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def run_recommend_refresh(user_id: int):
+    """
+    선호도/위시리스트가 바뀐 사용자의 추천 목록을 다시 계산해 캐시에 저장
+    """
+    try:
+        refresh_user_recommendations(user_id)
+    except Exception as e:
+        logger.error(f"Error in Recommend Refresh Task: {e}", exc_info=True)
+
+
+@shared_task
+def run_nightly_recommend_refresh():
+    """
+    선호도나 위시리스트가 있는 모든 사용자의 추천 목록을 다시 계산 (매일 밤, celery beat)
+    새로 추가된 게임과 태그 변경을 반영하며, 추천 행렬은 한 번만 읽어 모든 사용자에 사용
+    """
+    user_ids = (
+        set(TagPreference.objects.values_list("user_id", flat=True).distinct())
+        | set(GenrePreference.objects.values_list("user_id", flat=True).distinct())
+        | set(Wishlist.objects.values_list("user_id", flat=True).distinct())
+    )
+    index = recommend_index.rebuild()
+    logger.info(f"Start Nightly Recommend Refresh: {len(user_ids)} users")
+
+    failed = 0
+    for user_id in sorted(user_ids):
+        try:
+            refresh_user_recommendations(user_id, index=index)
+        except Exception as e:
+            failed += 1
+            logger.error(f"Error refreshing recommendations for User ID {user_id}: {e}")
+
+    logger.info(f"Finished Nightly Recommend Refresh ({failed} failed)")
@@ -0,0 +1,27 @@
+from celery import shared_task  # type: ignore
+from celery.exceptions import SoftTimeLimitExceeded  # type: ignore
+from django.conf import settings
+from apps.game.services.similarity import build_similar_games
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 다음 날 배치와 겹치지 않도록 실행 시간 제한 (soft 초과 시 중단하고 로그를 남김)
+SOFT_TIME_LIMIT = getattr(settings, "GAME_SIMILAR_SOFT_TIME_LIMIT", 60 * 60 * 2)
+TIME_LIMIT = getattr(settings, "GAME_SIMILAR_TIME_LIMIT", SOFT_TIME_LIMIT + 60 * 5)
+
+
+@shared_task(soft_time_limit=SOFT_TIME_LIMIT, time_limit=TIME_LIMIT)
+def run_similar_games_build():
+    """
+    모든 게임의 내용 기반 유사 게임을 다시 계산 (매일 밤, celery beat, game_batch 큐)
+    """
+    logger.info("Start Similar Games Build")
+
+    try:
+        built = build_similar_games()
+        logger.info(f"Finished Similar Games Build ({built} games)")
+    except SoftTimeLimitExceeded:
+        logger.error(f"Similar Games Build exceeded {SOFT_TIME_LIMIT}s, stopped")
+    except Exception as e:
+        logger.error(f"Error in Similar Games Build Task: {e}", exc_info=True)
@@ -0,0 +1,94 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.game.models import Game, GameImg, GameTag, Tag
+
+
+class GameBatchViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("game-batch")
+        tag = Tag.objects.create(tag="Action", slug="action", tag_ko="액션")
+        self.games = []
+        for i in range(5):
+            game = Game.objects.create(name=f"Game {i}", intro="", developer="Dev")
+            GameTag.objects.create(game=game, tag=tag)
+            GameImg.objects.create(game=game, img_url=f"https://img/{i}.jpg")
+            self.games.append(game)
+        self.deleted = Game.objects.create(
+            name="Deleted", intro="", developer="Dev", is_deleted=True
+        )
+
+    def ids(self, games):
+        return ",".join(str(game.id) for game in games)
+
+    def test_cards_in_requested_order(self):
+        requested = [self.games[3], self.deleted, self.games[0], self.games[3]]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"ids": self.ids(requested)})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [game["id"] for game in response.data["results"]],
+            [self.games[3].id, self.games[0].id],
+        )
+        self.assertEqual(response.data["results"][0]["tags"], ["Action"])
+
+    def test_details_share_queries_and_cache(self):
+        """상세는 id__in 한 번 + prefetch로 만들고, 이후에는 캐시에서 응답"""
+        # 1건은 미리 캐시에 저장
+        self.client.get(reverse("game-detail", args=[self.games[0].id]))
+
+        # 게임(+집계) 1회 + 관계 prefetch(이미지/장르/태그+태그 이름/플랫폼), 게임 수와 무관
+        with self.assertNumQueries(6):
+            response = self.client.get(
+                self.url, {"ids": self.ids(self.games), "view": "detail"}
+            )
+
+        results = response.data["results"]
+        self.assertEqual([game["id"] for game in results], [g.id for g in self.games])
+        self.assertEqual(results[1]["images"], ["https://img/1.jpg"])
+        self.assertEqual(
+            results[0],
+            self.client.get(reverse("game-detail", args=[self.games[0].id])).data,
+        )
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {"ids": self.ids(self.games), "view": "detail"})
+
+    def test_evicted_version_key_does_not_serve_stale_detail(self):
+        """버전 키가 캐시에서 밀려나도 이전에 저장한 상세 응답이 다시 맞지 않음"""
+        params = {"ids": self.ids(self.games[:1]), "view": "detail"}
+        self.client.get(self.url, params)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.games[0].name = "New Name"
+            self.games[0].save()
+        cache.delete(f"game:detail:version:{self.games[0].id}")
+
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.data["results"][0]["name"], "New Name")
+
+    def test_missing_ids_create_no_version_keys(self):
+        """없는 게임 id로 조회해도 버전 키를 만들지 않음"""
+        missing_id = self.deleted.id + 1000
+        params = {"ids": f"{self.games[0].id},{missing_id},{self.deleted.id}"}
+
+        response = self.client.get(self.url, {**params, "view": "detail"})
+
+        self.assertEqual(
+            [game["id"] for game in response.data["results"]], [self.games[0].id]
+        )
+        self.assertIsNotNone(cache.get(f"game:detail:version:{self.games[0].id}"))
+        self.assertIsNone(cache.get(f"game:detail:version:{missing_id}"))
+        self.assertIsNone(cache.get(f"game:detail:version:{self.deleted.id}"))
+
+    def test_invalid_ids(self):
+        for ids in ["", "1,a", ",".join(str(i) for i in range(1, 102))]:
+            response = self.client.get(self.url, {"ids": ids})
+            self.assertEqual(response.status_code, 400, ids)
@@ -0,0 +1,108 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core.conditional import VERSION_KEY_TIMEOUT
+from apps.game.models import Game, GameTag, Genre, Tag
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.game = Game.objects.create(name="Old Name", intro="", developer="Dev")
+        self.tag = Tag.objects.create(tag="Action", slug="action", tag_ko="액션")
+        GameTag.objects.create(game=self.game, tag=self.tag)
+        Genre.objects.create(genre="RPG", slug="rpg")
+
+    def assert_revalidates(self, url, max_age=None):
+        """
+        첫 응답의 ETag로 다시 요청하면 DB 조회 없이 304, 반환값은 ETag
+        """
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        if max_age is not None:
+            self.assertIn(f"max-age={max_age}", response["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        return etag
+
+    def test_detail_not_modified_until_game_changes(self):
+        url = reverse("game-detail", args=[self.game.id])
+        etag = self.assert_revalidates(url)
+        self.assertIn("no-cache", self.client.get(url)["Cache-Control"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.game.name = "New Name"
+            self.game.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["name"], "New Name")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_not_modified_until_cards_change(self):
+        url = reverse("game-list")
+        etag = self.assert_revalidates(url, max_age=60)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Game.objects.create(name="New Game", intro="", developer="Dev")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_taxonomy_not_modified_until_tag_changes(self):
+        self.assert_revalidates(reverse("genre_list"), max_age=3600)
+        etag = self.assert_revalidates(reverse("tag_list"), max_age=3600)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.create(tag="Puzzle", slug="puzzle")
+
+        response = self.client.get(reverse("tag_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+
+    def test_version_survives_cache_eviction(self):
+        """버전 키가 캐시에서 사라져도 이전에 준 ETag와 겹치지 않음"""
+        url = reverse("game-detail", args=[self.game.id])
+        etag = self.client.get(url)["ETag"]
+
+        cache.clear()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_missing_game_has_no_etag(self):
+        response = self.client.get(reverse("game-detail", args=[self.game.id + 100]))
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_missing_game_does_not_create_version_key(self):
+        """없는 게임 id로 요청해도 버전 키를 만들지 않음"""
+        missing_id = self.game.id + 100
+        self.client.get(reverse("game-detail", args=[missing_id]))
+
+        self.assertIsNone(cache.get(f"game:detail:version:{missing_id}"))
+
+    def test_version_keys_expire(self):
+        """버전 키는 기한을 두고 저장하여 캐시에 계속 쌓이지 않음"""
+        with mock.patch.object(cache, "add", wraps=cache.add) as add:
+            self.client.get(reverse("game-detail", args=[self.game.id]))
+
+        add.assert_any_call(
+            f"game:detail:version:{self.game.id}",
+            mock.ANY,
+            timeout=VERSION_KEY_TIMEOUT,
+        )
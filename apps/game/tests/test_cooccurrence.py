@@ -0,0 +1,147 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.game.models import Game, WishlistCooccurrence
+from apps.game.models.wishlist import Wishlist
+from apps.game.services.cooccurrence import (
+    reconcile_wishlist_cooccurrence,
+    similar_game_ids,
+)
+from apps.user.models.user import User
+
+
+def create_user(index):
+    return User.objects.create_user(
+        email=f"user{index}@test.com",
+        password="test1234",
+        nickname=f"user{index}",
+        phone_number=f"010-0000-{index:04d}",
+    )
+
+
+class WishlistCooccurrenceTest(TestCase):
+    def setUp(self):
+        self.games = [
+            Game.objects.create(name=f"Game {i}", intro="", developer="Dev")
+            for i in range(4)
+        ]
+        self.users = [create_user(i) for i in range(3)]
+
+    def wish(self, user, *games):
+        return [Wishlist.objects.create(user=user, game=game) for game in games]
+
+    def counts(self):
+        return {
+            (row.game_id, row.other_game_id): row.count
+            for row in WishlistCooccurrence.objects.all()
+        }
+
+    def expected_counts(self):
+        """위시리스트 테이블을 직접 세어 본 값 (증분 갱신 결과와 비교)"""
+        games_by_user = {}
+        for user_id, game_id in Wishlist.objects.values_list("user_id", "game_id"):
+            games_by_user.setdefault(user_id, set()).add(game_id)
+        counts = {}
+        for game_ids in games_by_user.values():
+            for a in game_ids:
+                for b in game_ids - {a}:
+                    counts[(a, b)] = counts.get((a, b), 0) + 1
+        return counts
+
+    def test_counts_pairs_in_both_directions(self):
+        g0, g1, g2, _ = self.games
+        self.wish(self.users[0], g0, g1, g2)
+        self.wish(self.users[1], g0, g1)
+
+        self.assertEqual(self.counts(), self.expected_counts())
+        self.assertEqual(self.counts()[(g0.id, g1.id)], 2)
+        self.assertEqual(self.counts()[(g2.id, g0.id)], 1)
+
+    def test_delete_decrements_and_drops_empty_pairs(self):
+        g0, g1, g2, _ = self.games
+        self.wish(self.users[0], g0, g1)
+        (wishlist,) = self.wish(self.users[0], g2)
+        self.wish(self.users[1], g0, g2)
+
+        wishlist.delete()
+
+        self.assertEqual(self.counts(), self.expected_counts())
+        self.assertNotIn((g1.id, g2.id), self.counts())
+
+    def test_duplicate_rows_count_once(self):
+        g0, g1, _, _ = self.games
+        self.wish(self.users[0], g0, g1)
+        (duplicate,) = self.wish(self.users[0], g1)
+        self.assertEqual(self.counts()[(g0.id, g1.id)], 1)
+
+        duplicate.delete()
+        self.assertEqual(self.counts()[(g0.id, g1.id)], 1)
+
+    def test_user_and_game_deletion(self):
+        g0, g1, g2, g3 = self.games
+        self.wish(self.users[0], g0, g1, g2)
+        self.wish(self.users[1], g0, g1, g3)
+
+        self.users[0].delete()
+        self.assertEqual(self.counts(), self.expected_counts())
+
+        g3.delete()
+        self.assertEqual(self.counts(), self.expected_counts())
+
+    def test_similar_endpoint_orders_by_count(self):
+        g0, g1, g2, g3 = self.games
+        self.wish(self.users[0], g0, g1, g2)
+        self.wish(self.users[1], g0, g1)
+        self.wish(self.users[2], g0, g3, g1)
+        g3.is_deleted = True
+        g3.save()
+
+        self.assertEqual(similar_game_ids(g0.id), [g1.id, g2.id, g3.id])
+
+        with self.assertNumQueries(2):
+            response = APIClient().get(reverse("game-similar", args=[g0.id]))
+
+        self.assertEqual(response.status_code, 200)
+        # 삭제된 게임은 카드가 없어 제외
+        self.assertEqual(
+            [game["id"] for game in response.data["results"]], [g1.id, g2.id]
+        )
+
+    def test_similar_endpoint_missing_game(self):
+        """없거나 삭제된 게임은 404"""
+        g0 = self.games[0]
+        g0.is_deleted = True
+        g0.save()
+
+        for game_id in (g0.id, self.games[-1].id + 100):
+            response = APIClient().get(reverse("game-similar", args=[game_id]))
+            self.assertEqual(response.status_code, 404)
+
+    def test_reconcile_fixes_drift(self):
+        """동시 추가 등으로 빠지거나 틀어진 쌍을 위시리스트 테이블 기준으로 바로잡음"""
+        g0, g1, g2, g3 = self.games
+        self.wish(self.users[0], g0, g1, g2)
+        self.wish(self.users[1], g0, g1)
+        expected = self.expected_counts()
+
+        # 빠진 쌍, 틀린 수, 남은 쌍
+        WishlistCooccurrence.objects.filter(game=g2, other_game=g0).delete()
+        WishlistCooccurrence.objects.filter(game=g0, other_game=g1).update(count=5)
+        WishlistCooccurrence.objects.create(game=g3, other_game=g0, count=1)
+
+        self.assertEqual(
+            reconcile_wishlist_cooccurrence(dry_run=True),
+            sorted([(g2.id, g0.id), (g0.id, g1.id), (g3.id, g0.id)]),
+        )
+        self.assertNotEqual(self.counts(), expected)
+
+        out = StringIO()
+        call_command("reconcile_wishlist_cooccurrence", stdout=out)
+
+        self.assertIn("3개", out.getvalue())
+        self.assertEqual(self.counts(), expected)
+        self.assertEqual(reconcile_wishlist_cooccurrence(), [])
@@ -0,0 +1,85 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.services.review.review_create_service import create_review
+from apps.game.models import Game, GameTag, Tag
+from apps.user.models.user import User
+
+
+class GameDetailCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.game = Game.objects.create(name="Old Name", intro="", developer="Dev")
+        self.tag = Tag.objects.create(tag="Action", slug="action", tag_ko="액션")
+        GameTag.objects.create(game=self.game, tag=self.tag)
+        self.url = reverse("game-detail", args=[self.game.id])
+
+    def get_detail(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.get_detail()
+
+        with self.assertNumQueries(0):
+            second = self.get_detail()
+
+        self.assertEqual(first, second)
+
+    def test_admin_edit_invalidates(self):
+        """게임을 직접 저장하면 커밋 후 버전이 올라 새 값으로 응답"""
+        self.get_detail()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.game.name = "New Name"
+            self.game.save()
+
+        self.assertEqual(self.get_detail()["name"], "New Name")
+
+    def test_tag_rename_invalidates(self):
+        self.get_detail()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tag.tag = "Action RPG"
+            self.tag.save()
+
+        self.assertEqual(self.get_detail()["tags"], ["Action RPG"])
+
+    def test_review_invalidates(self):
+        user = User.objects.create_user(
+            email="test@test.com",
+            password="test1234",
+            nickname="test_user",
+            phone_number="010-0000-0000",
+        )
+        self.assertEqual(self.get_detail()["avg_score"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_review(
+                author=user,
+                game_id=self.game.id,
+                validated_data={"content": "좋아요", "rating": 4},
+            )
+
+        self.assertEqual(self.get_detail()["avg_score"], 4)
+
+    def test_stale_detail_is_served_while_another_request_rebuilds(self):
+        """다른 요청이 다시 만드는 중이면 이전 버전 응답을 DB 조회 없이 반환"""
+        self.get_detail()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.game.name = "New Name"
+            self.game.save()
+        cache.add(f"single-flight:game:detail:{self.game.id}", "other")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_detail()["name"], "Old Name")
+
+    def test_missing_game_is_not_cached(self):
+        url = reverse("game-detail", args=[self.game.id + 1000])
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertIsNone(cache.get(f"game:detail:{self.game.id + 1000}"))
@@ -0,0 +1,245 @@
+import threading
+import time
+from datetime import date
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from unittest import mock
+
+from apps.game.models import (
+    Game,
+    GameGenre,
+    GamePlatform,
+    GameTag,
+    Genre,
+    Platform,
+    Tag,
+)
+from apps.game.services.facets import (
+    FacetIndex,
+    FacetIndexHolder,
+    GameFacets,
+    get_facet_version,
+)
+
+
+class FacetIndexTest(TestCase):
+    def setUp(self):
+        self.index = FacetIndex()
+        games = {
+            1: (date(2020, 5, 1), [("genre", "rpg"), ("platform", "pc")]),
+            2: (date(2020, 5, 1), [("genre", "rpg"), ("platform", "ps5")]),
+            3: (date(2021, 1, 3), [("genre", "action"), ("platform", "pc")]),
+            4: (date(2019, 7, 9), [("genre", "rpg"), ("genre", "action")]),
+            5: (None, [("platform", "pc")]),
+        }
+        for game_id, (released, values) in games.items():
+            facets = GameFacets(
+                released_sort=(released or date(1, 1, 1)).toordinal(),
+                values=values + ([("year", str(released.year))] if released else []),
+            )
+            self.index.add(game_id, facets)
+
+    def ids(self, result):
+        return self.index.page(result, 0, 100)
+
+    def test_filter_intersects_facets_and_unions_values(self):
+        result, _ = self.index.filter({"genre": ["rpg"], "platform": ["pc"]})
+        self.assertEqual(self.ids(result), [1])
+
+        result, _ = self.index.filter({"platform": ["pc", "ps5"]})
+        self.assertEqual(self.ids(result), [3, 2, 1, 5])
+
+        result, _ = self.index.filter({"genre": ["unknown"]})
+        self.assertEqual(self.ids(result), [])
+
+    def test_counts_exclude_own_facet(self):
+        """선택한 패싯의 다른 값 개수는 나머지 필터만 적용한 기준"""
+        _, counts = self.index.filter({"genre": ["rpg"]})
+
+        self.assertEqual(counts["genre"], [("rpg", 3), ("action", 2)])
+        self.assertEqual(counts["platform"], [("pc", 1), ("ps5", 1)])
+        self.assertEqual(counts["year"], [("2020", 2), ("2019", 1)])
+
+    def test_page_orders_by_release_then_id(self):
+        result = self.index.all_games
+
+        self.assertEqual(self.ids(result), [3, 2, 1, 4, 5])
+        self.assertEqual(self.index.page(result, 1, 2), [2, 1])
+        self.assertEqual(self.index.page(result, 3, 10), [4, 5])
+
+    def test_remove_and_re_add(self):
+        self.index.remove(1)
+        self.index.add(
+            1, GameFacets(released_sort=date(2022, 1, 1).toordinal(), values=[])
+        )
+
+        result, counts = self.index.filter({"genre": ["rpg"]})
+        self.assertEqual(self.ids(result), [2, 4])
+        self.assertEqual(self.ids(self.index.all_games)[0], 1)
+
+
+class FacetIndexHolderTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.holder = FacetIndexHolder(check_interval=0, background=False)
+        self.rpg = Genre.objects.create(genre="RPG", slug="rpg", genre_ko="롤플레잉")
+        self.game = Game.objects.create(
+            name="Game", intro="", developer="Dev", released_at=date(2020, 1, 1)
+        )
+
+    def test_changes_are_applied_incrementally(self):
+        index = self.holder.get()
+        self.assertEqual(index.filter({"genre": ["rpg"]})[0], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            GameGenre.objects.create(game=self.game, genre=self.rpg)
+
+        with mock.patch("apps.game.services.facets.build_facet_index") as build:
+            index = self.holder.get()
+        build.assert_not_called()
+
+        result, counts = index.filter({"genre": ["rpg"]})
+        self.assertEqual(index.page(result, 0, 10), [self.game.id])
+        self.assertEqual(counts["year"], [("2020", 1)])
+
+    def test_deleted_game_is_removed(self):
+        self.holder.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.game.is_deleted = True
+            self.game.save()
+
+        self.assertEqual(self.holder.get().all_games, 0)
+
+    def test_hard_deleted_game_without_relations_is_removed(self):
+        """장르/플랫폼/태그가 없는 게임도 행을 지우면 색인에서 빠짐"""
+        index = self.holder.get()
+        self.assertIn(self.game.id, index.games)
+        game_id = self.game.id
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.game.delete()
+
+        with mock.patch("apps.game.services.facets.build_facet_index") as build:
+            index = self.holder.get()
+        build.assert_not_called()
+
+        self.assertNotIn(game_id, index.games)
+        self.assertEqual(index.all_games, 0)
+
+    def test_missing_change_log_rebuilds(self):
+        self.holder.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            GameGenre.objects.create(game=self.game, genre=self.rpg)
+        version = get_facet_version()
+        cache.delete(f"game:facets:changes:{version}")
+
+        index = self.holder.get()
+
+        self.assertEqual(index.version, version)
+        self.assertEqual(index.filter({"genre": ["rpg"]})[1]["genre"], [("rpg", 1)])
+
+
+class FacetBackgroundRebuildTest(SimpleTestCase):
+    def test_get_does_not_wait_for_rebuild(self):
+        """전체 재생성 중에도 조회는 기다리지 않고 기존 색인을 바로 반환"""
+        holder = FacetIndexHolder(check_interval=0, background=True)
+        released = threading.Event()
+        started = threading.Event()
+
+        def slow_build(version):
+            started.set()
+            released.wait(5)
+            return FacetIndex(version)
+
+        with (
+            mock.patch("apps.game.services.facets.get_facet_version", return_value=1),
+            mock.patch("apps.game.services.facets.build_facet_index", FacetIndex),
+        ):
+            old = holder.get()
+
+        with (
+            mock.patch("apps.game.services.facets.get_facet_version", return_value=500),
+            mock.patch("apps.game.services.facets.build_facet_index", slow_build),
+        ):
+            try:
+                holder.get()
+                self.assertTrue(started.wait(5))
+
+                begin = time.monotonic()
+                for _ in range(3):
+                    self.assertIs(holder.get(), old)
+                self.assertLess(time.monotonic() - begin, 0.5)
+            finally:
+                released.set()
+
+            deadline = time.monotonic() + 5
+            while holder.get().version != 500 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(holder.get().version, 500)
+
+
+class GameBrowseViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("game-browse")
+
+        rpg = Genre.objects.create(genre="RPG", slug="rpg", genre_ko="롤플레잉")
+        pc = Platform.objects.create(platform="PC", slug="pc")
+        ps5 = Platform.objects.create(platform="PlayStation 5", slug="ps5")
+        indie = Tag.objects.create(tag="Indie", slug="indie", tag_ko="인디")
+
+        self.games = []
+        for i in range(12):
+            game = Game.objects.create(
+                name=f"Game {i}",
+                intro="",
+                developer="Dev",
+                released_at=date(2010 + i, 1, 1),
+            )
+            GameGenre.objects.create(game=game, genre=rpg)
+            GamePlatform.objects.create(game=game, platform=pc if i % 2 else ps5)
+            if i < 3:
+                GameTag.objects.create(game=game, tag=indie)
+            self.games.append(game)
+
+        holder = FacetIndexHolder(check_interval=60, background=False)
+        holder.warm()
+        patcher = mock.patch("apps.game.views.game_views.facet_index", holder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_filtered_listing_with_facet_counts(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url, {"genre": "rpg", "platform": "pc,ps5", "year": "2021"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["name"], "Game 11")
+        self.assertEqual(
+            response.data["facets"]["platform"],
+            [{"value": "pc", "label": "PC", "count": 1}],
+        )
+        self.assertEqual(
+            response.data["facets"]["genre"],
+            [{"value": "rpg", "label": "롤플레잉", "count": 1}],
+        )
+        self.assertEqual(len(response.data["facets"]["year"]), 12)
+
+    def test_pages_in_release_order(self):
+        response = self.client.get(self.url, {"genre": "rpg", "page": 2})
+
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(
+            [game["name"] for game in response.data["results"]], ["Game 1", "Game 0"]
+        )
+        self.assertEqual(
+            response.data["facets"]["tag"],
+            [{"value": "indie", "label": "인디", "count": 3}],
+        )
@@ -0,0 +1,57 @@
+from io import StringIO
+
+import requests
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.game.models import Game
+from apps.game.services.fake_rawg import FakeRawgServer
+from apps.game.services.rawg import RawgClient
+
+
+class FakeRawgServerTest(TestCase):
+    def test_serves_rawg_endpoints(self):
+        """목록/상세/스크린샷 엔드포인트가 RAWG 응답 형식으로 합성 데이터를 반환"""
+        with FakeRawgServer(total_games=45, id_offset=100) as server:
+            client = RawgClient(base_url=server.url)
+
+            first_page = client.fetch_games_page(1)
+            last_page = client.fetch_games_page(2)
+            detail = client.fetch_game_detail(101)
+            screenshots = client.fetch_game_screenshots(101)
+
+        self.assertEqual(len(first_page["results"]), 40)
+        self.assertEqual(first_page["results"][0]["id"], 101)
+        self.assertIsNotNone(first_page["next"])
+        self.assertEqual(len(last_page["results"]), 5)
+        self.assertIsNone(last_page["next"])
+        self.assertEqual(detail["name"], first_page["results"][0]["name"])
+        self.assertTrue(detail["tags"])
+        self.assertTrue(screenshots["results"])
+        self.assertEqual(server.requests, 4)
+
+    def test_error_rate_triggers_retries(self):
+        """error_rate만큼 503을 반환하여 클라이언트의 재시도 경로를 거치게 함"""
+        with FakeRawgServer(total_games=1, error_rate=1.0) as server:
+            client = RawgClient(base_url=server.url, max_retries=2, backoff_base=0.001)
+
+            with self.assertRaises(requests.HTTPError):
+                client.fetch_game_detail(1)
+
+        self.assertEqual(server.errors, 3)
+        self.assertEqual(client.get_stats()["game_detail"]["retries"], 2)
+
+
+class BenchmarkImportCommandTest(TestCase):
+    def test_benchmark_reports_metrics_and_rolls_back(self):
+        """벤치마크는 처리량/쿼리 수/메모리를 출력하고 기본적으로 결과를 남기지 않음"""
+        out = StringIO()
+
+        call_command("benchmark_import", games=12, chunk_size=5, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("12개 추가", output)
+        self.assertIn("games/sec", output)
+        self.assertIn("queries/game", output)
+        self.assertIn("최대 메모리", output)
+        self.assertEqual(Game.objects.count(), 0)
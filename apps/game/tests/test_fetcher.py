@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+
+from apps.game.services.fetcher import RawgFetcher
+from apps.game.services.rate_limiter import TokenBucket
+from apps.game.services.rawg import RawgClient
+
+
+class FakeClock:
+    """테스트용 가짜 시계 (sleep 호출 시 시간만 흐르게 함)"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(
+            rate=2, capacity=2, clock=self.clock.time, sleep=self.clock.sleep
+        )
+
+    def test_acquire_within_capacity_does_not_wait(self):
+        """버킷 용량 안에서는 대기 없이 토큰을 꺼냄"""
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertEqual(self.clock.slept, [])
+
+    def test_acquire_waits_until_refilled(self):
+        """토큰이 떨어지면 초당 rate 속도로 채워질 때까지 대기"""
+        self.bucket.acquire()
+        self.bucket.acquire()
+
+        waited = self.bucket.acquire()
+
+        self.assertAlmostEqual(waited, 0.5)
+        self.assertAlmostEqual(self.clock.now, 0.5)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class RawgFetcherTest(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.fetch_game_detail.side_effect = lambda game_id: {
+            "id": game_id,
+            "name": f"Game {game_id}",
+        }
+        self.client.fetch_game_screenshots.return_value = {
+            "results": [{"image": f"https://img/{i}.jpg"} for i in range(5)]
+        }
+        self.fetcher = RawgFetcher(
+            client=self.client,
+            max_workers=4,
+            rate_limiter=TokenBucket(rate=1000, capacity=1000),
+        )
+
+    def test_fetch_collects_detail_and_screenshots(self):
+        """모든 게임의 상세 정보와 스크린샷(최대 3장)을 수집"""
+        raw_games = [{"id": i, "name": f"Game {i}"} for i in range(10)]
+
+        bundles = self.fetcher.fetch(raw_games)
+
+        self.assertEqual(set(bundles), set(range(10)))
+        self.assertEqual(bundles[3].detail["name"], "Game 3")
+        self.assertEqual(len(bundles[3].screenshots), 3)
+        self.assertEqual(self.fetcher.stats.games, 10)
+        self.assertEqual(self.fetcher.stats.requests, 20)
+
+    def test_rate_limiter_is_shared_with_client(self):
+        """클라이언트가 요청(재시도 포함)마다 같은 버킷에서 토큰을 꺼내도록 연결"""
+        self.assertIs(self.client.rate_limiter, self.fetcher.rate_limiter)
+
+        client = RawgClient()
+        fetcher = RawgFetcher(client=client)
+        self.assertIsNotNone(client.rate_limiter)
+        self.assertIs(RawgFetcher(client=client).rate_limiter, fetcher.rate_limiter)
+
+    def test_fetch_detail_failure_is_isolated(self):
+        """상세 조회 실패는 해당 게임에만 기록되고 나머지는 정상 수집"""
+
+        def detail(game_id):
+            if game_id == 2:
+                raise RuntimeError("boom")
+            return {"id": game_id}
+
+        self.client.fetch_game_detail.side_effect = detail
+
+        bundles = self.fetcher.fetch([{"id": 1}, {"id": 2}])
+
+        self.assertIsNone(bundles[1].error)
+        self.assertEqual(bundles[2].error, "boom")
+        self.assertIsNone(bundles[2].detail)
+        self.assertEqual(self.fetcher.stats.failed, 1)
+
+    def test_fetch_screenshot_failure_keeps_detail(self):
+        """스크린샷 조회가 실패해도 상세 정보는 유지"""
+        self.client.fetch_game_screenshots.side_effect = RuntimeError("timeout")
+
+        bundles = self.fetcher.fetch([{"id": 1}])
+
+        self.assertIsNotNone(bundles[1].detail)
+        self.assertEqual(bundles[1].screenshots, [])
+        self.assertIsNone(bundles[1].error)
@@ -0,0 +1,238 @@
+from datetime import date
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.game.models import (
+    Game,
+    GameCard,
+    GameImg,
+    GamePlatform,
+    GameTag,
+    Platform,
+    Tag,
+)
+from apps.game.services.game_card import refresh_game_cards
+from apps.game.services.importer import GameImportService
+from apps.game.services.recommend import RecommendIndexHolder
+from apps.game.services.translation import FakeTranslationBackend, TranslationCache
+from apps.game.tests.test_importer import make_detail
+from apps.preference.models import TagPreference
+from apps.user.models.user import User
+
+
+def create_game(name, released_at=None, tags=(), platforms=(), images=()):
+    game = Game.objects.create(
+        name=name, intro="", developer="Dev", publisher="Pub", released_at=released_at
+    )
+    GameTag.objects.bulk_create([GameTag(game=game, tag=tag) for tag in tags])
+    GamePlatform.objects.bulk_create(
+        [GamePlatform(game=game, platform=platform) for platform in platforms]
+    )
+    GameImg.objects.bulk_create([GameImg(game=game, img_url=url) for url in images])
+    return game
+
+
+class GameCardRefreshTest(TestCase):
+    def setUp(self):
+        self.action = Tag.objects.create(tag="Action", slug="action", tag_ko="액션")
+        self.indie = Tag.objects.create(tag="Indie", slug="indie", tag_ko="인디")
+        self.pc = Platform.objects.create(platform="PC", slug="pc")
+
+    def test_refresh_builds_card_from_relations(self):
+        """카드에 첫 번째 이미지와 태그/플랫폼 이름이 저장 순서대로 들어감"""
+        game = create_game(
+            "Doom",
+            date(2024, 1, 1),
+            tags=[self.indie, self.action],
+            platforms=[self.pc],
+            images=["https://img/1.jpg", "https://img/2.jpg"],
+        )
+
+        refresh_game_cards([game.id])
+
+        card = GameCard.objects.get(game=game)
+        self.assertEqual(card.name, "Doom")
+        self.assertEqual(card.image_url, "https://img/1.jpg")
+        self.assertEqual(card.tags, ["Indie", "Action"])
+        self.assertEqual(card.platforms, ["PC"])
+
+    def test_refresh_query_count_does_not_depend_on_game_count(self):
+        """게임 수와 관계없이 일정한 쿼리 수로 갱신"""
+        games = [
+            create_game(f"Game {i}", tags=[self.action], images=["https://img"])
+            for i in range(10)
+        ]
+
+        with self.assertNumQueries(6):
+            refresh_game_cards(game.id for game in games)
+
+        self.assertEqual(GameCard.objects.count(), 10)
+
+    def test_signals_keep_card_in_sync(self):
+        """단건 저장/삭제(관리자 수정 등)는 시그널로 카드에 반영"""
+        game = create_game("Doom")
+        GameTag.objects.create(game=game, tag=self.action)
+        GameImg.objects.create(game=game, img_url="https://img/cover.jpg")
+        self.action.tag = "Action Game"
+        self.action.save()
+
+        card = GameCard.objects.get(game=game)
+        self.assertEqual(card.tags, ["Action Game"])
+        self.assertEqual(card.image_url, "https://img/cover.jpg")
+
+        game.game_tags.get().delete()
+        self.assertEqual(GameCard.objects.get(game=game).tags, [])
+
+    def test_deleted_game_has_no_card(self):
+        """삭제 처리된 게임은 카드를 지우고, 실제 삭제 시에도 오류 없이 정리"""
+        game = create_game("Doom", tags=[self.action], images=["https://img"])
+        self.assertTrue(GameCard.objects.filter(game=game).exists())
+
+        game.is_deleted = True
+        game.save()
+        self.assertFalse(GameCard.objects.filter(game=game).exists())
+
+        other = create_game("Quake", tags=[self.action], images=["https://img"])
+        other.delete()
+        self.assertFalse(GameCard.objects.exists())
+
+    def test_importer_writes_cards(self):
+        """임포터가 새로 저장하거나 갱신한 게임의 카드를 함께 갱신"""
+        service = GameImportService(
+            translation_cache=TranslationCache(backend=FakeTranslationBackend())
+        )
+
+        service.import_records([make_detail(1)])
+
+        card = GameCard.objects.get(game__rawg_id=1)
+        self.assertEqual(card.tags, ["Singleplayer", "Tag 1"])
+        self.assertEqual(card.platforms, ["PC"])
+        self.assertEqual(card.image_url, "https://img/1/bg.jpg")
+
+
+class GameListCardViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.action = Tag.objects.create(tag="Action", slug="action", tag_ko="액션")
+        self.pc = Platform.objects.create(platform="PC", slug="pc")
+        for i in range(45):
+            create_game(
+                f"Game {i}",
+                date(2020, 1, 1 + i % 28),
+                tags=[self.action] if i % 2 else [],
+                platforms=[self.pc],
+                images=[f"https://img/{i}.jpg"],
+            )
+        refresh_game_cards(Game.objects.values_list("id", flat=True))
+
+    def test_list_page_is_served_from_cards(self):
+        """40개 페이지도 카드 테이블 조회(개수 + 페이지)만으로 응답"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("game-list"), {"page_size": 40})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 45)
+        first = response.data["results"][0]
+        self.assertEqual(
+            set(first), {"id", "name", "tags", "image", "released_at", "platforms"}
+        )
+        self.assertEqual(first["platforms"], ["PC"])
+
+    def test_search_by_tag_uses_cards(self):
+        """태그 검색 결과도 카드로 응답"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("game-search"), {"q": "action"})
+
+        self.assertEqual(response.data["count"], 22)
+        self.assertEqual(response.data["results"][0]["tags"], ["Action"])
+
+
+class GameCursorPaginationTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("game-list")
+        # 같은 출시일과 출시일 없는 게임이 섞여 있어도 순서가 안정적이어야 함
+        for i in range(25):
+            create_game(f"Game {i}", date(2020, 1, 1 + i % 5) if i % 7 else None)
+
+    def collect_pages(self, page_size):
+        ids = []
+        response = self.client.get(self.url, {"cursor": "", "page_size": page_size})
+        pages = 0
+        while True:
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            ids.extend(game["id"] for game in response.data["results"])
+            pages += 1
+            if not response.data["next"]:
+                return ids, pages
+            response = self.client.get(response.data["next"])
+
+    def test_cursor_pages_cover_catalog_in_order(self):
+        """커서로 끝까지 넘기면 페이지 번호 방식과 같은 순서로 모든 게임을 한 번씩 반환"""
+        ids, pages = self.collect_pages(page_size=4)
+
+        expected = list(
+            GameCard.objects.order_by("-released_sort", "-game_id").values_list(
+                "game_id", flat=True
+            )
+        )
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 7)
+        # 출시일 없는 게임은 마지막에 위치
+        self.assertIsNone(GameCard.objects.get(game_id=ids[-1]).released_at)
+
+        page_response = self.client.get(self.url, {"page_size": 25})
+        self.assertEqual([game["id"] for game in page_response.data["results"]], ids)
+
+    def test_cursor_page_is_single_query(self):
+        """커서 페이지는 COUNT 없이 쿼리 한 번으로 조회"""
+        first = self.client.get(self.url, {"cursor": "", "page_size": 5})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(first.data["next"])
+
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_invalid_cursor_returns_400(self):
+        for cursor in ["not-base64!", "WyJhYmMiLCAxXQ==", "WzFd"]:
+            response = self.client.get(self.url, {"cursor": cursor})
+            self.assertEqual(response.status_code, 400, cursor)
+
+    def test_recommend_cursor_keeps_matching_tag_order(self):
+        """추천 목록도 (점수, 출시일, id) 커서로 순서대로 넘김"""
+        user = User.objects.create_user(
+            email="user@test.com",
+            password="test1234",
+            nickname="user",
+            phone_number="010-1111-1111",
+        )
+        action = Tag.objects.create(tag="Action", slug="action", tag_ko="액션")
+        indie = Tag.objects.create(tag="Indie", slug="indie", tag_ko="인디")
+        TagPreference.objects.create(user=user, tag=action)
+        TagPreference.objects.create(user=user, tag=indie)
+        both = [create_game(f"Both {i}", tags=[action, indie]) for i in range(3)]
+        one = [create_game(f"One {i}", tags=[action]) for i in range(3)]
+        holder = RecommendIndexHolder(check_interval=60, background=False)
+        holder.warm()
+        patcher = mock.patch(
+            "apps.game.services.recommend_cache.recommend_index", holder
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client.force_authenticate(user=user)
+        url = reverse("game-recommend-preference")
+
+        ids = []
+        response = self.client.get(url, {"cursor": "", "page_size": 2})
+        while True:
+            ids.extend(game["id"] for game in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(ids[:3], sorted((game.id for game in both), reverse=True))
+        self.assertEqual(ids[3:], sorted((game.id for game in one), reverse=True))
@@ -0,0 +1,88 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.game.choices import ImportJobStatus
+from apps.game.models import ImportJob
+from apps.user.models.user import User
+
+
+class GameImportAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("game-import")
+        self.admin = User.objects.create_user(
+            email="admin@test.com",
+            password="test1234",
+            nickname="admin",
+            phone_number="010-0000-0000",
+            is_staff=True,
+        )
+        self.user = User.objects.create_user(
+            email="user@test.com",
+            password="test1234",
+            nickname="user",
+            phone_number="010-1111-1111",
+        )
+
+    @patch("apps.game.views.import_views.run_game_import.delay")
+    def test_post_enqueues_job_and_returns_id(self, mock_delay):
+        """임포트 요청은 작업을 큐에 넣고 202와 작업 id를 바로 반환"""
+        self.client.force_authenticate(user=self.admin)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(self.url, {"pages": 3}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job = ImportJob.objects.get(id=response.data["job_id"])
+        self.assertEqual(job.max_pages, 3)
+        self.assertEqual(job.status, ImportJobStatus.PENDING)
+        # 커밋 전에는 큐에 넣지 않음
+        mock_delay.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+        mock_delay.assert_called_once_with(job.id)
+
+    def test_post_forbidden_for_normal_user(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_status_reports_progress_and_eta(self):
+        """진행 상황 조회 시 카운터와 경과 시간, 예상 남은 시간 반환"""
+        job = ImportJob.objects.create(
+            max_pages=2,
+            chunk_size=20,
+            status=ImportJobStatus.RUNNING,
+            pages_fetched=1,
+            games_processed=40,
+            games_created=35,
+            relations_written=500,
+            translation_cache_hits=12,
+            started_at=timezone.now() - timedelta(seconds=60),
+        )
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(reverse("game-import-status", args=[job.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["games_created"], 35)
+        self.assertEqual(response.data["relations_written"], 500)
+        self.assertEqual(response.data["translation_cache_hits"], 12)
+        self.assertAlmostEqual(response.data["elapsed_seconds"], 60, delta=2)
+        self.assertAlmostEqual(response.data["eta_seconds"], 60, delta=2)
+
+    def test_status_not_found(self):
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(reverse("game-import-status", args=[999]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
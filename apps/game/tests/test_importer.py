@@ -0,0 +1,428 @@
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.game.choices import ImportJobStatus
+from apps.game.models import (
+    Game,
+    GameGenre,
+    GameImg,
+    GamePlatform,
+    GameTag,
+    Genre,
+    Tag,
+)
+from apps.game.services.importer import GameImportService
+from apps.game.services.translation import FakeTranslationBackend, TranslationCache
+
+
+def make_detail(game_id):
+    return {
+        "id": game_id,
+        "name": f"Game {game_id}",
+        "description": f"Intro {game_id}",
+        "developers": [{"name": "Dev"}],
+        "publishers": [{"name": "Pub"}],
+        "background_image": f"https://img/{game_id}/bg.jpg",
+        "genres": [{"slug": "action", "name": "Action"}],
+        "tags": [
+            {"slug": "singleplayer", "name": "Singleplayer"},
+            {"slug": f"tag-{game_id}", "name": f"Tag {game_id}"},
+        ],
+        "platforms": [{"platform": {"slug": "pc", "name": "PC"}}],
+    }
+
+
+def set_games(client, raw_games):
+    """RAWG 목록 API가 한 페이지에 raw_games를 반환하도록 설정"""
+    client.fetch_games_page.side_effect = lambda page: {
+        "results": raw_games if page == 1 else [],
+        "next": None,
+    }
+
+
+def make_client(game_ids):
+    client = MagicMock()
+    set_games(
+        client,
+        [
+            {
+                "id": game_id,
+                "name": f"Game {game_id}",
+                "released": f"2024-01-0{game_id}",
+            }
+            for game_id in game_ids
+        ],
+    )
+    client.fetch_game_detail.side_effect = make_detail
+    client.fetch_game_screenshots.side_effect = lambda game_id: {
+        "results": [{"image": f"https://img/{game_id}/shot.jpg"}]
+    }
+    client.get_stats.return_value = {}
+    return client
+
+
+class GameImportServiceTest(TestCase):
+    def setUp(self):
+        self.backend = FakeTranslationBackend()
+        self.service = GameImportService(
+            translation_cache=TranslationCache(backend=self.backend)
+        )
+
+    @patch("apps.game.services.importer.RawgClient")
+    def test_import_games_creates_games_and_relations(self, mock_client_class):
+        """게임과 장르/태그/플랫폼/이미지 관계가 함께 저장됨"""
+        mock_client_class.return_value = make_client([1, 2])
+
+        count = self.service.import_games()
+
+        self.assertEqual(count, 2)
+        game = Game.objects.get(name="Game 1")
+        self.assertEqual(game.intro, "[ko] Intro 1")
+        self.assertEqual(game.developer, "Dev")
+        self.assertEqual(str(game.released_at), "2024-01-01")
+        self.assertEqual(Genre.objects.get(slug="action").genre_ko, "[ko] Action")
+        self.assertEqual(GameGenre.objects.count(), 2)
+        self.assertEqual(GameTag.objects.count(), 4)
+        self.assertEqual(GamePlatform.objects.count(), 2)
+        self.assertEqual(GameImg.objects.filter(game=game).count(), 2)
+
+    @patch("apps.game.services.importer.RawgClient")
+    def test_reimport_skips_existing_and_translation(self, mock_client_class):
+        """이미 있는 게임은 건너뛰고, 번역도 다시 요청하지 않음"""
+        mock_client_class.return_value = make_client([1])
+        self.service.import_games()
+        calls_after_first_import = len(self.backend.calls)
+
+        mock_client_class.return_value = make_client([1])
+        count = self.service.import_games()
+
+        self.assertEqual(count, 0)
+        self.assertEqual(Game.objects.count(), 1)
+        self.assertEqual(len(self.backend.calls), calls_after_first_import)
+
+    @patch("apps.game.services.importer.RawgClient")
+    def test_detail_failure_still_creates_game(self, mock_client_class):
+        """상세 조회에 실패한 게임은 기본값으로 저장"""
+        client = make_client([1])
+        client.fetch_game_detail.side_effect = RuntimeError("boom")
+        mock_client_class.return_value = client
+
+        self.service.import_games()
+
+        game = Game.objects.get(name="Game 1")
+        self.assertEqual(game.developer, "Unknown")
+        self.assertEqual(GameTag.objects.count(), 0)
+
+    @patch("apps.game.services.importer.RawgClient")
+    def test_games_are_identified_by_rawg_id(self, mock_client_class):
+        """이름이 같아도 rawg_id가 다르면 별개의 게임으로 저장"""
+        client = make_client([1, 2])
+        set_games(client, [{"id": 1, "name": "Doom"}, {"id": 2, "name": "Doom"}])
+        mock_client_class.return_value = client
+
+        count = self.service.import_games()
+
+        self.assertEqual(count, 2)
+        self.assertEqual(set(Game.objects.values_list("rawg_id", flat=True)), {1, 2})
+        self.assertEqual(GameImg.objects.filter(game__rawg_id=2).count(), 2)
+
+    @patch("apps.game.services.importer.RawgClient")
+    def test_legacy_game_is_backfilled_not_duplicated(self, mock_client_class):
+        """rawg_id 없이 저장된 기존 게임은 새로 만들지 않고 rawg_id만 채움"""
+        legacy = Game.objects.create(
+            name="Game 1", intro="", developer="", publisher=""
+        )
+        mock_client_class.return_value = make_client([1])
+
+        count = self.service.import_games()
+
+        self.assertEqual(count, 0)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.rawg_id, 1)
+        self.assertEqual(Game.objects.count(), 1)
+
+    def test_dimensions_are_resolved_in_bulk(self):
+        """없는 태그는 INSERT 한 번으로 만들고, 있는 태그는 그대로 재사용"""
+        existing = Tag.objects.create(slug="singleplayer", tag="Singleplayer")
+        games = [
+            Game.objects.create(name=f"Game {i}", intro="", developer="", publisher="")
+            for i in range(5)
+        ]
+        game_tags_data = [
+            {"game": game, "tags": make_detail(i)["tags"]}
+            for i, game in enumerate(games)
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.service.import_tags(game_tags_data)
+
+        tag_inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "tag"')
+        ]
+        self.assertEqual(len(tag_inserts), 1)
+        self.assertEqual(Tag.objects.count(), 6)
+        self.assertEqual(GameTag.objects.filter(tag=existing).count(), 5)
+        self.assertEqual(Tag.objects.get(slug="tag-3").tag_ko, "[ko] Tag 3")
+
+
+@patch("apps.game.services.importer.RawgClient")
+class ImportJobTest(TestCase):
+    def setUp(self):
+        self.service = GameImportService(
+            translation_cache=TranslationCache(backend=FakeTranslationBackend())
+        )
+
+    def test_job_commits_in_chunks_and_moves_cursor(self, mock_client_class):
+        """청크 단위로 저장하고 페이지를 끝내면 커서를 다음 페이지로 이동"""
+        mock_client_class.return_value = make_client([1, 2, 3])
+        job = self.service.create_job(max_pages=1, chunk_size=2)
+
+        self.service.run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJobStatus.COMPLETED)
+        self.assertEqual(job.games_created, 3)
+        self.assertEqual(job.games_processed, 3)
+        self.assertEqual(job.cursor_page, 2)
+        self.assertEqual(job.relations_written, 18)
+        self.assertGreater(job.translation_cache_misses, 0)
+        self.assertIsNone(job.last_rawg_id)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_network_calls_run_outside_transaction(self, mock_client_class):
+        """상세 조회와 번역은 청크 트랜잭션을 열기 전에 호출"""
+        # 상세 조회는 스레드 풀에서 실행되므로 이 스레드의 연결을 직접 확인
+        main_connection = connections[DEFAULT_DB_ALIAS]
+        outside = len(main_connection.savepoint_ids)
+        depths = []
+
+        client = make_client([1, 2])
+        client.fetch_game_detail.side_effect = lambda game_id: (
+            depths.append(len(main_connection.savepoint_ids)) or make_detail(game_id)
+        )
+        mock_client_class.return_value = client
+        backend = self.service.translation.backend
+        original_translate_batch = backend.translate_batch
+
+        def translate_batch(texts, source, target):
+            depths.append(len(main_connection.savepoint_ids))
+            return original_translate_batch(texts, source, target)
+
+        with patch.object(backend, "translate_batch", translate_batch):
+            self.service.run_job(self.service.create_job(max_pages=1, chunk_size=2))
+
+        self.assertEqual(Game.objects.count(), 2)
+        self.assertGreater(len(depths), 2)
+        self.assertEqual(set(depths), {outside})
+
+    def test_failed_job_resumes_from_checkpoint(self, mock_client_class):
+        """실패 전에 커밋된 청크는 남고, 재개하면 다음 게임부터 처리"""
+        mock_client_class.return_value = make_client([1, 2, 3])
+        job = self.service.create_job(max_pages=1, chunk_size=1)
+
+        original_import_images = self.service.import_images
+        calls = {"count": 0}
+
+        def flaky_import_images(data):
+            calls["count"] += 1
+            if calls["count"] == 2:
+                raise RuntimeError("db down")
+            return original_import_images(data)
+
+        with patch.object(self.service, "import_images", flaky_import_images):
+            with self.assertRaises(RuntimeError):
+                self.service.run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJobStatus.FAILED)
+        self.assertEqual(job.last_rawg_id, 1)
+        self.assertEqual(Game.objects.count(), 1)
+
+        fetched_ids = []
+        client = make_client([1, 2, 3])
+        client.fetch_game_detail.side_effect = lambda game_id: (
+            fetched_ids.append(game_id) or make_detail(game_id)
+        )
+        mock_client_class.return_value = client
+
+        self.service.run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJobStatus.COMPLETED)
+        self.assertEqual(fetched_ids, [2, 3])
+        self.assertEqual(Game.objects.count(), 3)
+        self.assertEqual(job.games_created, 3)
+
+
+class GameFileImportTest(TestCase):
+    def setUp(self):
+        self.service = GameImportService(
+            translation_cache=TranslationCache(backend=FakeTranslationBackend())
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_dump(self, lines, name="games.ndjson"):
+        path = Path(self.tmpdir.name) / name
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    def make_record(self, game_id):
+        return {
+            **make_detail(game_id),
+            "released": "2024-02-01",
+            "short_screenshots": [
+                {"image": f"https://img/{game_id}/bg.jpg"},
+                {"image": f"https://img/{game_id}/shot.jpg"},
+            ],
+        }
+
+    @patch("apps.game.services.importer.RawgClient")
+    def test_import_from_file_streams_in_chunks(self, mock_client_class):
+        """덤프 파일을 청크 단위로 저장하고 RAWG API는 호출하지 않음"""
+        path = self.write_dump(
+            [json.dumps(self.make_record(i)) for i in range(1, 6)]
+            + ["", "{broken", json.dumps({"name": "no id"})]
+        )
+
+        with patch.object(
+            self.service, "import_records", wraps=self.service.import_records
+        ) as mock_import_records:
+            result = self.service.import_from_file(path, chunk_size=2)
+
+        self.assertEqual(result, (5, 5, 0))
+        self.assertEqual(mock_import_records.call_count, 3)
+        mock_client_class.assert_not_called()
+
+        game = Game.objects.get(rawg_id=3)
+        self.assertEqual(game.intro, "[ko] Intro 3")
+        self.assertEqual(str(game.released_at), "2024-02-01")
+        self.assertEqual(GameTag.objects.filter(game=game).count(), 2)
+        # 배경 이미지와 같은 short_screenshots 항목은 중복 저장하지 않음
+        self.assertEqual(GameImg.objects.filter(game=game).count(), 2)
+
+    def test_import_from_file_is_idempotent(self):
+        """같은 파일을 다시 가져오면 새 게임을 만들지 않음"""
+        path = self.write_dump(
+            [json.dumps(self.make_record(i)) for i in range(1, 4)], "games.jsonl.gz"
+        )
+
+        self.service.import_from_file(path)
+        result = self.service.import_from_file(path)
+
+        self.assertEqual(result, (3, 0, 0))
+        self.assertEqual(Game.objects.count(), 3)
+        self.assertEqual(GameImg.objects.count(), 6)
+
+
+class ContentHashRefreshTest(TestCase):
+    def setUp(self):
+        self.service = GameImportService(
+            translation_cache=TranslationCache(backend=FakeTranslationBackend())
+        )
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "games.ndjson"
+
+        self.records = {
+            i: {**make_detail(i), "released": f"2024-01-0{i}"} for i in range(1, 4)
+        }
+        self.write_dump()
+        self.service.import_from_file(self.path)
+
+    def write_dump(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            for record in self.records.values():
+                f.write(json.dumps(record) + "\n")
+
+    def test_new_games_store_content_hash(self):
+        """새로 저장한 게임에는 content_hash가 채워짐"""
+        self.assertFalse(Game.objects.filter(content_hash="").exists())
+
+    def test_refresh_updates_only_changed_games(self):
+        """바뀐 게임의 필드와 관계만 다시 저장하고 나머지는 건드리지 않음"""
+        unchanged_tag_ids = set(
+            GameTag.objects.filter(game__rawg_id=1).values_list("id", flat=True)
+        )
+        self.records[2]["developers"] = [{"name": "New Dev"}]
+        self.records[2]["tags"] = [{"slug": "co-op", "name": "Co-op"}]
+        self.write_dump()
+
+        with patch.object(
+            self.service, "update_games", wraps=self.service.update_games
+        ) as mock_update_games:
+            result = self.service.import_from_file(self.path, refresh=True)
+
+        self.assertEqual(result, (3, 0, 1))
+        self.assertEqual(len(mock_update_games.call_args.args[0]), 1)
+
+        game = Game.objects.get(rawg_id=2)
+        self.assertEqual(game.developer, "New Dev")
+        self.assertEqual(
+            list(GameTag.objects.filter(game=game).values_list("tag__slug", flat=True)),
+            ["co-op"],
+        )
+        self.assertEqual(GameImg.objects.filter(game=game).count(), 1)
+        self.assertEqual(
+            set(GameTag.objects.filter(game__rawg_id=1).values_list("id", flat=True)),
+            unchanged_tag_ids,
+        )
+
+    def test_volatile_fields_are_not_changes(self):
+        """태그 순서나 games_count처럼 저장하지 않는 값만 바뀌면 변경으로 보지 않음"""
+        for record in self.records.values():
+            record["tags"] = [
+                {**tag, "games_count": 999} for tag in reversed(record["tags"])
+            ]
+            record["rating"] = 4.5
+        self.write_dump()
+
+        result = self.service.import_from_file(self.path, refresh=True)
+
+        self.assertEqual(result, (3, 0, 0))
+
+    def test_dry_run_prints_change_set_without_writing(self):
+        """dry_run은 추가/변경될 게임만 출력하고 저장하지 않음"""
+        self.records[2]["publishers"] = [{"name": "New Pub"}]
+        self.records[4] = make_detail(4)
+        self.write_dump()
+
+        with patch("builtins.print") as mock_print:
+            result = self.service.import_from_file(
+                self.path, refresh=True, dry_run=True
+            )
+
+        self.assertEqual(result, (4, 1, 1))
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        self.assertIn("[dry-run] 추가: rawg_id=4 Game 4", printed)
+        self.assertIn("[dry-run] 변경: rawg_id=2 Game 2 (publisher)", printed)
+        self.assertEqual(Game.objects.count(), 3)
+        self.assertEqual(Game.objects.get(rawg_id=2).publisher, "Pub")
+
+    @patch("apps.game.services.importer.RawgClient")
+    def test_refresh_job_counts_updated_games(self, mock_client_class):
+        """refresh 작업은 RAWG 상세 정보를 다시 비교하여 갱신 수를 기록"""
+        client = make_client([1, 2, 3])
+        client.fetch_game_screenshots.side_effect = lambda game_id: {"results": []}
+        client.fetch_game_detail.side_effect = lambda game_id: {
+            **self.records[game_id],
+            "description": "Changed" if game_id == 3 else f"Intro {game_id}",
+        }
+        mock_client_class.return_value = client
+        job = self.service.create_job(max_pages=1, refresh=True)
+
+        self.service.run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.games_created, 0)
+        self.assertEqual(job.games_updated, 1)
+        self.assertEqual(Game.objects.get(rawg_id=3).intro, "[ko] Changed")
@@ -0,0 +1,118 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.models.reviews import Review
+from apps.community.services.review.review_create_service import create_review
+from apps.community.services.review.review_delete_service import delete_review
+from apps.community.services.review.review_update_service import update_review
+from apps.game.models import Game, GameRatingStats
+from apps.game.services.rating_stats import reconcile_rating_stats
+from apps.user.models.user import User
+
+
+class GameRatingStatsTest(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create(name="Test Game", intro="", developer="Dev")
+        self.users = [
+            User.objects.create_user(
+                email=f"user{i}@test.com",
+                password="test1234",
+                nickname=f"user{i}",
+                phone_number=f"010-0000-000{i}",
+            )
+            for i in range(3)
+        ]
+
+    def write_review(self, user, rating):
+        return create_review(
+            author=user,
+            game_id=self.game.id,
+            validated_data={"content": "리뷰", "rating": rating},
+        )
+
+    def stats(self):
+        return GameRatingStats.objects.get(game=self.game)
+
+    def test_create_update_delete_keep_stats(self):
+        """생성/별점 수정/소프트 삭제가 집계에 증감으로 반영됨"""
+        first = self.write_review(self.users[0], 5)
+        self.write_review(self.users[1], 3)
+
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_sum), (2, 8))
+        self.assertEqual(stats.histogram, {1: 0, 2: 0, 3: 1, 4: 0, 5: 1})
+
+        update_review(review=first, validated_data={"rating": 1})
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_sum), (2, 4))
+        self.assertEqual(stats.histogram, {1: 1, 2: 0, 3: 1, 4: 0, 5: 0})
+
+        # 내용만 바꾸면 집계는 그대로
+        update_review(review=first, validated_data={"content": "수정"})
+        self.assertEqual(self.stats().rating_sum, 4)
+
+        delete_review(Review.objects.get(id=first.id))
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_sum), (1, 3))
+        self.assertEqual(stats.avg_rating, 3)
+
+    def test_hard_delete_and_deferred_review(self):
+        review = self.write_review(self.users[0], 4)
+        self.write_review(self.users[1], 2)
+
+        # 이전 값을 모르는 경우(only)에는 게임 집계를 다시 계산
+        deferred = Review.objects.only("id", "game_id").get(id=review.id)
+        deferred.rating = 5
+        deferred.save(update_fields=["rating"])
+        self.assertEqual(self.stats().rating_sum, 7)
+
+        Review.objects.get(id=review.id).delete()
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_sum), (1, 2))
+
+    def test_game_delete_cascades_stats(self):
+        self.write_review(self.users[0], 4)
+
+        self.game.delete()
+
+        self.assertFalse(GameRatingStats.objects.exists())
+
+    def test_reconcile_fixes_drift(self):
+        self.write_review(self.users[0], 4)
+        self.write_review(self.users[1], 2)
+        other = Game.objects.create(name="Other", intro="", developer="Dev")
+        GameRatingStats.objects.create(game=other, review_count=3, rating_sum=9)
+        GameRatingStats.objects.filter(game=self.game).update(review_count=7)
+
+        self.assertEqual(
+            reconcile_rating_stats(dry_run=True), sorted([self.game.id, other.id])
+        )
+        self.assertEqual(self.stats().review_count, 7)
+
+        out = StringIO()
+        call_command("reconcile_rating_stats", stdout=out)
+
+        self.assertIn("2개", out.getvalue())
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_sum), (2, 6))
+        self.assertEqual(GameRatingStats.objects.get(game=other).review_count, 0)
+        self.assertEqual(reconcile_rating_stats(), [])
+
+    def test_detail_reads_stats(self):
+        self.write_review(self.users[0], 5)
+        self.write_review(self.users[1], 4)
+        self.write_review(self.users[2], 4)
+
+        response = APIClient().get(reverse("game-detail", args=[self.game.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["avg_score"], 4.3)
+
+    def test_detail_without_reviews(self):
+        response = APIClient().get(reverse("game-detail", args=[self.game.id]))
+
+        self.assertEqual(response.data["avg_score"], 0)
@@ -0,0 +1,129 @@
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.test import TestCase
+
+from apps.game.services.rawg import RawgClient
+
+
+def make_response(status_code, json_data=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json_data or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+@patch("apps.game.services.rawg.time.sleep")
+class RawgClientRetryTest(TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.client = RawgClient(max_retries=3, backoff_base=1, session=self.session)
+
+    def test_success_without_retry(self, mock_sleep):
+        """정상 응답이면 재시도 없이 결과 반환"""
+        self.session.get.return_value = make_response(200, {"id": 1})
+
+        result = self.client.fetch_game_detail(1)
+
+        self.assertEqual(result, {"id": 1})
+        mock_sleep.assert_not_called()
+        self.assertEqual(self.client.get_stats()["game_detail"]["requests"], 1)
+
+    def test_retry_on_server_error_then_success(self, mock_sleep):
+        """5xx 응답은 백오프 후 재시도"""
+        self.session.get.side_effect = [
+            make_response(503),
+            make_response(502),
+            make_response(200, {"results": []}),
+        ]
+
+        result = self.client.fetch_game_screenshots(1)
+
+        self.assertEqual(result, {"results": []})
+        self.assertEqual(mock_sleep.call_count, 2)
+        stats = self.client.get_stats()["game_screenshots"]
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["failures"], 0)
+
+    def test_retry_after_header_is_honored(self, mock_sleep):
+        """429 응답의 Retry-After 값만큼 대기"""
+        self.session.get.side_effect = [
+            make_response(429, headers={"Retry-After": "7"}),
+            make_response(200, {"id": 1}),
+        ]
+
+        self.client.fetch_game_detail(1)
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_connection_error_is_retried(self, mock_sleep):
+        """연결 오류도 재시도 대상"""
+        self.session.get.side_effect = [
+            requests.ConnectionError("reset"),
+            make_response(200, {"id": 1}),
+        ]
+
+        self.assertEqual(self.client.fetch_game_detail(1), {"id": 1})
+        self.assertEqual(self.client.get_stats()["game_detail"]["retries"], 1)
+
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """최대 재시도 횟수를 넘기면 예외 발생"""
+        self.session.get.return_value = make_response(500)
+
+        with self.assertRaises(requests.HTTPError):
+            self.client.fetch_game_detail(1)
+
+        stats = self.client.get_stats()["game_detail"]
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["failures"], 1)
+
+    def test_every_attempt_takes_a_token(self, mock_sleep):
+        """재시도도 요청마다 속도 제한 토큰을 하나씩 소비"""
+        self.client.rate_limiter = MagicMock()
+        self.session.get.side_effect = [
+            make_response(429),
+            make_response(503),
+            make_response(200, {"id": 1}),
+        ]
+
+        self.client.fetch_game_detail(1)
+
+        self.assertEqual(self.client.rate_limiter.acquire.call_count, 3)
+
+    def test_client_error_is_not_retried(self, mock_sleep):
+        """404 같은 클라이언트 오류는 바로 예외 발생"""
+        self.session.get.return_value = make_response(404)
+
+        with self.assertRaises(requests.HTTPError):
+            self.client.fetch_game_detail(1)
+
+        mock_sleep.assert_not_called()
+
+    def test_backoff_is_capped(self, mock_sleep):
+        """백오프 대기 시간은 backoff_max를 넘지 않음"""
+        self.client.backoff_max = 5
+        for attempt in range(10):
+            self.assertLessEqual(self.client._backoff(attempt), 5)
+
+    def test_explicit_zero_is_not_replaced_by_default(self, mock_sleep):
+        """0을 명시하면 설정 기본값 대신 0을 사용 (백오프 없이 재시도)"""
+        client = RawgClient(backoff_base=0, max_retries=0, session=self.session)
+
+        self.assertEqual(client.backoff_base, 0)
+        self.assertEqual(client.max_retries, 0)
+        self.assertEqual(client._backoff(3), 0)
+
+    def test_fetch_games_stops_at_last_page(self, mock_sleep):
+        """next가 없으면 페이지 조회를 멈춤"""
+        self.session.get.return_value = make_response(
+            200, {"results": [{"id": 1}], "next": None}
+        )
+
+        games = self.client.fetch_games()
+
+        self.assertEqual(games, [{"id": 1}])
+        self.assertEqual(self.session.get.call_count, 1)
@@ -0,0 +1,256 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.game.models import Game, GameGenre, GameTag, Genre, Tag
+from apps.game.models.wishlist import Wishlist
+from apps.game.services.recommend import (
+    RecommendIndex,
+    RecommendIndexHolder,
+    load_recommend_index,
+)
+from apps.game.services.recommend_cache import (
+    WISHLIST_HALF_LIFE_DAYS,
+    recommend_cache_key,
+    refresh_user_recommendations,
+    wishlist_weight,
+)
+from apps.game.tasks.recommend import run_nightly_recommend_refresh
+from apps.preference.models import GenrePreference, TagPreference
+from apps.preference.services.preference_service import (
+    update_user_total_preferences,
+)
+from apps.user.models.user import User
+
+
+class RecommendIndexTest(TestCase):
+    def setUp(self):
+        # 태그 1은 모든 게임에, 태그 2는 게임 1/2에만, 태그 3은 게임 3에만 달림
+        self.index = RecommendIndex(
+            released={1: 100, 2: 200, 3: 300, 4: 400},
+            game_tags={1: [1, 2], 2: [1, 2], 3: [1, 3], 4: [1]},
+            game_genres={4: [10]},
+        )
+
+    def scores(self, **kwargs):
+        ranked = self.index.recommend(**kwargs)
+        return {game_id: score for score, _, game_id in ranked.top(len(self.index))}
+
+    def test_rare_tags_weigh_more(self):
+        scores = self.scores(tags={1: 1.0, 3: 1.0})
+
+        self.assertEqual(set(scores), {1, 2, 3, 4})
+        self.assertGreater(scores[3], scores[1])
+        self.assertEqual(scores[1], scores[4])
+
+    def test_genres_and_exclude(self):
+        scores = self.scores(tags={2: 1.0}, genres={10: 1.0}, exclude=[1])
+
+        self.assertEqual(set(scores), {2, 4})
+
+    def test_pages_by_score_then_release(self):
+        ranked = self.index.recommend(tags={1: 1.0, 2: 1.0})
+
+        self.assertEqual(ranked.count(), 4)
+        self.assertEqual([card.game_id for card in ranked[0:4]], [])  # 카드 없음
+        self.assertEqual([game_id for _, _, game_id in ranked.top(4)], [2, 1, 4, 3])
+        # 상위 k개만 뽑아도 전체 정렬의 앞부분과 같음
+        self.assertEqual([game_id for _, _, game_id in ranked.top(2)], [2, 1])
+
+    def test_after_position_continues_order(self):
+        ranked = self.index.recommend(tags={1: 1.0, 2: 1.0})
+        keys = ranked.top(4)
+
+        with mock.patch(
+            "apps.game.services.recommend.load_ranked_cards", side_effect=list
+        ):
+            self.assertEqual(ranked.after(list(keys[1]), 2), keys[2:4])
+            self.assertEqual(ranked.after(list(keys[3]), 2), [])
+
+    def test_wishlist_profile(self):
+        self.assertEqual(
+            self.index.tag_profile({1: 1.0, 3: 0.5}), {1: 1.5, 2: 1.0, 3: 0.5}
+        )
+
+    def test_wishlist_profile_keeps_heaviest_tags(self):
+        self.assertEqual(
+            self.index.tag_profile({1: 1.0, 3: 0.5}, limit=2), {1: 1.5, 2: 1.0}
+        )
+
+    def test_wishlist_profile_ties_and_unknown_games(self):
+        # 가중치가 같은 태그는 tag_id 순, 색인에 없는 게임은 무시
+        self.assertEqual(self.index.tag_profile({1: 1.0, 99: 5.0}, limit=1), {1: 1.0})
+        self.assertEqual(self.index.tag_profile({}), {})
+
+
+class RecommendViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="user@test.com",
+            password="test1234",
+            nickname="user",
+            phone_number="010-1111-1111",
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.action = Tag.objects.create(tag="Action", slug="action")
+        self.puzzle = Tag.objects.create(tag="Puzzle", slug="puzzle")
+        self.rpg = Genre.objects.create(genre="RPG", slug="rpg")
+        self.games = []
+        for i in range(4):
+            game = Game.objects.create(
+                name=f"Game {i}",
+                intro="",
+                developer="Dev",
+                released_at=date(2020 + i, 1, 1),
+            )
+            GameTag.objects.create(game=game, tag=self.action)
+            self.games.append(game)
+        GameTag.objects.create(game=self.games[0], tag=self.puzzle)
+        GameTag.objects.create(game=self.games[1], tag=self.puzzle)
+        GameGenre.objects.create(game=self.games[2], genre=self.rpg)
+        self.deleted = Game.objects.create(
+            name="Deleted", intro="", developer="Dev", is_deleted=True
+        )
+        GameTag.objects.create(game=self.deleted, tag=self.puzzle)
+
+        holder = RecommendIndexHolder(check_interval=60, background=False)
+        holder.warm()
+        patcher = mock.patch(
+            "apps.game.services.recommend_cache.recommend_index", holder
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def ids(self, response):
+        self.assertEqual(response.status_code, 200)
+        return [game["id"] for game in response.data["results"]]
+
+    def test_preference_ranks_in_memory(self):
+        """
+        선호 태그/장르 점수 -> 출시일 순, DB는 선호도 2회 + 카드 1회만 조회
+        장르(게임 1개)가 퍼즐 태그(게임 2개)보다 드물어 idf가 더 큼
+        """
+        TagPreference.objects.create(user=self.user, tag=self.puzzle)
+        GenrePreference.objects.create(user=self.user, genre=self.rpg)
+
+        # 첫 요청은 계산해서 저장 (전체 개수/정렬은 메모리에서 계산)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("game-recommend-preference"))
+
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            self.ids(response),
+            [self.games[2].id, self.games[1].id, self.games[0].id],
+        )
+
+    def test_wishlist_excludes_wishlisted_games(self):
+        Wishlist.objects.create(user=self.user, game=self.games[0])
+
+        response = self.client.get(reverse("game-recommend-wishlist"))
+
+        # 위시리스트의 태그(액션, 퍼즐)가 둘 다 달린 게임 1이 먼저
+        self.assertEqual(
+            self.ids(response),
+            [self.games[1].id, self.games[3].id, self.games[2].id],
+        )
+
+    def test_recent_wishlist_adds_weigh_more(self):
+        """오래전에 담은 게임의 태그보다 최근에 담은 게임의 태그가 더 큰 가중치"""
+        old = Wishlist.objects.create(user=self.user, game=self.games[2])  # 액션, RPG
+        Wishlist.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=WISHLIST_HALF_LIFE_DAYS * 4)
+        )
+        Wishlist.objects.create(user=self.user, game=self.games[0])  # 액션, 퍼즐
+
+        response = self.client.get(reverse("game-recommend-wishlist"))
+
+        # 최근에 담은 게임의 퍼즐 태그가 달린 게임 1이 먼저
+        self.assertEqual(self.ids(response)[0], self.games[1].id)
+
+    def test_wishlist_weight_half_life(self):
+        now = timezone.now()
+        self.assertEqual(wishlist_weight(now, now), 1.0)
+        self.assertAlmostEqual(
+            wishlist_weight(now - timedelta(days=WISHLIST_HALF_LIFE_DAYS), now), 0.5
+        )
+
+    def test_empty_preferences(self):
+        response = self.client.get(reverse("game-recommend-preference"))
+
+        self.assertEqual(self.ids(response), [])
+
+    def test_index_skips_deleted_games(self):
+        index = load_recommend_index()
+
+        self.assertNotIn(self.deleted.id, index.rows)
+        self.assertEqual(len(index), 4)
+
+    def test_cached_list_serves_pages_with_one_query(self):
+        """미리 계산된 목록이 있으면 현재 페이지 카드만 조회"""
+        TagPreference.objects.create(user=self.user, tag=self.action)
+        refresh_user_recommendations(self.user.id)
+        url = reverse("game-recommend-preference")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"cursor": "", "page_size": 3})
+        ids = self.ids(response)
+        with self.assertNumQueries(1):
+            response = self.client.get(response.data["next"])
+        ids.extend(self.ids(response))
+
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(ids, [game.id for game in reversed(self.games)])
+
+    def test_preference_update_refreshes_after_commit(self):
+        url = reverse("game-recommend-preference")
+        self.assertEqual(self.ids(self.client.get(url)), [])
+
+        with (
+            mock.patch(
+                "apps.game.tasks.recommend.run_recommend_refresh.delay",
+                side_effect=refresh_user_recommendations,
+            ) as delay,
+            mock.patch("apps.ai.tasks.user_tendency.run_user_tendency_analysis.delay"),
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                update_user_total_preferences(
+                    self.user, tag_ids=[self.puzzle.id], genre_ids=[]
+                )
+
+        delay.assert_called_once_with(self.user.id)
+        self.assertEqual(
+            self.ids(self.client.get(url)), [self.games[1].id, self.games[0].id]
+        )
+
+    def test_wishlist_change_refreshes_after_commit(self):
+        with mock.patch(
+            "apps.game.tasks.recommend.run_recommend_refresh.delay"
+        ) as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                wishlist = Wishlist.objects.create(user=self.user, game=self.games[0])
+            with self.captureOnCommitCallbacks(execute=True):
+                wishlist.delete()
+
+        self.assertEqual(delay.call_count, 2)
+
+    def test_nightly_refresh_covers_users_with_inputs(self):
+        other = User.objects.create_user(
+            email="other@test.com",
+            password="test1234",
+            nickname="other",
+            phone_number="010-2222-2222",
+        )
+        Wishlist.objects.create(user=self.user, game=self.games[0])
+
+        run_nightly_recommend_refresh()
+
+        self.assertIsNotNone(cache.get(recommend_cache_key("wishlist", self.user.id)))
+        self.assertIsNone(cache.get(recommend_cache_key("wishlist", other.id)))
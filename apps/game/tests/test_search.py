@@ -0,0 +1,100 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.game.models import Game, GameTag, Tag
+from apps.game.services.search import search_game_cards
+
+
+def create_game(name, intro="", developer="Dev", publisher="Pub", tags=()):
+    game = Game.objects.create(
+        name=name, intro=intro, developer=developer, publisher=publisher
+    )
+    for tag in tags:
+        GameTag.objects.create(game=game, tag=tag)
+    return game
+
+
+class GameSearchTest(TestCase):
+    def setUp(self):
+        self.roguelike = Tag.objects.create(
+            tag="Roguelike", slug="roguelike", tag_ko="로그라이크"
+        )
+        self.witcher = create_game(
+            "The Witcher 3: Wild Hunt",
+            intro="괴물 사냥꾼 게롤트의 이야기",
+            developer="CD PROJEKT RED",
+        )
+        self.portal = create_game("Portal 2", intro="Puzzle game from Valve")
+        self.portal_mention = create_game(
+            "Puzzle Collection", intro="Includes a portal themed puzzle"
+        )
+        self.hades = create_game("Hades", tags=[self.roguelike])
+        self.stardew = create_game("스타듀 밸리", developer="ConcernedApe")
+        for i in range(5):
+            create_game(f"Filler {i}", intro="Nothing to see here")
+
+    def search(self, query):
+        return list(
+            search_game_cards(query)
+            .order_by("-score", "-game_id")
+            .values_list("game_id", flat=True)
+        )
+
+    def test_typo_in_name_still_matches(self):
+        """이름에 오타가 있어도 trigram 유사도로 찾음"""
+        self.assertEqual(self.search("witchr")[0], self.witcher.id)
+
+    def test_name_match_ranks_above_intro_match(self):
+        """이름에서 찾은 게임이 소개글에서만 찾은 게임보다 위에 위치"""
+        results = self.search("portal")
+
+        self.assertEqual(results[:2], [self.portal.id, self.portal_mention.id])
+
+    def test_developer_and_translated_intro_are_searchable(self):
+        """개발사와 번역된 소개글도 검색 대상"""
+        self.assertEqual(self.search("projekt"), [self.witcher.id])
+        self.assertIn(self.witcher.id, self.search("게롤트의"))
+
+    def test_tag_matches_are_fused(self):
+        """태그(한국어/영어, 오타 포함)가 일치하는 게임도 결과에 포함"""
+        self.assertEqual(self.search("로그라이크"), [self.hades.id])
+        self.assertEqual(self.search("roguelik"), [self.hades.id])
+
+    def test_korean_partial_name(self):
+        """한국어 이름 일부로도 찾음"""
+        self.assertEqual(self.search("스타듀"), [self.stardew.id])
+
+    def test_unrelated_games_are_excluded(self):
+        self.assertNotIn(self.portal.id, self.search("witcher"))
+
+
+class GameSearchViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("game-search")
+        for i in range(7):
+            create_game(f"Space Game {i}", intro="space " * (i + 1))
+
+    def test_search_requires_query(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_pages_by_relevance(self):
+        """페이지 번호/커서 방식 모두 관련도 순으로 같은 결과를 반환"""
+        response = self.client.get(self.url, {"q": "space", "page_size": 10})
+        page_ids = [game["id"] for game in response.data["results"]]
+        self.assertEqual(response.data["count"], 7)
+
+        cursor_ids = []
+        response = self.client.get(
+            self.url, {"q": "space", "cursor": "", "page_size": 3}
+        )
+        while True:
+            cursor_ids.extend(game["id"] for game in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(cursor_ids, page_ids)
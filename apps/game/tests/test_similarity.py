@@ -0,0 +1,163 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.game.models import (
+    Game,
+    GameNeighbors,
+    GamePlatform,
+    GameTag,
+    Platform,
+    Tag,
+)
+from apps.game.services.similarity import (
+    build_matrix,
+    build_similar_games,
+    build_vectors,
+    nearest_neighbors,
+    tokenize,
+)
+
+
+class SimilarityVectorTest(TestCase):
+    def test_tokenize(self):
+        self.assertEqual(tokenize("오픈월드 RPG, a 3D!"), ["오픈월드", "rpg", "3d"])
+
+    def test_common_words_and_unique_features_are_dropped(self):
+        features = {
+            game_id: Counter(
+                {("platform", 1): 1, ("tag", game_id % 10): 1, ("word", "게임"): 1}
+            )
+            for game_id in range(1, 21)
+        }
+        features[1][("word", "유일")] = 1
+
+        vectors = build_vectors(features)
+
+        # 흔한 단어와 한 게임에만 있는 단어는 빠지고, 모든 게임에 있는 플랫폼은 남음
+        self.assertEqual(set(vectors[1]), {("tag", 1), ("platform", 1)})
+        self.assertGreater(vectors[1][("tag", 1)], vectors[1][("platform", 1)])
+
+    def test_majority_genre_affects_neighbors(self):
+        # 장르 1은 게임 1~12 (전체 20개 중 60%), 태그 1은 게임 1~3
+        features = {
+            game_id: Counter({("word", f"기타{game_id}"): 1})
+            for game_id in range(1, 21)
+        }
+        for game_id in range(1, 13):
+            features[game_id][("genre", 1)] = 1
+        for game_id in (1, 2, 3):
+            features[game_id][("tag", 1)] = 1
+        features[3].pop(("genre", 1))
+        game_ids, matrix = build_matrix(build_vectors(features))
+
+        neighbors = nearest_neighbors(matrix, game_ids, 0, 1, k=3)[1]
+
+        # 태그와 흔한 장르를 모두 공유하는 게임 2가 태그만 같은 게임 3보다 앞섬
+        self.assertEqual([game_id for game_id, _ in neighbors[:2]], [2, 3])
+        self.assertGreater(neighbors[0][1], neighbors[1][1])
+        self.assertEqual(neighbors[2][0], 4)
+
+    def test_neighbors_by_cosine(self):
+        vectors = build_vectors(
+            {
+                1: Counter({("tag", 1): 1, ("tag", 2): 1, ("word", "우주"): 2}),
+                2: Counter({("tag", 1): 1, ("tag", 2): 1, ("word", "우주"): 1}),
+                3: Counter({("tag", 1): 1, ("tag", 3): 1}),
+                4: Counter({("tag", 3): 1, ("word", "농장"): 1}),
+                5: Counter({("tag", 4): 1, ("word", "농장"): 1}),
+                6: Counter({("tag", 4): 1, ("tag", 2): 1}),
+            }
+        )
+        game_ids, matrix = build_matrix(vectors)
+
+        neighbors = nearest_neighbors(matrix, game_ids, 0, 1, k=2)[1]
+
+        self.assertEqual([game_id for game_id, _ in neighbors], [2, 3])
+        self.assertGreater(neighbors[0][1], neighbors[1][1])
+        self.assertLessEqual(neighbors[0][1], 1.0)
+
+    def test_ties_are_broken_by_game_id(self):
+        features = {
+            game_id: Counter({("tag", 1): 1, ("word", f"기타{game_id}"): 1})
+            for game_id in range(1, 6)
+        }
+        game_ids, matrix = build_matrix(build_vectors(features))
+
+        neighbors = nearest_neighbors(matrix, game_ids, 2, 4, k=2)
+
+        # 점수가 같으면 game_id가 작은 게임부터, 자기 자신은 제외
+        self.assertEqual([game_id for game_id, _ in neighbors[3]], [1, 2])
+        self.assertEqual([game_id for game_id, _ in neighbors[4]], [1, 2])
+        self.assertEqual(neighbors[3][0][1], neighbors[3][1][1])
+
+
+class BuildSimilarGamesTest(TestCase):
+    def setUp(self):
+        tags = [Tag.objects.create(tag=f"Tag {i}", slug=f"tag-{i}") for i in range(4)]
+        pc = Platform.objects.create(platform="PC", slug="pc")
+        intros = [
+            "우주 탐험 전략 게임",
+            "우주 탐험 생존 게임",
+            "농장 경영 게임",
+            "농장 생활 시뮬레이션",
+            "퍼즐 게임",
+        ]
+        tag_sets = [[0, 1], [0, 1], [2], [2, 3], [3]]
+        self.games = []
+        for intro, tag_ids in zip(intros, tag_sets):
+            game = Game.objects.create(name=intro, intro=intro, developer="Dev")
+            for tag_id in tag_ids:
+                GameTag.objects.create(game=game, tag=tags[tag_id])
+            GamePlatform.objects.create(game=game, platform=pc)
+            self.games.append(game)
+
+    def test_build_and_serve(self):
+        self.assertEqual(build_similar_games(block_size=2, k=3), 5)
+
+        space, space2, farm, farm2, puzzle = self.games
+        neighbors = GameNeighbors.objects.get(game=space)
+        self.assertEqual(neighbors.neighbor_ids[0], space2.id)
+        self.assertEqual(len(neighbors.neighbor_ids), len(neighbors.scores))
+
+        farm2.is_deleted = True
+        farm2.save()
+
+        with self.assertNumQueries(2):
+            response = APIClient().get(
+                reverse("game-similar", args=[farm.id]), {"by": "content"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(farm2.id, [game["id"] for game in response.data["results"]])
+
+    def test_rebuild_drops_deleted_games(self):
+        build_similar_games()
+        self.games[0].is_deleted = True
+        self.games[0].save()
+
+        call_command("build_similar_games", stdout=open("/dev/null", "w"))
+
+        self.assertFalse(GameNeighbors.objects.filter(game=self.games[0]).exists())
+        for neighbor_ids in GameNeighbors.objects.values_list(
+            "neighbor_ids", flat=True
+        ):
+            self.assertNotIn(self.games[0].id, neighbor_ids)
+
+    def test_rebuild_drops_rows_regardless_of_updated_at(self):
+        build_similar_games()
+        self.games[0].is_deleted = True
+        self.games[0].save()
+        # 다른 서버 시계가 앞서 있어도 이번 계산에 없는 게임의 행은 지워짐
+        GameNeighbors.objects.filter(game=self.games[0]).update(
+            updated_at=timezone.now() + timedelta(hours=1)
+        )
+
+        build_similar_games()
+
+        self.assertFalse(GameNeighbors.objects.filter(game=self.games[0]).exists())
+        self.assertTrue(GameNeighbors.objects.filter(game=self.games[2]).exists())
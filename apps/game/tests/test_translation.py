@@ -0,0 +1,69 @@
+from django.test import TestCase
+
+from apps.game.models import TranslationMemory
+from apps.game.services.translation import (
+    FakeTranslationBackend,
+    TranslationBackend,
+    TranslationCache,
+)
+
+
+class FailingBackend(FakeTranslationBackend):
+    """특정 문장만 번역에 실패하는 백엔드"""
+
+    def translate_batch(self, texts, source, target):
+        result = super().translate_batch(texts, source, target)
+        return [None if text == "broken" else item for text, item in zip(texts, result)]
+
+
+class TranslationCacheTest(TestCase):
+    def setUp(self):
+        self.backend = FakeTranslationBackend()
+        self.cache = TranslationCache(backend=self.backend, batch_size=2)
+
+    def test_misses_are_translated_in_batches_and_stored(self):
+        """저장된 번역이 없으면 batch_size 단위로 번역 후 저장"""
+        result = self.cache.translate_many(["Action", "RPG", "Indie", "Action"])
+
+        self.assertEqual(result["Action"], "[ko] Action")
+        self.assertEqual(len(self.backend.calls), 2)
+        self.assertEqual(self.cache.misses, 3)
+        self.assertEqual(TranslationMemory.objects.count(), 3)
+
+    def test_reimport_needs_zero_translation_calls(self):
+        """이미 번역한 문장은 다시 번역하지 않음"""
+        self.cache.translate_many(["Action", "RPG"])
+
+        cache = TranslationCache(backend=FakeTranslationBackend(prefix="!"))
+        result = cache.translate_many(["Action", "RPG"])
+
+        self.assertEqual(result, {"Action": "[ko] Action", "RPG": "[ko] RPG"})
+        self.assertEqual(cache.backend.calls, [])
+        self.assertEqual(cache.hits, 2)
+
+    def test_failed_translation_falls_back_to_source(self):
+        """번역 실패 시 원문을 반환하고 저장하지 않음"""
+        cache = TranslationCache(backend=FailingBackend())
+
+        result = cache.translate_many(["broken", "fine"])
+
+        self.assertEqual(result["broken"], "broken")
+        self.assertFalse(
+            TranslationMemory.objects.filter(source_text="broken").exists()
+        )
+        self.assertTrue(TranslationMemory.objects.filter(source_text="fine").exists())
+
+    def test_empty_texts_are_ignored(self):
+        self.assertEqual(self.cache.translate_many(["", ""]), {})
+        self.assertEqual(self.backend.calls, [])
+
+
+class TranslationBackendTest(TestCase):
+    def test_incomplete_backend_fails_on_init(self):
+        """translate_batch를 구현하지 않은 백엔드는 생성 시점에 실패"""
+
+        class IncompleteBackend(TranslationBackend):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteBackend()
@@ -0,0 +1,204 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.game.models import Game, GameGenre, GameTag, Genre, Tag
+from apps.game.services.typeahead import (
+    Suggestion,
+    TypeaheadIndex,
+    TypeaheadIndexHolder,
+    decompose_hangul,
+)
+
+
+def create_game(name, **kwargs):
+    return Game.objects.create(
+        name=name, intro="", developer="Dev", publisher="Pub", **kwargs
+    )
+
+
+class HangulDecomposeTest(TestCase):
+    def test_syllables_are_split_into_jamo(self):
+        self.assertEqual(decompose_hangul("스타"), "ㅅㅡㅌㅏ")
+        # 겹받침/겹모음은 입력 순서대로 나뉨
+        self.assertEqual(decompose_hangul("닭"), "ㄷㅏㄹㄱ")
+        self.assertEqual(decompose_hangul("과"), "ㄱㅗㅏ")
+        self.assertEqual(decompose_hangul("ㄺ"), "ㄹㄱ")
+
+    def test_non_hangul_is_kept(self):
+        self.assertEqual(decompose_hangul("doom 2"), "doom 2")
+
+
+class TypeaheadIndexTest(TestCase):
+    def setUp(self):
+        self.index = TypeaheadIndex(
+            [
+                Suggestion("game", 1, "The Witcher 3: Wild Hunt"),
+                Suggestion("game", 2, "스타듀 밸리"),
+                Suggestion("game", 3, "Stardew Valley"),
+                Suggestion("game", 4, "Starfield"),
+                Suggestion("tag", 10, "Strategy", weight=50),
+                Suggestion("tag", 10, "전략", weight=50),
+                Suggestion("genre", 20, "전략 시뮬레이션", weight=5),
+            ]
+        )
+
+    def labels(self, query, limit=10):
+        return [s.label for s in self.index.suggest(query, limit=limit)]
+
+    def test_prefix_matches_name_start(self):
+        self.assertEqual(self.labels("stard"), ["Stardew Valley"])
+
+    def test_prefix_matches_later_words(self):
+        """이름 중간 단어로 시작해도 찾음"""
+        self.assertEqual(self.labels("witch"), ["The Witcher 3: Wild Hunt"])
+        self.assertEqual(self.labels("wild h"), ["The Witcher 3: Wild Hunt"])
+
+    def test_partial_hangul_syllable_matches(self):
+        """입력 중인 음절(받침이 다음 글자의 초성이 될 수 있음)도 일치"""
+        self.assertEqual(self.labels("스탇"), ["스타듀 밸리"])
+        self.assertEqual(self.labels("스ㅌ"), ["스타듀 밸리"])
+
+    def test_weight_and_name_start_rank_first(self):
+        self.assertEqual(self.labels("st"), ["Strategy", "Starfield", "Stardew Valley"])
+        self.assertEqual(self.labels("전략"), ["전략", "전략 시뮬레이션"])
+
+    def test_same_item_is_returned_once_and_limit_applies(self):
+        self.assertEqual(len(self.index.suggest("s", limit=2)), 2)
+        self.assertEqual(self.labels("전"), ["전략", "전략 시뮬레이션"])
+
+    def test_no_match(self):
+        self.assertEqual(self.labels("zelda"), [])
+        self.assertEqual(self.labels("  !! "), [])
+
+
+class TypeaheadIndexHolderTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.holder = TypeaheadIndexHolder(check_interval=0, background=False)
+
+    def test_builds_from_database(self):
+        game = create_game("Hollow Knight")
+        deleted = create_game("Hollow Deleted", is_deleted=True)
+        tag = Tag.objects.create(
+            tag="Metroidvania", slug="metroidvania", tag_ko="메트로배니아"
+        )
+        GameTag.objects.create(game=game, tag=tag)
+        genre = Genre.objects.create(genre="Action", slug="action", genre_ko="액션")
+        GameGenre.objects.create(game=game, genre=genre)
+
+        index = self.holder.get()
+
+        self.assertEqual(
+            [(s.kind, s.id) for s in index.suggest("hollow")], [("game", game.id)]
+        )
+        self.assertNotIn(deleted.id, [s.id for s in index.suggest("hollow")])
+        self.assertEqual(index.suggest("메트로")[0].id, tag.id)
+        self.assertEqual(index.suggest("액")[0].id, genre.id)
+
+    def test_rebuilds_when_version_changes(self):
+        """게임이 추가되어 버전이 오르면 다음 조회 때 새 색인으로 교체"""
+        self.assertEqual(self.holder.get().suggest("celeste"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_game("Celeste")
+
+        self.assertEqual(self.holder.get().suggest("celeste")[0].label, "Celeste")
+
+    def test_skips_version_check_within_interval(self):
+        self.holder.check_interval = 60
+        index = self.holder.get()
+
+        with mock.patch(
+            "apps.game.services.typeahead.get_typeahead_version"
+        ) as get_version:
+            self.assertIs(self.holder.get(), index)
+        get_version.assert_not_called()
+
+
+class TypeaheadBackgroundRebuildTest(SimpleTestCase):
+    def test_get_does_not_wait_for_rebuild(self):
+        """다시 만드는 중에도 조회는 기다리지 않고 기존 색인을 바로 반환"""
+        holder = TypeaheadIndexHolder(check_interval=0, background=True)
+        released = threading.Event()
+        started = threading.Event()
+
+        def slow_load():
+            started.set()
+            released.wait(5)
+            return [Suggestion("game", 2, "Celeste")]
+
+        with (
+            mock.patch(
+                "apps.game.services.typeahead.get_typeahead_version", return_value=1
+            ),
+            mock.patch(
+                "apps.game.services.typeahead.load_suggestions",
+                return_value=[Suggestion("game", 1, "Portal")],
+            ),
+        ):
+            old = holder.get()
+
+        with (
+            mock.patch(
+                "apps.game.services.typeahead.get_typeahead_version", return_value=2
+            ),
+            mock.patch("apps.game.services.typeahead.load_suggestions", slow_load),
+        ):
+            try:
+                holder.get()
+                self.assertTrue(started.wait(5))
+
+                begin = time.monotonic()
+                for _ in range(3):
+                    self.assertIs(holder.get(), old)
+                self.assertLess(time.monotonic() - begin, 0.5)
+            finally:
+                released.set()
+
+            # 새 색인이 다 만들어지면 교체됨
+            deadline = time.monotonic() + 5
+            while holder.get().version != 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(holder.get().suggest("cel")[0].label, "Celeste")
+
+
+class GameSuggestViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("game-suggest")
+        create_game("Portal")
+        create_game("Portal 2")
+
+        holder = TypeaheadIndexHolder(check_interval=60, background=False)
+        holder.warm()
+        patcher = mock.patch("apps.game.views.game_views.typeahead", holder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_suggest_does_not_query_database(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"q": "port", "limit": 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {
+                    "type": "game",
+                    "id": Game.objects.get(name="Portal").id,
+                    "label": "Portal",
+                }
+            ],
+        )
+
+    def test_suggest_requires_query(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 400)
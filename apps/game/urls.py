@@ -1,20 +1,36 @@
 from django.urls import path
-from apps.game.views.game_views import GameListView, GameDetailView, GameSearchView
+from apps.game.views.game_views import (
+    GameListView,
+    GameDetailView,
+    GameSearchView,
+    GameSuggestView,
+    GameBrowseView,
+    GameBatchView,
+    GameSimilarView,
+)
 from apps.game.views.wishlist_views import WishlistView, WishlistDestroyView
-from apps.game.views.import_views import GameImportView
+from apps.game.views.import_views import GameImportView, GameImportStatusView
 from apps.game.views.recommend_views import (
     GamePreferenceGameRecommendView,
     GamePreferenceTagRecommendView,
 )
 
-
 urlpatterns = [
     path("", GameListView.as_view(), name="game-list"),
     path("<int:pk>", GameDetailView.as_view(), name="game-detail"),
+    path("<int:pk>/similar", GameSimilarView.as_view(), name="game-similar"),
     path("wishlist", WishlistView.as_view(), name="wishlist"),
     path("wishlist/<int:pk>", WishlistDestroyView.as_view(), name="wishlist-destroy"),
     path("import", GameImportView.as_view(), name="game-import"),
+    path(
+        "import/<int:job_id>",
+        GameImportStatusView.as_view(),
+        name="game-import-status",
+    ),
     path("search", GameSearchView.as_view(), name="game-search"),
+    path("suggest", GameSuggestView.as_view(), name="game-suggest"),
+    path("browse", GameBrowseView.as_view(), name="game-browse"),
+    path("batch", GameBatchView.as_view(), name="game-batch"),
     path(
         "recommend/preference",
         GamePreferenceGameRecommendView.as_view(),
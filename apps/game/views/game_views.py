@@ -1,23 +1,53 @@
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from apps.core.conditional import conditional_get, get_versions, version_etag
 from apps.game.models.game import Game
-from apps.game.models.tag import Tag
+from apps.game.models.game_card import GameCard
+from apps.game.pagination import GamePagination, get_game_paginator
+from apps.game.services.cooccurrence import (
+    SIMILAR_LIMIT,
+    SIMILAR_MAX_LIMIT,
+    similar_game_ids,
+)
+from apps.game.services.facets import FACETS, FacetPage, facet_index
+from apps.game.services.detail_cache import (
+    GAME_DETAIL_MAX_AGE,
+    get_cached_game_detail,
+    get_cached_game_details,
+    get_game_detail_version,
+)
+from apps.game.services.game_card import GAME_LIST_MAX_AGE, GAME_LIST_VERSION_KEY
+from apps.game.services.search import SEARCH_ORDERING, search_game_cards
+from apps.game.services.similarity import similar_content_game_ids
+from apps.game.services.typeahead import SUGGEST_LIMIT, SUGGEST_MAX_LIMIT, typeahead
 from apps.game.serializers.game_serializer import (
+    GameBatchQuerySerializer,
     GameListSerializer,
     GameDetailSerializer,
+    GameFacetSerializer,
+    GameSuggestionSerializer,
 )
 from rest_framework.permissions import AllowAny
-from django.db.models import Q, Avg
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
 
-class GamePagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = "page_size"
-    max_page_size = 40
+def game_detail_queryset():
+    """
+    상세 응답에 필요한 관계를 함께 조회하는 쿼리셋 (단건/여러 건 공용)
+    """
+    return (
+        Game.objects.filter(is_deleted=False)
+        .prefetch_related(
+            "game_images",
+            "game_genres__genre",
+            "game_tags__tag",
+            "game_platforms__platform",
+        )
+        .select_related("rating_stats")
+    )
 
 
 class GameListView(APIView):
@@ -29,24 +59,24 @@ class GameListView(APIView):
         responses=GameListSerializer,
     )
     def get(self, request):
-        games = (
-            Game.objects.filter(is_deleted=False)
-            .prefetch_related(
-                "game_images",
-                "game_tags__tag",
-                "game_platforms__platform",
-            )
-            .order_by("-released_at")
-        )
+        def build():
+            # 삭제된 게임은 카드가 없으므로 별도 필터 없이 카드 테이블만 조회
+            games = GameCard.objects.order_by("-released_sort", "-game_id")
 
-        paginator = GamePagination()
-        paginated_games = paginator.paginate_queryset(
-            games, request
-        )  # 전체데이터(games) / 페이지(request)
+            paginator = get_game_paginator(request)
+            paginated_games = paginator.paginate_queryset(
+                games, request
+            )  # 전체데이터(games) / 페이지(request)
 
-        serializer = GameListSerializer(paginated_games, many=True)
+            serializer = GameListSerializer(paginated_games, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+            return paginator.get_paginated_response(serializer.data)
+
+        # 카드가 바뀔 때만 오르는 목록 버전으로 ETag 계산 (페이지는 URL로 구분됨)
+        version = get_versions([GAME_LIST_VERSION_KEY])[GAME_LIST_VERSION_KEY]
+        return conditional_get(
+            request, version_etag("games", version), build, max_age=GAME_LIST_MAX_AGE
+        )
 
 
 class GameDetailView(APIView):
@@ -58,21 +88,24 @@ class GameDetailView(APIView):
         responses=GameDetailSerializer,
     )
     def get(self, request, pk):
-        game = get_object_or_404(
-            Game.objects.prefetch_related(
-                "game_images",
-                "game_genres__genre",
-                "game_tags__tag",
-                "game_platforms__platform",
-            ).annotate(
-                avg_score=Avg("reviews__rating", filter=Q(reviews__is_deleted=False))
-            ),
-            pk=pk,
-            is_deleted=False,
-        )
-        serializer = GameDetailSerializer(game)
+        def load():
+            game = get_object_or_404(game_detail_queryset(), pk=pk)
+            return GameDetailSerializer(game).data
 
-        return Response(serializer.data)
+        def build():
+            # 캐시 적중 시 DB 조회 없음 (게임/관계/리뷰가 바뀌면 버전이 올라 다시 만듦)
+            return Response(get_cached_game_detail(pk, load))
+
+        # 상세 캐시와 같은 버전으로 ETag 계산, 일치하면 캐시도 읽지 않고 304
+        version = get_game_detail_version(pk)
+        if version is None:
+            raise Http404
+        return conditional_get(
+            request,
+            version_etag("game", pk, version),
+            build,
+            max_age=GAME_DETAIL_MAX_AGE,
+        )
 
 
 class GameSearchView(APIView):
@@ -90,31 +123,180 @@ class GameSearchView(APIView):
         if not query:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        tag = Tag.objects.filter(Q(slug=query) | Q(tag_ko=query)).first()
-
-        prefetch_options = [
-            "game_images",
-            "game_tags__tag",
-            "game_platforms__platform",
-        ]
-
-        if tag:
-            games = (
-                Game.objects.filter(game_tags__tag=tag, is_deleted=False)
-                .prefetch_related(*prefetch_options)
-                .order_by("-released_at")
-                .distinct()
-            )
-        else:
-            games = (
-                Game.objects.filter(name__icontains=query, is_deleted=False)
-                .prefetch_related(*prefetch_options)
-                .order_by("-released_at")
-            )
+        games = search_game_cards(query).order_by(
+            *[f"-{field}" for field in SEARCH_ORDERING]
+        )
 
-        paginator = GamePagination()
+        paginator = get_game_paginator(request, ordering=SEARCH_ORDERING)
         paginated_games = paginator.paginate_queryset(games, request)
 
         serializer = GameListSerializer(paginated_games, many=True)
 
         return paginator.get_paginated_response(serializer.data)
+
+
+class GameSuggestView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        tags=["게임"],
+        summary="검색어 자동완성 api (게임 이름/태그/장르)",
+        parameters=[
+            OpenApiParameter("q", description="입력 중인 검색어"),
+            OpenApiParameter(
+                "limit", int, description=f"최대 개수 (최대 {SUGGEST_MAX_LIMIT})"
+            ),
+        ],
+        responses=GameSuggestionSerializer(many=True),
+    )
+    def get(self, request):
+        query = request.query_params.get("q")
+
+        if not query:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = int(request.query_params.get("limit", SUGGEST_LIMIT))
+        except ValueError:
+            limit = SUGGEST_LIMIT
+        limit = min(max(limit, 1), SUGGEST_MAX_LIMIT)
+
+        # 워커 메모리의 색인만 조회 (DB 접근 없음)
+        suggestions = typeahead.get().suggest(query, limit=limit)
+        serializer = GameSuggestionSerializer(suggestions, many=True)
+
+        return Response({"results": serializer.data})
+
+
+class GameBrowseView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        tags=["게임"],
+        summary="장르/플랫폼/태그/출시연도 필터 목록 + 패싯별 게임 수 api",
+        parameters=[
+            OpenApiParameter(
+                facet,
+                description=f"{facet} 값(slug, 연도), 쉼표로 여러 개 (같은 항목은 OR)",
+            )
+            for facet in FACETS
+        ],
+        responses=GameListSerializer,
+    )
+    def get(self, request):
+        filters = {
+            facet: [
+                value.strip()
+                for param in request.query_params.getlist(facet)
+                for value in param.split(",")
+                if value.strip()
+            ]
+            for facet in FACETS
+        }
+
+        # 워커 메모리의 비트맵으로 필터/개수 계산, DB는 현재 페이지 카드만 조회
+        index = facet_index.get()
+        result, counts = index.filter(filters)
+
+        paginator = GamePagination()
+        paginated_games = paginator.paginate_queryset(FacetPage(index, result), request)
+        serializer = GameListSerializer(paginated_games, many=True)
+
+        response = paginator.get_paginated_response(serializer.data)
+        response.data["facets"] = {
+            facet: GameFacetSerializer(
+                [
+                    {
+                        "value": value,
+                        "label": index.labels.get(facet, {}).get(value, value),
+                        "count": count,
+                    }
+                    for value, count in counts[facet]
+                ],
+                many=True,
+            ).data
+            for facet in FACETS
+        }
+        return response
+
+
+class GameBatchView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        tags=["게임"],
+        summary="여러 게임을 한 번에 조회하는 api (카드 또는 상세)",
+        parameters=[GameBatchQuerySerializer],
+        responses=GameDetailSerializer(many=True),
+    )
+    def get(self, request):
+        query = GameBatchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        game_ids = query.validated_data["ids"]
+
+        if query.validated_data["view"] == "detail":
+
+            def load_many(ids):
+                return {
+                    game.id: GameDetailSerializer(game).data
+                    for game in game_detail_queryset().filter(id__in=ids)
+                }
+
+            # 캐시에 있는 게임은 캐시에서, 나머지는 id__in 한 번(+prefetch)으로 조회
+            payloads = get_cached_game_details(game_ids, load_many)
+        else:
+            cards = GameCard.objects.filter(game_id__in=game_ids)
+            payloads = {
+                data["id"]: data for data in GameListSerializer(cards, many=True).data
+            }
+
+        # 요청한 순서대로, 없거나 삭제된 게임은 제외
+        return Response(
+            {
+                "results": [
+                    payloads[game_id] for game_id in game_ids if game_id in payloads
+                ]
+            }
+        )
+
+
+class GameSimilarView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        tags=["게임"],
+        summary="유사 게임 api (함께 위시리스트에 담긴 게임 또는 내용이 비슷한 게임)",
+        parameters=[
+            OpenApiParameter(
+                "by",
+                description="wishlist: 함께 담은 사용자 수 순 (기본), "
+                "content: 태그/장르/플랫폼/소개글 유사도 순",
+                enum=["wishlist", "content"],
+            ),
+            OpenApiParameter(
+                "limit", int, description=f"최대 개수 (최대 {SIMILAR_MAX_LIMIT})"
+            ),
+        ],
+        responses=GameListSerializer(many=True),
+    )
+    def get(self, request, pk):
+        try:
+            limit = int(request.query_params.get("limit", SIMILAR_LIMIT))
+        except ValueError:
+            limit = SIMILAR_LIMIT
+        limit = min(max(limit, 1), SIMILAR_MAX_LIMIT)
+
+        # 미리 계산해 둔 상위 limit개 + 카드 조회 (쿼리 2회)
+        if request.query_params.get("by") == "content":
+            game_ids = similar_content_game_ids(pk, limit=limit)
+        else:
+            game_ids = similar_game_ids(pk, limit=limit)
+        # 기준 게임의 카드도 함께 읽어 없거나 삭제된 게임이면 404 (삭제된 게임은 카드가 없음)
+        cards = GameCard.objects.in_bulk([pk, *game_ids])
+        if pk not in cards:
+            raise Http404
+        serializer = GameListSerializer(
+            [cards[game_id] for game_id in game_ids if game_id in cards], many=True
+        )
+
+        return Response({"results": serializer.data})
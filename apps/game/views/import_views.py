@@ -1,31 +1,55 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAdminUser
+from apps.game.models.import_job import ImportJob
+from apps.game.serializers.import_job_serializer import (
+    GameImportRequestSerializer,
+    ImportJobSerializer,
+)
 from apps.game.services.importer import GameImportService
+from apps.game.tasks.import_games import run_game_import
 from drf_spectacular.utils import extend_schema
 
 
-@extend_schema(
-    tags=["게임"],
-    summary="관리자만 사용하는 게임 데이터 추가 api",
-)
 class GameImportView(APIView):
     permission_classes = [IsAdminUser]
 
+    @extend_schema(
+        tags=["게임"],
+        summary="관리자만 사용하는 게임 데이터 추가 api",
+        description="임포트 작업을 Celery 큐에 등록하고 작업 id를 바로 반환합니다.",
+        request=GameImportRequestSerializer,
+        responses={202: ImportJobSerializer},
+    )
     def post(self, request):
-        try:
-            service = GameImportService()
-            count = service.import_games()
-
-            return Response(
-                {
-                    "message": f"{count}개의 새로운 게임이 추가되었습니다.",
-                },
-                status=status.HTTP_200_OK,
-            )
-
-        except Exception as e:
-            return Response(
-                {"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        serializer = GameImportRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        job = GameImportService.create_job(
+            max_pages=serializer.validated_data.get("pages"),
+            chunk_size=serializer.validated_data.get("chunk_size"),
+            refresh=serializer.validated_data["refresh"],
+        )
+        # 작업 행이 커밋되기 전에 워커가 꺼내면 작업을 찾지 못하므로 커밋 후 등록
+        transaction.on_commit(lambda: run_game_import.delay(job.id))
+
+        return Response(
+            ImportJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class GameImportStatusView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=["게임"],
+        summary="게임 데이터 임포트 진행 상황 조회 api",
+        responses=ImportJobSerializer,
+    )
+    def get(self, request, job_id):
+        job = get_object_or_404(ImportJob, pk=job_id)
+        return Response(ImportJobSerializer(job).data)
@@ -1,5 +1,6 @@
 from django.db import transaction
 
+from apps.game.services.recommend_cache import schedule_recommend_refresh
 from apps.preference.models import TagPreference, GenrePreference
 from apps.user.models.user import User
 
@@ -25,3 +26,4 @@ def update_user_total_preferences(user: User, tag_ids: list[int], genre_ids: lis
     from apps.ai.tasks.user_tendency import run_user_tendency_analysis
 
     transaction.on_commit(lambda: run_user_tendency_analysis.delay(user.id))
+    schedule_recommend_refresh(user.id)
@@ -3,9 +3,11 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from apps.core.conditional import conditional_get, get_versions, version_etag
 from apps.game.models import Tag
 from apps.game.models import Genre
 from apps.game.serializers.game_serializer import GenreSerializer, TagSerializer
+from apps.game.services.taxonomy import TAXONOMY_MAX_AGE, TAXONOMY_VERSION_KEY
 from apps.preference.serializers.preference_create import UserPreferenceSerializer
 from apps.preference.serializers.preference_list import UserPreferenceResponseSerializer
 from apps.preference.services.preference_list_service import get_user_total_preferences
@@ -60,6 +62,16 @@ class PreferenceAPIView(APIView):
         )
 
 
+def taxonomy_response(request, name, build):
+    """
+    장르/태그 목록은 임포트 사이에는 바뀌지 않으므로 목록 버전으로 ETag를 만들어 304 응답
+    """
+    version = get_versions([TAXONOMY_VERSION_KEY])[TAXONOMY_VERSION_KEY]
+    return conditional_get(
+        request, version_etag(name, version), build, max_age=TAXONOMY_MAX_AGE
+    )
+
+
 class GenreListAPIView(APIView):
     permission_classes = [AllowAny]
 
@@ -68,9 +80,12 @@ class GenreListAPIView(APIView):
         summary="전체 장르 목록 조회",
     )
     def get(self, request):
-        genres = Genre.objects.all()
-        serializer = GenreSerializer(genres, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        def build():
+            genres = Genre.objects.all()
+            serializer = GenreSerializer(genres, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        return taxonomy_response(request, "genres", build)
 
 
 class TagListAPIView(APIView):
@@ -81,6 +96,9 @@ class TagListAPIView(APIView):
         summary="전체 태그 목록 조회",
     )
     def get(self, request):
-        tags = Tag.objects.all()
-        serializer = TagSerializer(tags, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        def build():
+            tags = Tag.objects.all()
+            serializer = TagSerializer(tags, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        return taxonomy_response(request, "tags", build)
@@ -8,6 +8,7 @@ from pathlib import Path
 import environ  # type: ignore
 import sentry_sdk
 from datetime import timedelta
+from celery.schedules import crontab  # type: ignore
 
 # 1. BASE_DIR 설정
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -20,6 +21,21 @@ environ.Env.read_env(os.path.join(BASE_DIR, ".env"))
 SECRET_KEY = env("SECRET_KEY")
 DEBUG = env("DEBUG")
 RAWG_API_KEY = env("RAWG_API_KEY", default="dummy_api_key_for_ci")
+RAWG_BASE_URL: str = env("RAWG_BASE_URL", default="https://api.rawg.io/api")
+RAWG_FETCH_MAX_WORKERS: int = env.int("RAWG_FETCH_MAX_WORKERS", default=8)
+RAWG_RATE_LIMIT_PER_SECOND: float = env.float("RAWG_RATE_LIMIT_PER_SECOND", default=5.0)
+RAWG_HTTP_POOL_SIZE: int = env.int("RAWG_HTTP_POOL_SIZE", default=10)
+RAWG_HTTP_MAX_RETRIES: int = env.int("RAWG_HTTP_MAX_RETRIES", default=3)
+RAWG_HTTP_BACKOFF_BASE: float = env.float("RAWG_HTTP_BACKOFF_BASE", default=0.5)
+RAWG_HTTP_BACKOFF_MAX: float = env.float("RAWG_HTTP_BACKOFF_MAX", default=30.0)
+RAWG_HTTP_TIMEOUT: float = env.float("RAWG_HTTP_TIMEOUT", default=10.0)
+GAME_TRANSLATION_BACKEND: str = env(
+    "GAME_TRANSLATION_BACKEND",
+    default="apps.game.services.translation.GoogleTranslationBackend",
+)
+GAME_TRANSLATION_BATCH_SIZE: int = env.int("GAME_TRANSLATION_BATCH_SIZE", default=50)
+GAME_TRANSLATION_MAX_WORKERS: int = env.int("GAME_TRANSLATION_MAX_WORKERS", default=4)
+GAME_IMPORT_CHUNK_SIZE: int = env.int("GAME_IMPORT_CHUNK_SIZE", default=20)
 
 REFRESH_COOKIE_SAMESITE = "None"
 REFRESH_COOKIE_SECURE = False if DEBUG else True
@@ -35,6 +51,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -253,6 +270,29 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 
+# 오래 걸리는 게임 임포트는 별도 큐에서 실행 (일반 작업이 밀리지 않도록)
+GAME_IMPORT_QUEUE = "game_import"
+# 유사 게임 재계산 같은 야간 배치도 별도 큐에서 하나씩 실행
+GAME_BATCH_QUEUE = "game_batch"
+CELERY_TASK_ROUTES = {
+    "apps.game.tasks.import_games.run_game_import": {"queue": GAME_IMPORT_QUEUE},
+    "apps.game.tasks.similar.run_similar_games_build": {"queue": GAME_BATCH_QUEUE},
+}
+
+# celery beat 주기 작업 (CELERY_TIMEZONE이 없으면 TIME_ZONE 기준)
+CELERY_BEAT_SCHEDULE = {
+    # 태그/장르/플랫폼/소개글 기반 유사 게임 재계산
+    "nightly-similar-games-build": {
+        "task": "apps.game.tasks.similar.run_similar_games_build",
+        "schedule": crontab(hour=3, minute=30),
+    },
+    # 새 게임/태그 변경을 반영해 모든 사용자의 추천 목록을 다시 계산
+    "nightly-recommend-refresh": {
+        "task": "apps.game.tasks.recommend.run_nightly_recommend_refresh",
+        "schedule": crontab(hour=4, minute=0),
+    },
+}
+
 USE_X_FORWARDED_HOST = True
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
@@ -271,6 +311,8 @@ CSRF_TRUSTED_ORIGINS = [
 
 if "test" in sys.argv:
     DISABLE_AI_SUMMARY_SIGNAL = True
+    # 테스트 중에는 실제 번역 API를 호출하지 않음
+    GAME_TRANSLATION_BACKEND = "apps.game.services.translation.FakeTranslationBackend"
 
 INTERNAL_IPS = [
     "127.0.0.1",
@@ -14,3 +14,12 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# 워커 시작 시 자동완성/패싯 색인, 추천 행렬을 미리 만들어 첫 요청이 기다리지 않게 함
+from apps.game.services.facets import facet_index  # noqa: E402
+from apps.game.services.recommend import recommend_index  # noqa: E402
+from apps.game.services.typeahead import typeahead  # noqa: E402
+
+typeahead.warm()
+facet_index.warm()
+recommend_index.warm()